@@ -0,0 +1,73 @@
+# benchmarks/bench_calc_batch.py
+# Times calc_batch at 10^6 rows and checks it against the scalar calc on a sample.
+#   python -m benchmarks.bench_calc_batch [rows]
+import sys
+import time
+
+import numpy as np
+
+from src.batch import calc_batch
+from src.calc import calc
+from src.models import Inputs
+from src import timing
+
+
+def random_columns(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    cols = dict(
+        span_ft=rng.uniform(4, 20, n),
+        tributary_width_ft=rng.uniform(2, 10, n),
+        beam_b_in=rng.choice([3.5, 5.5, 7.25], n),
+        beam_d_in=rng.choice([5.5, 7.25, 9.25, 11.25], n),
+        post_unsupported_height_in=rng.uniform(72, 144, n),
+        post_base_bearing_area_in2=rng.uniform(12, 36, n),
+        Fb_prime=rng.uniform(600, 1500, n),
+        Fv_prime=rng.uniform(120, 180, n),
+        Fc_perp_prime=rng.uniform(350, 625, n),
+        E=rng.uniform(1.0e6, 1.7e6, n),
+        DL_psf=rng.uniform(3, 15, n),
+        SL_psf=rng.uniform(20, 60, n),
+        LL_psf=rng.uniform(0, 20, n),
+        deflection_limit_ratio=rng.choice([180.0, 240.0, 360.0], n),
+        Fc_axis_prime=np.where(rng.random(n) < 0.5, rng.uniform(700, 1400, n), np.nan),
+        post_section_b_in=rng.choice([3.5, 5.5], n),
+        post_section_d_in=rng.choice([3.5, 5.5], n),
+        has_knee_braces=rng.random(n) < 0.5,
+        has_moment_top_connector=rng.random(n) < 0.5,
+        has_hold_downs_or_shear_base=rng.random(n) < 0.5,
+    )
+    return cols
+
+
+def check_against_scalar(cols, res, sample: int = 2000) -> int:
+    mismatches = 0
+    for i in range(min(sample, len(res))):
+        kw = {k: (v[i].item() if not (k == "Fc_axis_prime" and np.isnan(v[i])) else None) for k, v in cols.items()}
+        ref = calc(Inputs(**kw), log=False)
+        got = res.result(i)
+        if ref != got:
+            mismatches += 1
+    return mismatches
+
+
+def main(n: int = 1_000_000):
+    timing.set_enabled(False)       # keep the benchmark out of run_log.txt
+    cols = random_columns(n)
+    t0 = time.perf_counter()
+    res = calc_batch(**cols)
+    t_batch = time.perf_counter() - t0
+
+    sample = 2000
+    t0 = time.perf_counter()
+    mismatches = check_against_scalar(cols, res, sample)
+    t_scalar = (time.perf_counter() - t0) / sample
+
+    print(f"calc_batch: {n:,} rows in {t_batch:.3f} s ({t_batch / n * 1e9:.0f} ns/row)")
+    print(f"scalar calc: {t_scalar * 1e6:.1f} µs/row -> {t_scalar * n:.1f} s for {n:,} rows "
+          f"(speed-up ×{t_scalar * n / t_batch:.0f})")
+    print(f"mismatches vs scalar on {sample} rows: {mismatches}")
+    return mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000) else 0)
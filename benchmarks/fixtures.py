@@ -0,0 +1,78 @@
+# benchmarks/fixtures.py
+# Synthetic Inputs, connector catalogs and workbooks for the benchmark suite.
+import random
+from dataclasses import fields
+from typing import List, Tuple
+
+from src.models import Inputs
+from src.connectors import ConnectorSpecTop, ConnectorSpecBase
+from src.io_common import LABELS
+
+
+def synthetic_inputs(n: int, seed: int = 0) -> List[Inputs]:
+    """Plausible deck designs: every field populated, about half with a column check / given footing."""
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        column = rnd.random() < 0.5
+        sized = rnd.random() < 0.5
+        out.append(Inputs(
+            span_ft=rnd.uniform(4, 20), tributary_width_ft=rnd.uniform(2, 10),
+            beam_b_in=rnd.choice([3.5, 5.5, 7.25]), beam_d_in=rnd.choice([5.5, 7.25, 9.25, 11.25]),
+            post_unsupported_height_in=rnd.uniform(72, 144), post_base_bearing_area_in2=rnd.uniform(12, 36),
+            Fb_prime=rnd.uniform(600, 1500), Fv_prime=rnd.uniform(120, 180),
+            Fc_perp_prime=rnd.uniform(350, 625), E=rnd.uniform(1.0e6, 1.7e6),
+            DL_psf=rnd.uniform(3, 15), SL_psf=rnd.uniform(20, 60), LL_psf=rnd.uniform(0, 20),
+            deflection_limit_ratio=rnd.choice([180.0, 240.0, 360.0]),
+            Fc_axis_prime=rnd.uniform(700, 1400) if column else None,
+            post_section_b_in=rnd.choice([3.5, 5.5]) if column else None,
+            post_section_d_in=rnd.choice([3.5, 5.5]) if column else None,
+            has_knee_braces=rnd.random() < 0.5, has_moment_top_connector=rnd.random() < 0.5,
+            has_hold_downs_or_shear_base=rnd.random() < 0.5,
+            roof_uplift_psf=rnd.uniform(0, 30), uplift_area_per_post_ft2=rnd.uniform(20, 120),
+            lateral_line_load_plf=rnd.uniform(20, 120) if rnd.random() < 0.5 else None,
+            wind_wall_psf=rnd.uniform(10, 30), exposed_height_ft=rnd.uniform(6, 12),
+            post_to_beam_arm_in=rnd.uniform(0, 6),
+            soil_bearing_capacity_psf=rnd.choice([1500.0, 2000.0, 3000.0]), soil_unit_weight_pcf=120.0,
+            concrete_unit_weight_pcf=150.0, base_friction_coeff_mu=0.45, SF_bearing=1.0,
+            SF_sliding=1.5, SF_uplift=1.5, credit_connector_uplift_lb=0.0,
+            include_soil_overburden=rnd.random() < 0.5,
+            footing_length_in=rnd.choice([18.0, 24.0, 30.0]) if sized else None,
+            footing_width_in=rnd.choice([18.0, 24.0, 30.0]) if sized else None,
+            footing_thickness_in=rnd.choice([10.0, 12.0]) if sized else None,
+            footing_depth_below_grade_in=rnd.uniform(12, 36), post_self_weight_lb=rnd.uniform(20, 80),
+        ))
+    return out
+
+
+def synthetic_catalog(n: int, seed: int = 0) -> Tuple[List[ConnectorSpecTop], List[ConnectorSpecBase]]:
+    """n top and n base connectors with realistic capacity ranges (some without a moment rating)."""
+    rnd = random.Random(seed)
+    tops = [ConnectorSpecTop(f"T{i:05d}", rnd.uniform(500, 8000), rnd.uniform(200, 4000), rnd.uniform(100, 2500),
+                             rnd.uniform(0, 20000) if rnd.random() < 0.3 else 0.0) for i in range(n)]
+    bases = [ConnectorSpecBase(f"B{i:05d}", rnd.uniform(200, 4000), rnd.uniform(200, 6000)) for i in range(n)]
+    return tops, bases
+
+
+def build_workbook(path: str, inputs: Inputs, tops: List[ConnectorSpecTop], bases: List[ConnectorSpecBase]) -> str:
+    """Workbook with the template's Inputs / Connectors / Results layout, readable by both backends."""
+    import openpyxl         # only the workbook builder needs it; synthetic inputs/catalogs do not
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Inputs"
+    ws.append(["Input", "Value"])
+    values = {f.name: getattr(inputs, f.name) for f in fields(Inputs)}
+    for label in LABELS:
+        v = values[label]
+        ws.append([label, ("Yes" if v else "No") if isinstance(v, bool) else v])
+    ws = wb.create_sheet("Connectors")
+    ws.append(["type", "model", "allowable_download_lb", "allowable_uplift_lb",
+               "allowable_lateral_lb", "allowable_moment_lb_in"])
+    for t in tops:
+        ws.append(["top", t.model, t.allowable_download_lb, t.allowable_uplift_lb,
+                   t.allowable_lateral_lb, t.allowable_moment_lb_in])
+    for b in bases:
+        ws.append(["base", b.model, b.allowable_shear_lb, b.allowable_uplift_lb])
+    wb.create_sheet("Results")
+    wb.save(path)
+    return path
@@ -0,0 +1,194 @@
+# benchmarks/suite.py
+# Timing suite for the calc core, connector selection, footing checks and the I/O backends.
+# Results are written as JSON; pass a previous run as --baseline to flag slowdowns.
+#
+#   python -m benchmarks.suite --out bench.json
+#   python -m benchmarks.suite --baseline bench.json --out bench_new.json   # exit 1 on regression
+#   python -m benchmarks.suite -k connectors --quick
+#
+# The io_xlwings cases run only where xlwings can start Excel; elsewhere they are reported as skipped.
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import tempfile
+import statistics
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.calc import calc
+from src.batch import calc_batch
+from src.cache import CODE_VERSION
+from src.report import results_grid
+from src.footing import footing_checks
+from src.connectors import ConnectorCatalog, compute_connection_demands, select_or_verify_connectors
+from src import io_openpyxl, timing
+
+from .fixtures import synthetic_inputs, synthetic_catalog, build_workbook
+from .bench_calc_batch import random_columns
+
+CATALOG_SIZES = (10, 100, 1000, 10000)
+DEFAULT_TOLERANCE = 0.25        # flag a case when its median is more than 25% above the baseline
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> Dict[str, float]:
+    """Per-call seconds: calls per sample picked like timeit's autorange, then `repeat` samples."""
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        t = timer.timeit(number)
+        if t >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if t < min_time / 10 else 2
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {"number": number, "repeat": repeat, "best_s": min(samples), "median_s": statistics.median(samples)}
+
+
+def _excel_available() -> bool:
+    try:
+        import xlwings as xw
+        app = xw.App(visible=False, add_book=False)
+    except Exception:
+        return False
+    app.quit()
+    return True
+
+
+def cases(tmpdir: str) -> List[Tuple[str, Optional[Callable[[], object]]]]:
+    """(name, zero-arg callable) pairs; callable None = skipped on this machine."""
+    inp = synthetic_inputs(1, seed=1)[0]
+    res = calc(inp)
+    fchk = footing_checks(inp, res)
+    dem = compute_connection_demands(inp, res)
+    out: List[Tuple[str, Optional[Callable[[], object]]]] = [
+        ("calc", lambda: calc(inp)),
+        ("calc[log=False]", lambda: calc(inp, log=False)),
+        ("footing_checks", lambda: footing_checks(inp, res)),
+        ("footing_checks[log=False]", lambda: footing_checks(inp, res, log=False)),
+        ("log_format[calc]", lambda: res.calc_log.lines()),
+        ("log_format[footing]", lambda: fchk.calc_log.lines()),
+    ]
+    for n in CATALOG_SIZES:
+        tops, bases = synthetic_catalog(n, seed=n)
+        cat = ConnectorCatalog(tops, bases)
+        out.append((f"select_or_verify_connectors[n={n}]",
+                    lambda t=tops, b=bases: select_or_verify_connectors(inp, dem, t, b)))
+        out.append((f"select_or_verify_connectors[n={n},prebuilt]",
+                    lambda t=tops, b=bases, c=cat: select_or_verify_connectors(inp, dem, t, b, catalog=c)))
+    sel = select_or_verify_connectors(inp, dem, *synthetic_catalog(10))
+    out.append(("results_grid", lambda: results_grid(res, sel, fchk)))
+    grid = results_grid(res, sel, fchk)
+
+    cols = random_columns(100_000)
+    out.append(("calc_batch[rows=100000]", lambda: calc_batch(**cols)))
+
+    # I/O on a synthetic workbook with a 1000-entry connector table
+    wb_path = build_workbook(os.path.join(tmpdir, "bench.xlsx"), inp, *synthetic_catalog(1000, seed=7))
+
+    def openpyxl_read_cold():
+        io_openpyxl._ROWS.clear()
+        io_openpyxl.read_inputs(wb_path)
+        io_openpyxl.read_connectors(wb_path)
+
+    def openpyxl_write():
+        io_openpyxl.write_results_grid(wb_path, grid)
+        io_openpyxl.save_book(wb_path)
+
+    out += [
+        ("io_openpyxl.read[cold]", openpyxl_read_cold),
+        ("io_openpyxl.read[warm]", lambda: (io_openpyxl.read_inputs(wb_path), io_openpyxl.read_connectors(wb_path))),
+        ("io_openpyxl.write_results_grid+save", openpyxl_write),
+    ]
+
+    xl = None
+    if _excel_available():
+        from src import io_xlwings as xl
+    out += [
+        ("io_xlwings.read_inputs", (lambda: xl.read_inputs(wb_path)) if xl else None),
+        ("io_xlwings.read_connectors", (lambda: xl.read_connectors(wb_path)) if xl else None),
+        ("io_xlwings.write_results_grid", (lambda: xl.write_results_grid(wb_path, grid)) if xl else None),
+        ("io_xlwings.write_results_grid[diff]",
+         (lambda: xl.write_results_grid(wb_path, grid, previous=grid)) if xl else None),
+    ]
+    return out
+
+
+def run_suite(selected: Optional[str] = None, repeat: int = 5, min_time: float = 0.2, progress: bool = True) -> Dict:
+    results: Dict[str, Dict] = {}
+    # Timed I/O calls would append every call to run_log.txt and time that file write too
+    was_timing = timing.enabled()
+    timing.set_enabled(False)
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, fn in cases(tmpdir):
+                if selected and selected not in name:
+                    continue
+                if fn is None:
+                    results[name] = {"skipped": True}
+                else:
+                    results[name] = measure(fn, repeat, min_time)
+                if progress:
+                    r = results[name]
+                    msg = "skipped" if r.get("skipped") else f"{r['median_s'] * 1e6:12.1f} µs"
+                    print(f"{name:<48} {msg}", file=sys.stderr, flush=True)
+    finally:
+        timing.set_enabled(was_timing)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "code_version": CODE_VERSION,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float = DEFAULT_TOLERANCE) -> List[Tuple[str, float, float, float]]:
+    """Cases whose median got slower than baseline × (1 + tolerance): (name, base_s, cur_s, ratio)."""
+    slower = []
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or base.get("skipped") or cur.get("skipped"):
+            continue
+        ratio = cur["median_s"] / base["median_s"]
+        if ratio > 1.0 + tolerance:
+            slower.append((name, base["median_s"], cur["median_s"], ratio))
+    return slower
+
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the deck screening calc core and I/O paths.")
+    ap.add_argument("--out", default="bench.json", help="where to write this run's results (JSON)")
+    ap.add_argument("--baseline", default=None, help="earlier results JSON to compare against")
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="allowed slowdown before a case is flagged (0.25 = 25%%)")
+    ap.add_argument("-k", dest="selected", default=None, help="only cases whose name contains this text")
+    ap.add_argument("--quick", action="store_true", help="3 short samples per case (noisier)")
+    args = ap.parse_args(argv)
+
+    report = run_suite(args.selected, repeat=3 if args.quick else 5, min_time=0.05 if args.quick else 0.2)
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+    slower = compare(report, baseline, args.tolerance)
+    for name, b, c, ratio in slower:
+        print(f"SLOWER  {name:<48} {b * 1e6:10.1f} -> {c * 1e6:10.1f} µs  (×{ratio:.2f})", file=sys.stderr)
+    if not slower:
+        print(f"no case slower than baseline by more than {args.tolerance:.0%}", file=sys.stderr)
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,199 @@
+# src/batch.py
+# Vectorized version of calc.calc: one array element per design, no per-row Python.
+# Every expression mirrors calc.calc operation-for-operation so results match bit for bit.
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .models import Inputs, Results
+from .calclog import NullLog
+
+# Inputs fields consumed by calc_batch (the beam / post / lateral-flag part of Inputs)
+BATCH_FIELDS = [
+    "span_ft", "tributary_width_ft", "beam_b_in", "beam_d_in",
+    "post_unsupported_height_in", "post_base_bearing_area_in2",
+    "Fb_prime", "Fv_prime", "Fc_perp_prime", "E",
+    "DL_psf", "SL_psf", "LL_psf", "deflection_limit_ratio",
+    "Fc_axis_prime", "post_section_b_in", "post_section_d_in",
+    "has_knee_braces", "has_moment_top_connector", "has_hold_downs_or_shear_base",
+]
+_FLAG_FIELDS = ("has_knee_braces", "has_moment_top_connector", "has_hold_downs_or_shear_base")
+
+
+@dataclass
+class BatchResults:
+    # Beam
+    line_load_plf: np.ndarray
+    max_moment_lb_in: np.ndarray
+    max_shear_lb: np.ndarray
+    bending_stress_psi: np.ndarray
+    shear_stress_psi: np.ndarray
+    bearing_stress_psi: np.ndarray
+    deflection_in: np.ndarray
+    deflection_limit_in: np.ndarray
+    reaction_per_post_lb: np.ndarray
+    bending_ok: np.ndarray
+    shear_ok: np.ndarray
+    bearing_ok: np.ndarray
+    deflection_ok: np.ndarray
+    # Column (False / NaN where column_checked is False)
+    column_checked: np.ndarray
+    column_axial_ok: np.ndarray
+    column_allowable_axial_lb: np.ndarray
+    column_slenderness: np.ndarray
+    column_Pcrit_lb: np.ndarray
+    # Lateral
+    lateral_warnings: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.line_load_plf)
+
+    def result(self, i: int) -> Results:
+        """Scalar Results for row i (no calc log)."""
+        checked = bool(self.column_checked[i])
+        return Results(
+            line_load_plf=float(self.line_load_plf[i]),
+            max_moment_lb_in=float(self.max_moment_lb_in[i]),
+            max_shear_lb=float(self.max_shear_lb[i]),
+            bending_stress_psi=float(self.bending_stress_psi[i]),
+            shear_stress_psi=float(self.shear_stress_psi[i]),
+            bearing_stress_psi=float(self.bearing_stress_psi[i]),
+            deflection_in=float(self.deflection_in[i]),
+            deflection_limit_in=float(self.deflection_limit_in[i]),
+            reaction_per_post_lb=float(self.reaction_per_post_lb[i]),
+            bending_ok=bool(self.bending_ok[i]),
+            shear_ok=bool(self.shear_ok[i]),
+            bearing_ok=bool(self.bearing_ok[i]),
+            deflection_ok=bool(self.deflection_ok[i]),
+            column_axial_ok=bool(self.column_axial_ok[i]) if checked else None,
+            column_allowable_axial_lb=float(self.column_allowable_axial_lb[i]) if checked else None,
+            lateral_warnings={k: bool(v[i]) for k, v in self.lateral_warnings.items()},
+            calc_log=NullLog(),
+        )
+
+
+def _f64(v) -> np.ndarray:
+    # None -> NaN so optional columns can be passed as lists with gaps
+    if isinstance(v, np.ndarray) and v.dtype != object:
+        return v.astype(np.float64, copy=False)
+    if isinstance(v, (list, tuple)):
+        v = [np.nan if x is None else x for x in v]
+    elif v is None:
+        v = np.nan
+    return np.asarray(v, dtype=np.float64)
+
+
+def calc_batch(span_ft, tributary_width_ft, beam_b_in, beam_d_in,
+               post_unsupported_height_in, post_base_bearing_area_in2,
+               Fb_prime, Fv_prime, Fc_perp_prime, E,
+               DL_psf, SL_psf, LL_psf=0.0, deflection_limit_ratio=240,
+               Fc_axis_prime=None, post_section_b_in=None, post_section_d_in=None,
+               has_knee_braces=False, has_moment_top_connector=False,
+               has_hold_downs_or_shear_base=False) -> BatchResults:
+    """
+    Array version of calc.calc. Every argument is a scalar or a 1-D array (one element per
+    design); they are broadcast together. Optional column inputs use None/NaN/0 for "not given",
+    exactly like the truthiness test in calc.calc.
+    """
+    span_ft, trib = _f64(span_ft), _f64(tributary_width_ft)
+    b, d = _f64(beam_b_in), _f64(beam_d_in)
+    Le, A_bear = _f64(post_unsupported_height_in), _f64(post_base_bearing_area_in2)
+    Fb, Fv, Fc_perp, E = _f64(Fb_prime), _f64(Fv_prime), _f64(Fc_perp_prime), _f64(E)
+    DL, SL, LL, ratio = _f64(DL_psf), _f64(SL_psf), _f64(LL_psf), _f64(deflection_limit_ratio)
+    Fc_axis, pb, pd = _f64(Fc_axis_prime), _f64(post_section_b_in), _f64(post_section_d_in)
+
+    q_psf = DL + SL + LL
+    w_plf = q_psf * trib
+    w_lbin = w_plf / 12.0
+    L_in = span_ft * 12.0
+
+    S = b * (d * d) / 6.0
+    I = b * (d * d * d) / 12.0
+
+    L2_in = L_in * L_in
+    M_max = w_lbin * L2_in / 8.0
+    V_max = w_plf * span_ft / 2.0
+
+    fb = M_max / S
+    fv = 1.5 * V_max / (b * d)
+
+    R = V_max
+    f_bearing = R / np.maximum(A_bear, 1e-6)
+
+    delta = 5 * w_lbin * (L2_in * L2_in) / (384.0 * E * I)
+    delta_limit = L_in / ratio
+
+    bending_ok = fb <= Fb
+    shear_ok = fv <= Fv
+    bearing_ok = f_bearing <= Fc_perp
+    deflection_ok = delta <= delta_limit
+
+    # Column: same truthiness test as calc (None/NaN/0 -> skipped)
+    def _given(x):
+        return ~np.isnan(x) & (x != 0)
+
+    checked = _given(Fc_axis) & _given(pb) & _given(pd)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        A = pb * pd
+        Icol = pb * (pd * pd * pd) / 12.0
+        r = np.sqrt(Icol / A)
+        slender = Le / np.maximum(r, 1e-6)
+        Pcrit = (math.pi**2) * E * A / (slender * slender + 1e-6)
+        axial_allow = np.minimum(Fc_axis * A, 0.3 * Pcrit)
+        column_ok = R <= axial_allow
+
+    n = np.broadcast(span_ft, trib, b, d, Le, A_bear, Fb, Fv, Fc_perp, E, DL, SL, LL, ratio,
+                     Fc_axis, pb, pd).shape
+    full = lambda x: np.broadcast_to(x, n)
+    checked = full(checked)
+    nan = np.full(n, np.nan)
+
+    knee = full(np.asarray(has_knee_braces, dtype=bool))
+    moment_top = full(np.asarray(has_moment_top_connector, dtype=bool))
+    hold_down = full(np.asarray(has_hold_downs_or_shear_base, dtype=bool))
+    lateral_flags = {
+        "needs_top_moment_or_bracing": ~(knee | moment_top),
+        "needs_base_anchorage": ~hold_down,
+        "span_long_for_depth_watch_deflection": ~full(deflection_ok),
+    }
+
+    return BatchResults(
+        line_load_plf=full(w_plf),
+        max_moment_lb_in=full(M_max),
+        max_shear_lb=full(V_max),
+        bending_stress_psi=full(fb),
+        shear_stress_psi=full(fv),
+        bearing_stress_psi=full(f_bearing),
+        deflection_in=full(delta),
+        deflection_limit_in=full(delta_limit),
+        reaction_per_post_lb=full(R),
+        bending_ok=full(bending_ok),
+        shear_ok=full(shear_ok),
+        bearing_ok=full(bearing_ok),
+        deflection_ok=full(deflection_ok),
+        column_checked=checked,
+        column_axial_ok=checked & full(column_ok),
+        column_allowable_axial_lb=np.where(checked, full(axial_allow), nan),
+        column_slenderness=np.where(checked, full(slender), nan),
+        column_Pcrit_lb=np.where(checked, full(Pcrit), nan),
+        lateral_warnings=lateral_flags,
+    )
+
+
+def inputs_to_columns(inputs_list: Sequence[Inputs], names: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """Transpose a list of Inputs into one array per field (floats -> float64 with NaN for None)."""
+    names = names or BATCH_FIELDS
+    cols = {}
+    for name in names:
+        vals = [getattr(i, name) for i in inputs_list]
+        if name in _FLAG_FIELDS:
+            cols[name] = np.array(vals, dtype=bool)
+        else:
+            cols[name] = _f64(vals)
+    return cols
+
+
+def calc_inputs_batch(inputs_list: Sequence[Inputs]) -> BatchResults:
+    return calc_batch(**inputs_to_columns(inputs_list))
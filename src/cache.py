@@ -0,0 +1,140 @@
+# src/cache.py
+# Content-addressed memoization for calc / connector selection / footing checks.
+#
+# Keys are SHA-256 digests of the Inputs fields (and connector catalog contents) plus
+# CODE_VERSION, a digest of the calc-core source files, so entries die with a code change.
+# Entries live in an in-process LRU and, optionally, in an on-disk store that survives the
+# one-process-per-click shell macro (set DECK_CACHE_DIR or pass --cache-dir to main). The disk
+# store is <dir>/deck_cache/<CODE_VERSION>/; nothing else under <dir> is ever touched.
+import os
+import json
+import pickle
+import shutil
+import hashlib
+import tempfile
+from collections import OrderedDict
+from dataclasses import is_dataclass, asdict
+from typing import Any, Callable, Optional, Sequence
+
+_CORE_MODULES = ("models.py", "calclog.py", "calc.py", "connectors.py", "footing.py", "report.py", "cache.py", "graph.py")
+_MISS = object()
+_SUBDIR = "deck_cache"
+_MARKER = ".deck_cache"          # written into every version directory this module creates
+
+def source_version(modules: Sequence[str], salt: str = "") -> str:
+    """16-hex digest of salt plus the source of the given src/ modules (file names)."""
+    h = hashlib.sha256(salt.encode())
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in modules:
+        with open(os.path.join(here, name), "rb") as fh:
+            h.update(name.encode() + b"\0" + fh.read())
+    return h.hexdigest()[:16]
+
+CODE_VERSION = source_version(_CORE_MODULES)
+
+def _canonical(obj: Any):
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {type(obj).__name__: _canonical(asdict(obj))}
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in sorted(obj.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, float):
+        return repr(obj)            # exact: 0.1 and 0.1000000001 must not collide
+    return obj
+
+def stable_hash(*parts: Any) -> str:
+    """Digest of dataclasses / dicts / lists / scalars that is stable across processes and runs."""
+    payload = json.dumps([CODE_VERSION] + [_canonical(p) for p in parts], sort_keys=True,
+                         separators=(",", ":"), default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """LRU cache with an optional pickle store under disk_dir/deck_cache/<CODE_VERSION>/."""
+    def __init__(self, maxsize: int = 256, disk_dir: Optional[str] = None):
+        self.maxsize = maxsize
+        self._mem: "OrderedDict[str, Any]" = OrderedDict()
+        self.hits = self.misses = 0
+        self.disk_dir = None
+        if disk_dir:
+            root = os.path.join(disk_dir, _SUBDIR)
+            self.disk_dir = os.path.join(root, CODE_VERSION)
+            self._make_dir()
+            self._prune_stale(root)
+
+    def _make_dir(self):
+        os.makedirs(self.disk_dir, exist_ok=True)
+        open(os.path.join(self.disk_dir, _MARKER), "a").close()
+
+    @staticmethod
+    def _prune_stale(root: str):
+        # Entries written by other code versions can never hit again. Only directories this class
+        # created are removed: a hex CODE_VERSION-length name holding the marker file.
+        for name in os.listdir(root):
+            path = os.path.join(root, name)
+            if (name != CODE_VERSION and len(name) == len(CODE_VERSION)
+                    and all(c in "0123456789abcdef" for c in name)
+                    and os.path.isfile(os.path.join(path, _MARKER))):
+                shutil.rmtree(path, ignore_errors=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], key + ".pkl")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._mem:
+            self._mem.move_to_end(key)
+            self.hits += 1
+            return self._mem[key]
+        if self.disk_dir:
+            try:
+                with open(self._path(key), "rb") as fh:
+                    value = pickle.load(fh)
+            except Exception:
+                pass        # missing or unreadable (truncated, corrupt, stale class): a miss; put() rewrites it
+            else:
+                self._remember(key, value)
+                self.hits += 1
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value: Any):
+        self._remember(key, value)
+        if self.disk_dir:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)       # atomic: concurrent readers never see half a file
+            except OSError:
+                if os.path.exists(tmp): os.remove(tmp)
+
+    def _remember(self, key: str, value: Any):
+        self._mem[key] = value
+        self._mem.move_to_end(key)
+        while len(self._mem) > self.maxsize:
+            self._mem.popitem(last=False)
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISS)
+        if value is _MISS:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        self._mem.clear()
+        if self.disk_dir:
+            shutil.rmtree(self.disk_dir, ignore_errors=True)
+            self._make_dir()
+
+_DEFAULT: Optional[ResultCache] = None
+
+def default_cache() -> ResultCache:
+    """Process-wide cache; adds the disk store when DECK_CACHE_DIR is set."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = ResultCache(disk_dir=os.environ.get("DECK_CACHE_DIR") or None)
+    return _DEFAULT
@@ -1,68 +1,78 @@
 import math
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 from .models import Inputs, Results
+from .calclog import CalcLog, NullLog
 
 def pf(flag: bool) -> str:
     return "PASS" if flag else "CHECK"
 
-def calc(inputs: Inputs) -> Results:
-    log = []
+def calc(inputs: Inputs, log: bool = True) -> Results:
+    # log=False skips recording the calc log (sweeps/optimizers); all numbers and flags are the same
+    lg = CalcLog() if log else NullLog()
 
     q_psf = inputs.DL_psf + inputs.SL_psf + inputs.LL_psf
-    log.append(f"q = DL + SL + LL = {inputs.DL_psf} + {inputs.SL_psf} + {inputs.LL_psf} = {q_psf:.3f} psf")
+    lg.add("q = DL + SL + LL = {} + {} + {} = {:.3f} psf", inputs.DL_psf, inputs.SL_psf, inputs.LL_psf, q_psf)
 
     w_plf = q_psf * inputs.tributary_width_ft
-    log.append(f"w = q × tributary_width = {q_psf:.3f} × {inputs.tributary_width_ft:.3f} = {w_plf:.3f} plf")
+    lg.add("w = q × tributary_width = {:.3f} × {:.3f} = {:.3f} plf", q_psf, inputs.tributary_width_ft, w_plf)
 
     w_lbin = w_plf / 12.0
     L_in = inputs.span_ft * 12.0
     b, d = inputs.beam_b_in, inputs.beam_d_in
 
-    S = b * d**2 / 6.0
-    I = b * d**3 / 12.0
-    log.append(f"S = b d² / 6 = {b:.3f}×{d:.3f}²/6 = {S:.3f} in³")
-    log.append(f"I = b d³ / 12 = {b:.3f}×{d:.3f}³/12 = {I:.3f} in⁴")
+    # Powers are written as products (and sqrt) so calc_batch can reproduce them bit for bit
+    S = b * (d * d) / 6.0
+    I = b * (d * d * d) / 12.0
+    lg.add("S = b d² / 6 = {:.3f}×{:.3f}²/6 = {:.3f} in³", b, d, S)
+    lg.add("I = b d³ / 12 = {:.3f}×{:.3f}³/12 = {:.3f} in⁴", b, d, I)
 
-    M_max = w_lbin * L_in**2 / 8.0
+    L2_in = L_in * L_in
+    M_max = w_lbin * L2_in / 8.0
     V_max = w_plf * inputs.span_ft / 2.0
-    log.append(f"Mmax = w L² / 8 = {w_lbin:.3f} × {L_in:.1f}² / 8 = {M_max:.1f} lb·in")
-    log.append(f"Vmax = w_plf × L / 2 = {w_plf:.3f} × {inputs.span_ft:.3f} / 2 = {V_max:.1f} lb")
+    lg.add("Mmax = w L² / 8 = {:.3f} × {:.1f}² / 8 = {:.1f} lb·in", w_lbin, L_in, M_max)
+    lg.add("Vmax = w_plf × L / 2 = {:.3f} × {:.3f} / 2 = {:.1f} lb", w_plf, inputs.span_ft, V_max)
 
     fb = M_max / S
     fv = 1.5 * V_max / (b * d)
-    log.append(f"fb = M/S = {M_max:.1f}/{S:.3f} = {fb:.1f} psi  (Fb'={inputs.Fb_prime:.0f})")
-    log.append(f"fv = 1.5V/(bd) = 1.5×{V_max:.1f}/({b:.3f}×{d:.3f}) = {fv:.1f} psi  (Fv'={inputs.Fv_prime:.0f})")
+    lg.add("fb = M/S = {:.1f}/{:.3f} = {:.1f} psi  (Fb'={:.0f})", M_max, S, fb, inputs.Fb_prime)
+    lg.add("fv = 1.5V/(bd) = 1.5×{:.1f}/({:.3f}×{:.3f}) = {:.1f} psi  (Fv'={:.0f})", V_max, b, d, fv, inputs.Fv_prime)
 
     R = V_max
     f_bearing = R / max(inputs.post_base_bearing_area_in2, 1e-6)
-    log.append(f"bearing = R/A = {R:.1f}/{inputs.post_base_bearing_area_in2:.3f} = {f_bearing:.1f} psi  (Fc⊥'={inputs.Fc_perp_prime:.0f})")
+    lg.add("bearing = R/A = {:.1f}/{:.3f} = {:.1f} psi  (Fc⊥'={:.0f})", R, inputs.post_base_bearing_area_in2, f_bearing, inputs.Fc_perp_prime)
 
-    delta = 5 * w_lbin * L_in**4 / (384.0 * inputs.E * I)
+    delta = 5 * w_lbin * (L2_in * L2_in) / (384.0 * inputs.E * I)
     delta_limit = L_in / inputs.deflection_limit_ratio
-    log.append(f"Δ = 5 w L⁴/(384 E I) = {delta:.3f} in  (limit L/{inputs.deflection_limit_ratio:.0f} = {delta_limit:.3f} in)")
+    lg.add("Δ = 5 w L⁴/(384 E I) = {:.3f} in  (limit L/{:.0f} = {:.3f} in)", delta, inputs.deflection_limit_ratio, delta_limit)
 
     bending_ok = fb <= inputs.Fb_prime
     shear_ok = fv <= inputs.Fv_prime
     bearing_ok = f_bearing <= inputs.Fc_perp_prime
     deflection_ok = delta <= delta_limit
-    log += [f"Bending:   {pf(bending_ok)}", f"Shear:     {pf(shear_ok)}", f"Bearing:   {pf(bearing_ok)}", f"Deflection:{pf(deflection_ok)}"]
+    lg.add("Bending:   {}", pf(bending_ok))
+    lg.add("Shear:     {}", pf(shear_ok))
+    lg.add("Bearing:   {}", pf(bearing_ok))
+    lg.add("Deflection:{}", pf(deflection_ok))
 
     # Column (simplified axial capacity with slenderness knockdown)
     column_ok = None
     col_allow_lb = None
     if inputs.Fc_axis_prime and inputs.post_section_b_in and inputs.post_section_d_in:
         A = inputs.post_section_b_in * inputs.post_section_d_in
-        Icol = inputs.post_section_b_in * inputs.post_section_d_in**3 / 12.0
-        r = (Icol / A) ** 0.5
+        pd = inputs.post_section_d_in
+        Icol = inputs.post_section_b_in * (pd * pd * pd) / 12.0
+        r = math.sqrt(Icol / A)
         Le = inputs.post_unsupported_height_in
         slender = Le / max(r, 1e-6)
-        Pcrit = (math.pi**2) * inputs.E * A / (slender**2 + 1e-6)
+        Pcrit = (math.pi**2) * inputs.E * A / (slender * slender + 1e-6)
         axial_allow = min(inputs.Fc_axis_prime * A, 0.3 * Pcrit)
         col_allow_lb = axial_allow
         column_ok = (R <= axial_allow)
-        log.append(f"Column: A={A:.2f} in², r={r:.3f} in, Le={Le:.1f} in, (Le/r)={slender:.1f}")
-        log.append(f"Pcrit≈{Pcrit:,.0f} lb; Allowable axial≈min(Fc'×A,0.3Pcrit)={axial_allow:,.0f} lb -> {pf(column_ok)}")
+        lg.add("Column: A={:.2f} in², r={:.3f} in, Le={:.1f} in, (Le/r)={:.1f}", A, r, Le, slender)
+        lg.add("Pcrit≈{:,.0f} lb; Allowable axial≈min(Fc'×A,0.3Pcrit)={:,.0f} lb -> {}", Pcrit, axial_allow, pf(column_ok))
     else:
-        log.append("Column check skipped (provide Fc_axis_prime & post section).")
+        lg.add("Column check skipped (provide Fc_axis_prime & post section).")
 
     lateral_flags = {
         "needs_top_moment_or_bracing": not (inputs.has_knee_braces or inputs.has_moment_top_connector),
@@ -70,7 +80,7 @@ def calc(inputs: Inputs) -> Results:
         "span_long_for_depth_watch_deflection": (not deflection_ok),
     }
     for k, v in lateral_flags.items():
-        log.append(f"Lateral '{k}': {'ATTENTION' if v else 'OK'}")
+        lg.add("Lateral '{}': {}", k, 'ATTENTION' if v else 'OK')
 
     return Results(
         line_load_plf=w_plf,
@@ -89,5 +99,59 @@ def calc(inputs: Inputs) -> Results:
         column_axial_ok=column_ok,
         column_allowable_axial_lb=col_allow_lb,
         lateral_warnings=lateral_flags,
-        calc_log=log
+        calc_log=lg
     )
+
+
+# ---------------- Fast screening (no log, utilizations + flags only) ----------------
+
+@dataclass
+class Screening:
+    ok: bool
+    utilization: Dict[str, float] = field(default_factory=dict)   # demand / capacity per evaluated check
+    flags: Dict[str, bool] = field(default_factory=dict)          # same comparisons as calc
+    failed: Optional[str] = None                                  # first failing check, if any
+
+def screen(inputs: Inputs, stop_at_first_fail: bool = True) -> Screening:
+    """
+    Beam/column pass-fail for sweeps and optimizers. Checks run cheapest first
+    (bearing, shear, bending, deflection, column); with stop_at_first_fail the rest are skipped
+    once one fails. Arithmetic and comparisons are the same as calc, so flags always agree.
+    """
+    s = Screening(ok=True)
+
+    def check(name, demand, capacity, ok):
+        s.utilization[name] = demand / capacity if capacity else math.inf
+        s.flags[name] = ok
+        if not ok and s.failed is None:
+            s.ok, s.failed = False, name
+        return ok or not stop_at_first_fail
+
+    w_plf = (inputs.DL_psf + inputs.SL_psf + inputs.LL_psf) * inputs.tributary_width_ft
+    R = w_plf * inputs.span_ft / 2.0
+    f_bearing = R / max(inputs.post_base_bearing_area_in2, 1e-6)
+    if not check("bearing", f_bearing, inputs.Fc_perp_prime, f_bearing <= inputs.Fc_perp_prime): return s
+
+    b, d = inputs.beam_b_in, inputs.beam_d_in
+    fv = 1.5 * R / (b * d)
+    if not check("shear", fv, inputs.Fv_prime, fv <= inputs.Fv_prime): return s
+
+    w_lbin = w_plf / 12.0
+    L_in = inputs.span_ft * 12.0
+    L2_in = L_in * L_in
+    fb = w_lbin * L2_in / 8.0 / (b * (d * d) / 6.0)
+    if not check("bending", fb, inputs.Fb_prime, fb <= inputs.Fb_prime): return s
+
+    delta = 5 * w_lbin * (L2_in * L2_in) / (384.0 * inputs.E * (b * (d * d * d) / 12.0))
+    delta_limit = L_in / inputs.deflection_limit_ratio
+    if not check("deflection", delta, delta_limit, delta <= delta_limit): return s
+
+    if inputs.Fc_axis_prime and inputs.post_section_b_in and inputs.post_section_d_in:
+        A = inputs.post_section_b_in * inputs.post_section_d_in
+        pd = inputs.post_section_d_in
+        r = math.sqrt(inputs.post_section_b_in * (pd * pd * pd) / 12.0 / A)
+        slender = inputs.post_unsupported_height_in / max(r, 1e-6)
+        Pcrit = (math.pi**2) * inputs.E * A / (slender * slender + 1e-6)
+        axial_allow = min(inputs.Fc_axis_prime * A, 0.3 * Pcrit)
+        check("column", R, axial_allow, R <= axial_allow)
+    return s
@@ -0,0 +1,45 @@
+# src/calclog.py
+# Calc log kept as structured records (str.format template + numeric values).
+# Text is only produced when someone reads it (calc_log_lines, the Excel writers, print).
+from typing import Any, Iterator, List, Tuple
+
+class CalcLog:
+    __slots__ = ("records",)
+
+    def __init__(self, records=None):
+        self.records: List[Tuple[str, Tuple[Any, ...]]] = list(records or [])
+
+    def add(self, template: str, *values):
+        self.records.append((template, values))
+
+    def lines(self) -> List[str]:
+        return [t.format(*v) if v else t for t, v in self.records]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lines())
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CalcLog(self.records[i]).lines()
+        t, v = self.records[i]
+        return t.format(*v) if v else t
+
+    def __eq__(self, other):
+        if isinstance(other, CalcLog):
+            return self.records == other.records
+        if isinstance(other, list):
+            return self.lines() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CalcLog({len(self.records)} records)"
+
+class NullLog(CalcLog):
+    """Discards records: used by the no-log fast mode."""
+    __slots__ = ()
+
+    def add(self, template: str, *values):
+        pass
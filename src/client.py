@@ -0,0 +1,106 @@
+# src/client.py
+# Thin client for src.server, for the macro's shell command. Standard library only, so it
+# starts in a few tens of milliseconds; the server is started on first use if it is not up.
+#
+#   python -m src.client "C:\...\Deck_Screening_Template.xlsm"
+#   python -m src.client --stop
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import urllib.error
+import urllib.request
+from typing import Any, Dict, Optional
+
+DEFAULT_PORT = int(os.environ.get("DECK_SERVER_PORT", "8765"))
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def request(method: str, path: str, body: Optional[Dict[str, Any]] = None, port: int = DEFAULT_PORT,
+            timeout: float = 600.0) -> Dict[str, Any]:
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except urllib.error.HTTPError as e:         # 4xx/5xx still carry a JSON body
+        return json.loads(e.read() or b"{}")
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, ConnectionRefusedError):
+            raise e.reason                      # nothing listening: the request was never sent
+        raise
+
+def is_up(port: int = DEFAULT_PORT) -> bool:
+    try:
+        return bool(request("GET", "/health", port=port, timeout=0.5).get("ok"))
+    except (OSError, ValueError):
+        return False
+
+def start_server(port: int = DEFAULT_PORT, wait_s: float = 30.0) -> bool:
+    """Launch src.server in the background (detached from this console) and wait until it answers."""
+    kwargs: Dict[str, Any] = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen([sys.executable, "-m", "src.server", "--port", str(port)], cwd=_PACKAGE_ROOT,
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **kwargs)
+    deadline = time.monotonic() + wait_s
+    while time.monotonic() < deadline:
+        if is_up(port):
+            return True
+        time.sleep(0.1)
+    return False
+
+def run_workbook(xlsx: str, backend: str = "xlwings", port: int = DEFAULT_PORT, spawn: bool = True) -> Dict[str, Any]:
+    """
+    Run one workbook on the server. ConnectionRefusedError means the run certainly did not start
+    (no server, or one that is shutting down), so the caller may run it elsewhere. Any other
+    OSError (timeout, reset) may come after the server took the run and is passed on as is.
+    """
+    body = {"xlsx": os.path.abspath(xlsx), "backend": backend}
+    try:
+        reply = request("POST", "/run", body, port=port)
+    except ConnectionRefusedError:
+        if not (spawn and start_server(port)):
+            raise
+        reply = request("POST", "/run", body, port=port)
+    if reply.get("closing"):
+        raise ConnectionRefusedError(reply.get("error", "calc server is shutting down"))
+    return reply
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Run the deck screening checks through the warm local server.")
+    ap.add_argument("xlsx", nargs="?", default=r"excel\Deck_Screening_Template.xlsm")
+    ap.add_argument("--backend", default="xlwings")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--no-spawn", action="store_true", help="do not start a server; run in this process instead")
+    ap.add_argument("--stop", action="store_true", help="ask a running server to exit")
+    args = ap.parse_args(argv)
+
+    if args.stop:
+        try:
+            request("POST", "/shutdown", {}, port=args.port, timeout=5.0)
+        except OSError:
+            pass
+        return 0
+    try:
+        reply = run_workbook(args.xlsx, args.backend, args.port, spawn=not args.no_spawn)
+    except ConnectionRefusedError:
+        # No server and none could be started: fall back to the one-shot run
+        from .main import main
+        main(args.xlsx, backend=args.backend)
+        return 0
+    except OSError as e:
+        # The server may have taken the run (timeout, dropped connection): do not run it a second time
+        print(f"Calc server error: {e}", file=sys.stderr)
+        return 1
+    if not reply.get("ok"):
+        print(reply.get("error", "run failed"), file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
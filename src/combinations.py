@@ -0,0 +1,202 @@
+# src/combinations.py
+# Load-combination envelopes for batches of designs.
+#
+# Each design's response to each basic load case (D, L, S, W) is stacked as an effects array
+# (designs × cases × effects); every combination is a row of factors, so all combinations are
+# applied with one einsum. calc.calc's q = DL + SL + LL is the single combination D + L + S.
+#
+# Effect conventions (simple span, same formulas as calc / connectors / footing):
+#   moment / shear / deflection: from the beam line load; roof uplift (W) acts upward on the beam
+#   post_vertical:   downward + ; W contributes -roof_uplift_psf × uplift_area_per_post_ft2
+#   post_lateral:    W only (lateral_line_load_plf, else wind_wall_psf × exposed_height_ft) × span / 2
+#   footing_vertical: post_vertical + post self weight (D)
+#
+# Allowables in Inputs are ASD values; LRFD combinations give factored demands to compare with
+# factored resistances supplied by the user.
+#
+# Footing uplift / sliding: the footing concrete and overburden are dead load, so they take the
+# combination's D factor like the post reaction does (0.6D+0.6W, 0.9D+W). That reduced dead load
+# is the stability margin, so SF_uplift / SF_sliding (which footing_checks applies to its
+# unfactored D+W check) are not applied again here.
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Inputs
+from .batch import inputs_to_columns
+from .footing import footing_params
+
+CASES = ("D", "L", "S", "W")
+
+# ASCE 7-16 §2.4.1 (ASD) and §2.3.1 (LRFD), without roof live / rain / seismic / flood
+ASD = {
+    "D": {"D": 1.0},
+    "D+L": {"D": 1.0, "L": 1.0},
+    "D+S": {"D": 1.0, "S": 1.0},
+    "D+0.75L+0.75S": {"D": 1.0, "L": 0.75, "S": 0.75},
+    "D+0.6W": {"D": 1.0, "W": 0.6},
+    "D+0.75L+0.45W+0.75S": {"D": 1.0, "L": 0.75, "W": 0.45, "S": 0.75},
+    "0.6D+0.6W": {"D": 0.6, "W": 0.6},
+}
+LRFD = {
+    "1.4D": {"D": 1.4},
+    "1.2D+1.6L+0.5S": {"D": 1.2, "L": 1.6, "S": 0.5},
+    "1.2D+1.6S+L": {"D": 1.2, "S": 1.6, "L": 1.0},
+    "1.2D+1.6S+0.5W": {"D": 1.2, "S": 1.6, "W": 0.5},
+    "1.2D+W+L+0.5S": {"D": 1.2, "W": 1.0, "L": 1.0, "S": 0.5},
+    "0.9D+W": {"D": 0.9, "W": 1.0},
+}
+COMBINATION_SETS = {"ASD": ASD, "LRFD": LRFD}
+
+EFFECTS = ("moment_lb_in", "shear_lb", "deflection_in", "post_vertical_lb", "post_lateral_lb",
+           "top_moment_lb_in", "footing_vertical_lb")
+
+# check -> how its demand is read from the combined effects (larger = more critical)
+CHECKS = ("bending", "shear", "bearing", "deflection", "connector_download", "connector_uplift",
+          "connector_lateral", "footing_uplift", "footing_sliding")
+
+_FIELDS = ["span_ft", "tributary_width_ft", "beam_b_in", "beam_d_in", "post_base_bearing_area_in2",
+           "Fb_prime", "Fv_prime", "Fc_perp_prime", "E", "DL_psf", "SL_psf", "LL_psf", "deflection_limit_ratio",
+           "roof_uplift_psf", "uplift_area_per_post_ft2", "lateral_line_load_plf", "wind_wall_psf",
+           "exposed_height_ft", "post_to_beam_arm_in", "post_self_weight_lb",
+           "footing_length_in", "footing_width_in", "footing_thickness_in"]
+
+# footing_params keys used here, with footing_params' defaults for column input that omits them
+_FOOTING_DEFAULTS = dict(Dcov_in=0.0, gamma_soil=120.0, gamma_conc=150.0, include_overburden=0.0,
+                         mu=0.5, credit=0.0)
+
+def factor_matrix(combos: Mapping[str, Mapping[str, float]]) -> np.ndarray:
+    """(combinations × CASES) factors; unknown case names raise ValueError."""
+    F = np.zeros((len(combos), len(CASES)))
+    for i, (name, factors) in enumerate(combos.items()):
+        for case, f in factors.items():
+            if case not in CASES:
+                raise ValueError(f"Combination '{name}': unknown load case '{case}' (choose from {', '.join(CASES)}).")
+            F[i, CASES.index(case)] = f
+    return F
+
+def _given(x: np.ndarray) -> np.ndarray:
+    return ~np.isnan(x) & (x != 0)
+
+def _or(x: np.ndarray, default: float) -> np.ndarray:
+    # Python's `x or default` for float columns where None arrived as NaN
+    return np.where(_given(x), x, default)
+
+def case_effects(cols: Dict[str, np.ndarray]) -> np.ndarray:
+    """(designs × CASES × EFFECTS) responses to each unit load case."""
+    span, trib = cols["span_ft"], cols["tributary_width_ft"]
+    b, d, E = cols["beam_b_in"], cols["beam_d_in"], cols["E"]
+    n = np.broadcast(span, trib, b, d, E).shape[0]
+    L_in = span * 12.0
+    L2_in = L_in * L_in
+    I = b * (d * d * d) / 12.0
+
+    # Beam line load per case (plf): roof uplift pushes the beam up
+    psf = np.stack([cols["DL_psf"], _or(cols["LL_psf"], 0.0), cols["SL_psf"], -_or(cols["roof_uplift_psf"], 0.0)], 1)
+    w_plf = psf * trib[:, None]
+    moment = w_plf / 12.0 * L2_in[:, None] / 8.0
+    shear = w_plf * span[:, None] / 2.0
+    deflection = 5 * (w_plf / 12.0) * (L2_in * L2_in)[:, None] / (384.0 * E * I)[:, None]
+
+    # Post vertical follows compute_connection_demands: gravity reaction, wind uplift per post area
+    post_vertical = shear.copy()
+    post_vertical[:, 3] = -_or(cols["roof_uplift_psf"], 0.0) * _or(cols["uplift_area_per_post_ft2"], 0.0)
+    lat, ww, eh = cols["lateral_line_load_plf"], cols["wind_wall_psf"], cols["exposed_height_ft"]
+    w_lat = np.where(~np.isnan(lat), lat, np.where(_given(ww) & _given(eh), ww * eh, 0.0))
+    post_lateral = np.zeros((n, len(CASES)))
+    post_lateral[:, 3] = w_lat * span / 2.0
+    top_moment = post_lateral * _or(cols["post_to_beam_arm_in"], 0.0)[:, None]
+    footing_vertical = post_vertical.copy()
+    footing_vertical[:, 0] += _or(cols["post_self_weight_lb"], 0.0)
+
+    return np.stack([moment, shear, deflection, post_vertical, post_lateral, top_moment, footing_vertical], 2)
+
+@dataclass
+class CombinationEnvelope:
+    combinations: Tuple[str, ...]
+    values: np.ndarray                  # (designs × combinations × EFFECTS)
+    max: np.ndarray                     # (designs × EFFECTS) envelope over combinations
+    min: np.ndarray
+    argmax: np.ndarray                  # combination index of max / min
+    argmin: np.ndarray
+    demand: Dict[str, np.ndarray] = field(default_factory=dict)       # check -> (designs × combinations)
+    utilization: Dict[str, np.ndarray] = field(default_factory=dict)  # check -> (designs,) at governing combo
+    governing: Dict[str, np.ndarray] = field(default_factory=dict)    # check -> (designs,) combination index
+
+    def effect(self, name: str, which: str = "max") -> np.ndarray:
+        return getattr(self, which)[:, EFFECTS.index(name)]
+
+    def governing_names(self, check: str) -> np.ndarray:
+        return np.asarray(self.combinations, dtype=object)[self.governing[check]]
+
+def combination_envelope(designs, method: str = "ASD",
+                         combinations: Optional[Mapping[str, Mapping[str, float]]] = None) -> CombinationEnvelope:
+    """
+    Envelope of every combination for a list of Inputs (or a dict of columns named as the Inputs
+    fields plus the footing_params keys). Beam and footing checks are utilizations against the
+    allowables in the inputs; connector checks are demands in lb, since capacities depend on the
+    connector picked.
+    """
+    if combinations is None:
+        if method not in COMBINATION_SETS:
+            raise ValueError(f"Unknown combination set '{method}' (choose from {', '.join(COMBINATION_SETS)}).")
+        combinations = COMBINATION_SETS[method]
+    if isinstance(designs, Mapping):
+        cols = {**_FOOTING_DEFAULTS, **designs}
+    else:
+        cols = inputs_to_columns(designs, _FIELDS)
+        params = [footing_params(x) for x in designs]
+        cols.update({k: [p[k] for p in params] for k in _FOOTING_DEFAULTS})
+    cols = {k: np.atleast_1d(np.asarray(v, dtype=float)) for k, v in cols.items()}
+    F = factor_matrix(combinations)
+    values = np.einsum("ck,nke->nce", F, case_effects(cols))         # all designs × all combinations
+
+    g = lambda e: values[:, :, EFFECTS.index(e)]
+    col = lambda k: cols[k][:, None]
+    b, d = col("beam_b_in"), col("beam_d_in")
+    S = b * (d * d) / 6.0
+    L_in = col("span_ft") * 12.0
+    vert, ftg, H = g("post_vertical_lb"), g("footing_vertical_lb"), np.abs(g("post_lateral_lb"))
+    # Footing + overburden weight as in footing_pass_batch (zero where no size is given: conservative),
+    # scaled by each combination's dead-load factor
+    A_ft2 = np.nan_to_num(col("footing_length_in") * col("footing_width_in") / 144.0)
+    W_ftg = np.nan_to_num(A_ft2 * col("footing_thickness_in") / 12.0 * col("gamma_conc"))
+    W_ob = np.where(col("include_overburden") != 0, A_ft2 * (col("Dcov_in") / 12.0) * col("gamma_soil"), 0.0)
+    W_dead = (W_ftg + W_ob) * F[:, CASES.index("D")][None, :]
+    V_eff = ftg + W_dead
+    uplift = np.maximum(-ftg, 0.0)                                    # net of dead load in the combination
+    R_up = W_dead + col("credit")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util = {
+            "bending": np.abs(g("moment_lb_in")) / S / col("Fb_prime"),
+            "shear": 1.5 * np.abs(g("shear_lb")) / (b * d) / col("Fv_prime"),
+            "bearing": np.maximum(vert, 0.0) / np.maximum(col("post_base_bearing_area_in2"), 1e-6) / col("Fc_perp_prime"),
+            "deflection": np.abs(g("deflection_in")) / (L_in / col("deflection_limit_ratio")),
+            # H / (μ·V_eff): infinite where lateral load meets no net downward force
+            "footing_sliding": np.where(H > 0, np.where(V_eff > 0, H / (col("mu") * V_eff), np.inf), 0.0),
+            "footing_uplift": np.where(uplift > 0, np.where(R_up > 0, uplift / R_up, np.inf), 0.0),
+        }
+    demand = dict(util)
+    demand["connector_download"] = np.maximum(vert, 0.0)
+    demand["connector_uplift"] = np.maximum(-vert, 0.0)
+    demand["connector_lateral"] = H
+
+    rows = np.arange(values.shape[0])
+    governing = {c: demand[c].argmax(1) for c in CHECKS}
+    return CombinationEnvelope(
+        combinations=tuple(combinations), values=values,
+        max=values.max(1), min=values.min(1), argmax=values.argmax(1), argmin=values.argmin(1),
+        demand={c: demand[c] for c in CHECKS},
+        utilization={c: util[c][rows, governing[c]] for c in util},
+        governing=governing,
+    )
+
+def envelope_table(inputs: Inputs, method: str = "ASD") -> Sequence[Tuple[str, str, float]]:
+    """(check, governing combination, utilization or demand) rows for one design; '-' where no demand."""
+    env = combination_envelope([inputs], method)
+    rows = []
+    for c in CHECKS:
+        v = float(env.demand[c][0, env.governing[c][0]])
+        rows.append((c, env.combinations[env.governing[c][0]] if v else "-", v))
+    return rows
@@ -1,6 +1,10 @@
 # src/connectors.py
+from __future__ import annotations
+from operator import is_
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
+if TYPE_CHECKING:
+    import numpy as np      # imported where used: the calc core must load without NumPy
 
 # ---- Define connector spec dataclasses HERE (not in models.py) ----
 @dataclass
@@ -115,58 +119,161 @@ def _base_checks(dem: ConnectionDemands, spec: ConnectorSpecBase):
     return c
 
 
+# ---- Indexed catalog: built once, then selection is array math over capacity columns ----
+
+TOP_CHECKS = ("download", "uplift", "lateral", "moment")
+BASE_CHECKS = ("shear", "uplift")
+# Checks where a zero capacity means "not rated": only a zero demand passes (see _top_checks "moment")
+_TOP_ZERO_ONLY = (False, False, False, True)
+_BASE_ZERO_ONLY = (False, False)
+
+def _top_demand_matrix(demands: List[ConnectionDemands]) -> np.ndarray:
+    import numpy as np
+    return np.array([[d.top_download_lb, d.top_uplift_lb, d.top_lateral_lb, d.top_moment_lb_in]
+                     for d in demands], dtype=float).reshape(-1, 4)
+
+def _base_demand_matrix(demands: List[ConnectionDemands]) -> np.ndarray:
+    import numpy as np
+    return np.array([[d.base_shear_lb, d.base_uplift_lb] for d in demands], dtype=float).reshape(-1, 2)
+
+def _covered_by(rows: np.ndarray, by: np.ndarray) -> np.ndarray:
+    # (len(rows), len(by)): by[j] >= rows[i] in every column (column at a time: cheaper than .all(-1))
+    out = by[None, :, 0] >= rows[:, None, 0]
+    for j in range(1, rows.shape[1]):
+        out &= by[None, :, j] >= rows[:, None, j]
+    return out
+
+def _pareto_front(caps: np.ndarray, block: int = 256) -> np.ndarray:
+    # Indices (catalog order) of rows not dominated by another row (>= every cap, > at least one).
+    # Exact duplicates keep only their first occurrence.
+    # Rows are visited by descending capacity sum (ties: lexicographically larger first, then catalog
+    # order), so anything that dominates a row comes before it: each block is screened against the
+    # frontier found so far, then the survivors against each other. O(n·frontier) instead of O(n²).
+    import numpy as np
+    n, k = caps.shape
+    order = np.lexsort((np.arange(n),) + tuple(-caps[:, j] for j in reversed(range(k))) + (-caps.sum(1),))
+    front = np.empty(0, dtype=np.intp)
+    for s in range(0, n, block):
+        idx = order[s:s + block]
+        if len(front):
+            idx = idx[~_covered_by(caps[idx], caps[front]).any(1)]
+        c = caps[idx]
+        earlier = np.tri(len(idx), k=-1, dtype=bool)
+        front = np.concatenate([front, idx[~(_covered_by(c, c) & earlier).any(1)]])
+    return np.sort(front)
+
+def _pass_and_util(D: np.ndarray, caps: np.ndarray, zero_only: np.ndarray):
+    # D (m,k) demands × caps (n,k) capacities -> all-pass (m,n) and worst utilization (m,n)
+    import numpy as np
+    Dm, C = D[:, None, :], caps[None, :, :]
+    ok = np.where(np.asarray(zero_only) & (C == 0), Dm == 0, Dm <= C)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util = np.where(C > 0, Dm / C, np.where(ok, 0.0, np.inf))
+    return ok.all(-1), util.max(-1)
+
+def _best(all_ok: np.ndarray, umax: np.ndarray) -> np.ndarray:
+    # Lowest worst-case utilization among passing connectors; if none pass, lowest overall
+    import numpy as np
+    passing = np.where(all_ok, umax, np.inf).argmin(1)
+    fallback = umax.argmin(1)
+    return np.where(all_ok.any(1), passing, fallback)
+
+class ConnectorCatalog:
+    """
+    Connector specs indexed once: hash lookup by model, capacities as NumPy columns
+    (top: download/uplift/lateral/moment, base: shear/uplift) and the Pareto frontier of
+    non-dominated connectors. A dominated connector can never have a lower worst-case
+    utilization than the one dominating it, so auto-selection only scores the frontier.
+    """
+    def __init__(self, top_list: List[ConnectorSpecTop], base_list: List[ConnectorSpecBase]):
+        import numpy as np
+        self.top_list = list(top_list)
+        self.base_list = list(base_list)
+        self.top_by_model: Dict[str, ConnectorSpecTop] = {}
+        self.base_by_model: Dict[str, ConnectorSpecBase] = {}
+        for t in self.top_list: self.top_by_model.setdefault(t.model, t)
+        for b in self.base_list: self.base_by_model.setdefault(b.model, b)
+        self.top_caps = np.array([[t.allowable_download_lb, t.allowable_uplift_lb,
+                                   t.allowable_lateral_lb, t.allowable_moment_lb_in]
+                                  for t in self.top_list], dtype=float).reshape(-1, 4)
+        self.base_caps = np.array([[b.allowable_shear_lb, b.allowable_uplift_lb]
+                                   for b in self.base_list], dtype=float).reshape(-1, 2)
+        self.top_frontier = _pareto_front(self.top_caps)
+        self.base_frontier = _pareto_front(self.base_caps)
+
+    def top(self, model: str) -> ConnectorSpecTop:
+        spec = self.top_by_model.get(model)
+        if not spec: raise ValueError(f"Top connector '{model}' not found.")
+        return spec
+
+    def base(self, model: str) -> ConnectorSpecBase:
+        spec = self.base_by_model.get(model)
+        if not spec: raise ValueError(f"Base connector '{model}' not found.")
+        return spec
+
+    def best_top(self, D: np.ndarray) -> np.ndarray:
+        # D (m,4) demand rows -> catalog index of the chosen top connector per row
+        front = self.top_frontier
+        ok, umax = _pass_and_util(D, self.top_caps[front], _TOP_ZERO_ONLY)
+        return front[_best(ok, umax)]
+
+    def best_base(self, D: np.ndarray) -> np.ndarray:
+        front = self.base_frontier
+        ok, umax = _pass_and_util(D, self.base_caps[front], _BASE_ZERO_ONLY)
+        return front[_best(ok, umax)]
+
+
+def select_connectors_batch(inputs_list: List[Inputs], demands_list: List[ConnectionDemands],
+                            catalog: ConnectorCatalog) -> List[ConnectionSelection]:
+    """Select/verify top and base connectors for many posts with one demands × catalog pass."""
+    m = len(demands_list)
+    top_idx = catalog.best_top(_top_demand_matrix(demands_list)) if (m and catalog.top_list) else [None] * m
+    base_idx = catalog.best_base(_base_demand_matrix(demands_list)) if (m and catalog.base_list) else [None] * m
+
+    out = []
+    for inputs, dem, ti, bi in zip(inputs_list, demands_list, top_idx, base_idx):
+        # Top: a model named on the Inputs sheet is verified; otherwise use the auto pick
+        if inputs.top_connector_model:
+            top = catalog.top(inputs.top_connector_model)
+        else:
+            top = catalog.top_list[ti] if ti is not None else None
+        if inputs.base_connector_model:
+            base = catalog.base(inputs.base_connector_model)
+        else:
+            base = catalog.base_list[bi] if bi is not None else None
+        out.append(ConnectionSelection(
+            top_model=top.model if top else None,
+            base_model=base.model if base else None,
+            top_checks=_top_checks(dem, top) if top else {},
+            base_checks=_base_checks(dem, base) if base else {},
+        ))
+    return out
+
+
+_CATALOGS: List[Tuple[tuple, tuple, ConnectorCatalog]] = []      # most recent first
+_MAX_CATALOGS = 4
+
+def catalog_for(top_list: List[ConnectorSpecTop], base_list: List[ConnectorSpecBase]) -> ConnectorCatalog:
+    """
+    Indexed catalog for these specs, memoized for the last few spec tables. Entries match when
+    the lists hold the same spec objects in the same order (an identity scan, well under a
+    millisecond at 10,000 specs against ~40 ms to index); the readers build new spec objects
+    for every read, so specs are not expected to change in place.
+    """
+    for k, (tops, bases, catalog) in enumerate(_CATALOGS):
+        if (len(tops) == len(top_list) and len(bases) == len(base_list)
+                and all(map(is_, tops, top_list)) and all(map(is_, bases, base_list))):
+            if k:
+                _CATALOGS.insert(0, _CATALOGS.pop(k))
+            return catalog
+    catalog = ConnectorCatalog(top_list, base_list)
+    _CATALOGS.insert(0, (tuple(top_list), tuple(base_list), catalog))
+    del _CATALOGS[_MAX_CATALOGS:]
+    return catalog
+
 def select_or_verify_connectors(inputs: Inputs, demands: ConnectionDemands,
-                                top_list: List[ConnectorSpecTop], base_list: List[ConnectorSpecBase]) -> ConnectionSelection:
-    # Top
-    chosen_top = None; top_checks = {}
-    if inputs.top_connector_model:
-        spec = next((t for t in top_list if t.model == inputs.top_connector_model), None)
-        if not spec: raise ValueError(f"Top connector '{inputs.top_connector_model}' not found.")
-        top_checks = _top_checks(demands, spec)
-        chosen_top = spec.model
-    else:
-        for spec in top_list:
-            c = _top_checks(demands, spec)
-            if all(v["pass"] for v in c.values()):
-                chosen_top = spec.model; top_checks = c; break
-        if not chosen_top and top_list:
-            # Choose the connector with the best (lowest worst-case utilization)
-            def util(spec):
-                from math import inf
-                vals = []
-                vals.append(demands.download_lb / (spec.allowable_download_lb or 1e9))
-                vals.append(demands.uplift_lb   / (spec.allowable_uplift_lb   or 1e9))
-                vals.append(demands.lateral_lb  / (spec.allowable_lateral_lb  or 1e9))
-                if spec.allowable_moment_lb_in>0 and demands.moment_lb_in>0:
-                    vals.append(demands.moment_lb_in / (spec.allowable_moment_lb_in or 1e9))
-                return max(vals) if vals else float('inf')
-            best = min(top_list, key=util)
-            top_checks = _top_checks(demands, best)
-            chosen_top = best.model
-
-    # Base
-    chosen_base = None; base_checks = {}
-    if inputs.base_connector_model:
-        spec = next((b for b in base_list if b.model == inputs.base_connector_model), None)
-        if not spec: raise ValueError(f"Base connector '{inputs.base_connector_model}' not found.")
-        base_checks = _base_checks(demands, spec)
-        chosen_base = spec.model
-    else:
-        for spec in base_list:
-            c = _base_checks(demands, spec)
-            if all(v["pass"] for v in c.values()):
-                chosen_base = spec.model; base_checks = c; break
-        if not chosen_base and base_list:
-            def util(spec):
-                from math import inf
-                vals = [
-                    demands.lateral_lb / (spec.allowable_shear_lb or 1e9),
-                    demands.uplift_lb  / (spec.allowable_uplift_lb or 1e9)
-                ]
-                return max(vals)
-            best = min(base_list, key=util)
-            base_checks = _base_checks(demands, best)
-            chosen_base = best.model
-
-    return ConnectionSelection(top_model=chosen_top, base_model=chosen_base,
-                               top_checks=top_checks, base_checks=base_checks)
+                                top_list: List[ConnectorSpecTop], base_list: List[ConnectorSpecBase],
+                                catalog: Optional[ConnectorCatalog] = None) -> ConnectionSelection:
+    # A prebuilt catalog skips even the memo lookup when checking many posts against the same specs
+    catalog = catalog or catalog_for(top_list, base_list)
+    return select_connectors_batch([inputs], [demands], catalog)[0]
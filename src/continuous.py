@@ -0,0 +1,281 @@
+# src/continuous.py
+# Continuous beam over N spans (posts at every support) with pattern live loading.
+#
+# calc.calc treats the beam as one simple span; over several posts the interior reactions are
+# much larger (two equal spans: 1.25 wL at the middle post instead of wL). Here the support
+# moments come from the three-moment equation (pinned supports, constant EI), a tridiagonal
+# system solved with the Thomas algorithm in O(N). Responses are linear in the span loads, so the
+# envelope over every on/off live-load pattern is the dead-load response plus the positive (or
+# negative) parts of the response to live load on each span alone.
+#
+# Those N single-span cases are not solved one by one (O(N²)). Away from the loaded span the
+# support moments decay by fixed ratios (the focal-point ratios of the classic method), so in an
+# unloaded span every far load gives the same moment shape times one scalar. Prefix / suffix sums
+# of the positive and negative parts of those scalars give the whole envelope in O(N).
+#
+#   cont = analyze_continuous(inputs, spans_ft=[8, 10, 10, 8])
+#   posts = check_posts(inputs, cont, top_specs, base_specs)   # connectors + footing per post
+from dataclasses import dataclass, replace
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .models import Inputs, Results
+from .calc import calc
+from .connectors import (ConnectionSelection, ConnectorCatalog, ConnectorSpecTop, ConnectorSpecBase,
+                         catalog_for, compute_connection_demands, select_connectors_batch)
+from .footing import FootingChecks, FootingSize, evaluate_footing
+
+def solve_tridiagonal(sub: np.ndarray, diag: np.ndarray, sup: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Thomas algorithm for (n,n) tridiagonal systems, several right-hand sides at once.
+    sub/sup have n-1 entries, diag n, rhs (n,) or (n,k). No pivoting: fine for the
+    diagonally dominant three-moment matrix.
+    """
+    n = len(diag)
+    c = np.empty(n - 1)
+    d = np.array(rhs, dtype=float)
+    b = float(diag[0])
+    if n > 1:
+        c[0] = sup[0] / b
+    d[0] = d[0] / b
+    for i in range(1, n):
+        b = diag[i] - sub[i - 1] * c[i - 1]
+        if i < n - 1:
+            c[i] = sup[i] / b
+        d[i] = (d[i] - sub[i - 1] * d[i - 1]) / b
+    for i in range(n - 2, -1, -1):
+        d[i] -= c[i] * d[i + 1]
+    return d
+
+def support_moments(L_in: np.ndarray, w_lbin: np.ndarray) -> np.ndarray:
+    """
+    Support moments (lb·in, sagging positive) for span lengths L_in (N,) and uniform loads
+    w_lbin (N,) or (N,k) load cases. Returns (N+1,) / (N+1,k); end supports are zero.
+    Three-moment equation at interior support i (spans i and i+1 either side):
+        M[i-1]·L_i + 2·M[i]·(L_i + L_i+1) + M[i+1]·L_i+1 = -(w_i·L_i³ + w_i+1·L_i+1³) / 4
+    """
+    w = np.asarray(w_lbin, dtype=float)
+    M = np.zeros((len(L_in) + 1,) + w.shape[1:])
+    if len(L_in) > 1:
+        L3 = (L_in * L_in * L_in).reshape((-1,) + (1,) * (w.ndim - 1))
+        rhs = -(w[:-1] * L3[:-1] + w[1:] * L3[1:]) / 4.0
+        M[1:-1] = solve_tridiagonal(L_in[1:-1], 2.0 * (L_in[:-1] + L_in[1:]), L_in[1:-1], rhs)
+    return M
+
+def _span_shape(L_in, Ma, Mb, w, EI, t):
+    # Per span (N,) end moments and load -> moment, shear, deflection (N,P) at x = t·L, left-end shear (N,)
+    L, Ma, Mb, w = (np.asarray(a, dtype=float)[:, None] for a in np.broadcast_arrays(L_in, Ma, Mb, w))
+    x = t[None, :] * L
+    Va = w * L / 2.0 + (Mb - Ma) / L
+    moment = Ma + Va * x - w * x * x / 2.0
+    shear = Va - w * x
+    deflection = (w * x * (L * L * L - 2.0 * L * x * x + x * x * x) / (24.0 * EI)
+                  + Ma * x * (L - x) * (2.0 * L - x) / (6.0 * EI * L)
+                  + Mb * x * (L * L - x * x) / (6.0 * EI * L))
+    return moment, shear, deflection, Va[:, 0]
+
+def focal_ratios(L_in: np.ndarray):
+    """
+    Support-moment ratios for a beam loaded only elsewhere (index = support, 0..N):
+    left[k] = M[k-1]/M[k] when nothing left of support k is loaded, right[k] = M[k+1]/M[k] when
+    nothing right of it is. Both are <= 0 (moments alternate in sign) and |ratio| < 1/2.
+    """
+    N = len(L_in)
+    left, right = np.zeros(N + 1), np.zeros(N + 1)
+    for k in range(1, N):
+        left[k + 1] = -L_in[k] / (left[k] * L_in[k - 1] + 2.0 * (L_in[k - 1] + L_in[k]))
+    for k in range(N - 1, 0, -1):
+        right[k - 1] = -L_in[k - 1] / (2.0 * (L_in[k - 1] + L_in[k]) + right[k] * L_in[k])
+    return left, right
+
+def single_span_moments(L_in: np.ndarray, w: float, left: np.ndarray, right: np.ndarray):
+    """End moments (Ma, Mb) of span s when only span s carries w, for every s at once: (N,), (N,)."""
+    N = len(L_in)
+    r = -w * L_in * L_in * L_in / 4.0
+    P = np.full(N, np.inf)                                            # stiffness at the left support
+    Q = np.full(N, np.inf)                                            # and at the right one (inf = end)
+    P[1:] = left[1:N] * L_in[:-1] + 2.0 * (L_in[:-1] + L_in[1:])
+    Q[:-1] = 2.0 * (L_in[:-1] + L_in[1:]) + right[1:N] * L_in[1:]
+    with np.errstate(invalid="ignore"):
+        # P·Ma + L·Mb = r (left support), L·Ma + Q·Mb = r (right support); an end support has M = 0
+        both = np.isfinite(P) & np.isfinite(Q)
+        det = np.where(both, P * Q - L_in * L_in, 1.0)
+        Ma = np.where(both, r * (Q - L_in) / det, np.where(np.isfinite(P), r / P, 0.0))
+        Mb = np.where(both, r * (P - L_in) / det, np.where(np.isfinite(Q), r / Q, 0.0))
+    return Ma, Mb
+
+def _far_sums(local: np.ndarray, ratio: np.ndarray, reverse: bool):
+    # pos[j] / neg[j]: positive / negative parts of one support moment, summed over every load past j.
+    # local[j] is the nearest load's moment there; farther loads arrive times ratio[j] <= 0, which swaps sign
+    n = len(local)
+    pos, neg = np.zeros(n), np.zeros(n)
+    order = range(n - 2, -1, -1) if not reverse else range(1, n)
+    for j in order:
+        k = j + 1 if not reverse else j - 1
+        q = ratio[j]
+        pos[j] = max(local[j], 0.0) + q * neg[k]
+        neg[j] = min(local[j], 0.0) + q * pos[k]
+    return pos, neg
+
+def _split(g):
+    return np.clip(g, 0, None), np.clip(g, None, 0)
+
+@dataclass
+class ContinuousResults:
+    spans_ft: np.ndarray
+    x_in: np.ndarray                    # (N,P) stations along each span
+    # Envelopes over all live-load patterns (dead load always on), (N,P)
+    moment_max_lb_in: np.ndarray
+    moment_min_lb_in: np.ndarray
+    shear_max_lb: np.ndarray
+    shear_min_lb: np.ndarray
+    deflection_max_in: np.ndarray       # downward positive
+    # Per post (N+1): max download and min (negative = net uplift) reaction
+    reaction_max_lb: np.ndarray
+    reaction_min_lb: np.ndarray
+    # Per-span / per-post checks, same criteria as calc
+    bending_stress_psi: np.ndarray      # (N,) from max |M| in the span including its supports
+    shear_stress_psi: np.ndarray        # (N,)
+    deflection_limit_in: np.ndarray     # (N,)
+    bearing_stress_psi: np.ndarray      # (N+1,)
+    bending_ok: np.ndarray
+    shear_ok: np.ndarray
+    deflection_ok: np.ndarray
+    bearing_ok: np.ndarray
+
+    @property
+    def n_spans(self) -> int:
+        return len(self.spans_ft)
+
+    @property
+    def tributary_ft(self) -> np.ndarray:
+        """Beam length carried by each post: half of each adjacent span."""
+        half = np.asarray(self.spans_ft) / 2.0
+        out = np.zeros(len(half) + 1)
+        out[:-1] += half
+        out[1:] += half
+        return out
+
+def analyze_continuous(inputs: Inputs, spans_ft: Sequence[float], n_points: int = 65,
+                       pattern_live: bool = True) -> ContinuousResults:
+    """
+    Envelope analysis of the beam in `inputs` (section, E, loads, tributary width) over the
+    given spans. Dead load is on every span; snow + live (SL_psf + LL_psf) is applied span by
+    span in every on/off pattern when pattern_live, else on all spans together. O(N·n_points).
+    """
+    L_ft = np.asarray(spans_ft, dtype=float)
+    if L_ft.ndim != 1 or len(L_ft) == 0 or np.any(L_ft <= 0):
+        raise ValueError("spans_ft must be a non-empty list of positive span lengths.")
+    N = len(L_ft)
+    L_in = L_ft * 12.0
+    b, d = inputs.beam_b_in, inputs.beam_d_in
+    S = b * (d * d) / 6.0
+    EI = inputs.E * b * (d * d * d) / 12.0
+    wD = inputs.DL_psf * inputs.tributary_width_ft / 12.0             # lb/in
+    wL = (inputs.SL_psf + inputs.LL_psf) * inputs.tributary_width_ft / 12.0
+    t = np.linspace(0.0, 1.0, n_points)
+
+    # Always-on load: one tridiagonal solve for all spans
+    w_on = np.full(N, wD if pattern_live else wD + wL)
+    M0 = support_moments(L_in, w_on)
+    m0, v0, y0, Va0 = _span_shape(L_in, M0[:-1], M0[1:], w_on, EI, t)
+    r0 = np.zeros(N + 1)
+    r0[:-1] += Va0
+    r0[1:] += w_on * L_in - Va0
+    m_hi, m_lo, v_hi, v_lo, y_hi = m0.copy(), m0.copy(), v0.copy(), v0.copy(), y0.copy()
+    r_hi, r_lo = r0.copy(), r0.copy()
+
+    if pattern_live:
+        left, right = focal_ratios(L_in)
+        Ma, Mb = single_span_moments(L_in, wL, left, right)           # span s alone, at its own supports
+        # 1) live load on the span itself
+        m, v, y, Va = _span_shape(L_in, Ma, Mb, wL, EI, t)
+        # 2) loads right of span j: (M[j], M[j+1]) = M[j+1]·(left[j+1], 1); 3) left of it: M[j]·(1, right[j])
+        Rp, Rn = _far_sums(np.append(Ma[1:], 0.0), left[2:].tolist() + [0.0], reverse=False)   # index j: M[j+1]
+        Lp, Ln = _far_sums(np.insert(Mb[:-1], 0, 0.0), [0.0] + right[:N - 1].tolist(), reverse=True)  # M[j]
+        mr, vr, yr, _ = _span_shape(L_in, left[1:N + 1], 1.0, 0.0, EI, t)
+        ml, vl, yl, _ = _span_shape(L_in, 1.0, right[:N], 0.0, EI, t)
+        for own, far_r, far_l, hi, lo in ((m, mr, ml, m_hi, m_lo), (v, vr, vl, v_hi, v_lo), (y, yr, yl, y_hi, None)):
+            hi += np.clip(own, 0, None)
+            gp, gn = _split(far_r); hp, hn = _split(far_l)
+            hi += gp * Rp[:, None] + gn * Rn[:, None] + hp * Lp[:, None] + hn * Ln[:, None]
+            if lo is not None:
+                lo += np.clip(own, None, 0)
+                lo += gn * Rp[:, None] + gp * Rn[:, None] + hn * Lp[:, None] + hp * Ln[:, None]
+
+        # Post reactions. Span s loaded alone: its two posts, each with the end shear of the unloaded
+        # neighbour span (whose far-end moment follows from the focal ratio)
+        R_a = Va.copy()
+        R_a[1:] -= Ma[1:] * (1.0 - left[1:N]) / L_in[:-1]
+        R_b = wL * L_in - Va
+        R_b[:-1] += Mb[:-1] * (right[1:N] - 1.0) / L_in[1:]
+        for R, post in ((R_a, slice(0, N)), (R_b, slice(1, N + 1))):
+            r_hi[post] += np.clip(R, 0, None)
+            r_lo[post] += np.clip(R, None, 0)
+        # far loads: post i sees them through spans i-1 and i, both unloaded
+        rho_r = np.zeros(N + 1)                                       # loads right of span i, per unit M[i+1]
+        rho_r[:N] = (1.0 - left[1:]) / L_in
+        rho_r[1:N] -= (left[2:N + 1] - left[1:N] * left[2:N + 1]) / L_in[:-1]
+        rho_l = np.zeros(N + 1)                                       # loads left of span i-1, per unit M[i-1]
+        rho_l[1:] = -(right[:N] - 1.0) / L_in
+        rho_l[1:N] += (right[:N - 1] * right[1:N] - right[:N - 1]) / L_in[1:]
+        far_rp, far_rn = np.append(Rp, 0.0), np.append(Rn, 0.0)      # loads beyond span i (none past the end)
+        far_lp, far_ln = np.insert(Lp, 0, 0.0), np.insert(Ln, 0, 0.0)  # loads before span i-1
+        for rho, fp, fn in ((rho_r, far_rp, far_rn), (rho_l, far_lp, far_ln)):
+            pp, pn = _split(rho)
+            r_hi += pp * fp + pn * fn
+            r_lo += pn * fp + pp * fn
+
+    M_abs = np.maximum(np.abs(m_hi), np.abs(m_lo)).max(1)
+    V_abs = np.maximum(np.abs(v_hi), np.abs(v_lo)).max(1)
+    fb = M_abs / S
+    fv = 1.5 * V_abs / (b * d)
+    f_bearing = r_hi / max(inputs.post_base_bearing_area_in2, 1e-6)
+    delta = y_hi.max(1)
+    delta_limit = L_in / inputs.deflection_limit_ratio
+    return ContinuousResults(
+        spans_ft=L_ft, x_in=t[None, :] * L_in[:, None],
+        moment_max_lb_in=m_hi, moment_min_lb_in=m_lo, shear_max_lb=v_hi, shear_min_lb=v_lo,
+        deflection_max_in=y_hi, reaction_max_lb=r_hi, reaction_min_lb=r_lo,
+        bending_stress_psi=fb, shear_stress_psi=fv, deflection_limit_in=delta_limit, bearing_stress_psi=f_bearing,
+        bending_ok=fb <= inputs.Fb_prime, shear_ok=fv <= inputs.Fv_prime,
+        deflection_ok=delta <= delta_limit, bearing_ok=f_bearing <= inputs.Fc_perp_prime,
+    )
+
+# ---------------- per-post connector / footing checks ----------------
+
+@dataclass
+class PostCheck:
+    post: int                           # 0 .. N (left to right)
+    tributary_ft: float
+    reaction_lb: float
+    selection: ConnectionSelection
+    footing: FootingChecks
+    footing_size: Optional[FootingSize] = None
+
+def post_inputs_and_results(inputs: Inputs, cont: ContinuousResults, results: Optional[Results] = None):
+    """
+    Inputs / Results as seen by each post: reaction_per_post_lb = its max reaction, and span_ft
+    = 2 × its tributary length, so the simple-span rule (lateral per post = w_lat·span/2) used by
+    connectors and footing gives the lateral share of that post.
+    """
+    results = results or calc(inputs, log=False)
+    out = []
+    for trib, R in zip(cont.tributary_ft, cont.reaction_max_lb):
+        out.append((replace(inputs, span_ft=float(2.0 * trib)),
+                    replace(results, reaction_per_post_lb=float(R))))
+    return out
+
+def check_posts(inputs: Inputs, cont: ContinuousResults, top_specs: List[ConnectorSpecTop],
+                base_specs: List[ConnectorSpecBase], catalog: Optional[ConnectorCatalog] = None) -> List[PostCheck]:
+    """Connector selection/verification and footing check (or sizing) for every post."""
+    pairs = post_inputs_and_results(inputs, cont)
+    demands = [compute_connection_demands(i, r) for i, r in pairs]
+    selections = select_connectors_batch([i for i, _ in pairs], demands,
+                                         catalog or catalog_for(top_specs, base_specs))
+    posts = []
+    for k, ((i, r), sel) in enumerate(zip(pairs, selections)):
+        fsize, fchk = evaluate_footing(i, r)
+        posts.append(PostCheck(k, float(cont.tributary_ft[k]), r.reaction_per_post_lb, sel, fchk, fsize))
+    return posts
@@ -1,7 +1,9 @@
 # src/footing.py
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, replace
 from typing import List, Dict, Any, Optional
 from .models import Inputs, Results
+from .calclog import CalcLog, NullLog
 
 @dataclass
 class FootingChecks:
@@ -23,8 +25,8 @@ class FootingChecks:
     # Uplift
     R_uplift_lb: float
     uplift_ok: bool
-    # Log
-    calc_log: List[str]
+    # Log (rendered on demand)
+    calc_log: CalcLog
 
 def _bool_from_yesno(v: Any) -> bool:
     if isinstance(v, bool): return v
@@ -32,8 +34,8 @@ def _bool_from_yesno(v: Any) -> bool:
     s = str(v).strip().lower()
     return s in ("yes", "y", "true", "1")
 
-def footing_checks(inputs: Inputs, beam_results: Results) -> FootingChecks:
-    log: List[str] = []
+def footing_checks(inputs: Inputs, beam_results: Results, log: bool = True) -> FootingChecks:
+    lg = CalcLog() if log else NullLog()
 
     # --- Geometry -> feet
     L_in = float(inputs.footing_length_in or 0.0)
@@ -57,33 +59,34 @@ def footing_checks(inputs: Inputs, beam_results: Results) -> FootingChecks:
     include_overburden = _bool_from_yesno(inputs.include_soil_overburden)
     W_overburden = (A_ft2 * Dcov_ft * gamma_soil) if include_overburden else 0.0
 
-    log.append(f"Footing A={A_ft2:.3f} ft², Vconc={Vconc_ft3:.3f} ft³, W_footing={W_footing:.1f} lb, "
-               f"W_overburden={W_overburden:.1f} lb (include={include_overburden})")
+    lg.add("Footing A={:.3f} ft², Vconc={:.3f} ft³, W_footing={:.1f} lb, W_overburden={:.1f} lb (include={})",
+           A_ft2, Vconc_ft3, W_footing, W_overburden, include_overburden)
 
     # --- Structural demands at post
     V_struct = (beam_results.reaction_per_post_lb or 0.0) + float(inputs.post_self_weight_lb or 0.0)
-    log.append(f"V_struct = Reaction(post) + Post self-weight = {beam_results.reaction_per_post_lb:.1f} + "
-               f"{float(inputs.post_self_weight_lb or 0.0):.1f} = {V_struct:.1f} lb")
+    lg.add("V_struct = Reaction(post) + Post self-weight = {:.1f} + {:.1f} = {:.1f} lb",
+           beam_results.reaction_per_post_lb, float(inputs.post_self_weight_lb or 0.0), V_struct)
 
     # Lateral line load -> H at post
     H_post = 0.0
     if inputs.lateral_line_load_plf is not None:
         H_post = float(inputs.lateral_line_load_plf) * float(inputs.span_ft) / 2.0
-        log.append(f"H_post = lateral_plf × span / 2 = {inputs.lateral_line_load_plf:.2f} × {inputs.span_ft:.2f} / 2 = {H_post:.1f} lb")
+        lg.add("H_post = lateral_plf × span / 2 = {:.2f} × {:.2f} / 2 = {:.1f} lb", inputs.lateral_line_load_plf, inputs.span_ft, H_post)
     elif inputs.wind_wall_psf and inputs.exposed_height_ft:
         w_lat_plf = float(inputs.wind_wall_psf) * float(inputs.exposed_height_ft)
         H_post = w_lat_plf * float(inputs.span_ft) / 2.0
-        log.append(f"H_post = (wind_wall_psf×height)×span/2 = ({inputs.wind_wall_psf:.2f}×{inputs.exposed_height_ft:.2f})×{inputs.span_ft:.2f}/2 = {H_post:.1f} lb")
+        lg.add("H_post = (wind_wall_psf×height)×span/2 = ({:.2f}×{:.2f})×{:.2f}/2 = {:.1f} lb",
+               inputs.wind_wall_psf, inputs.exposed_height_ft, inputs.span_ft, H_post)
     else:
-        log.append("H_post = 0 (no lateral line load provided)")
+        lg.add("H_post = 0 (no lateral line load provided)")
 
     # Uplift at post from wind on roof
     U_post = 0.0
     if inputs.roof_uplift_psf and inputs.uplift_area_per_post_ft2:
         U_post = float(inputs.roof_uplift_psf) * float(inputs.uplift_area_per_post_ft2)
-        log.append(f"U_post = roof_uplift_psf × uplift_area = {inputs.roof_uplift_psf:.2f} × {inputs.uplift_area_per_post_ft2:.2f} = {U_post:.1f} lb")
+        lg.add("U_post = roof_uplift_psf × uplift_area = {:.2f} × {:.2f} = {:.1f} lb", inputs.roof_uplift_psf, inputs.uplift_area_per_post_ft2, U_post)
     else:
-        log.append("U_post = 0 (no uplift psf or area provided)")
+        lg.add("U_post = 0 (no uplift psf or area provided)")
 
     # Effective vertical for sliding/uplift resistance (footing + overburden + structural)
     V_eff = V_struct + W_footing + W_overburden
@@ -94,21 +97,22 @@ def footing_checks(inputs: Inputs, beam_results: Results) -> FootingChecks:
     SF_bearing = float(inputs.SF_bearing or 1.0)
     q_allow_eff = q_allow / max(SF_bearing, 1e-9)
     bearing_ok = q_actual <= q_allow_eff
-    log.append(f"Bearing: q_actual={q_actual:.0f} psf vs q_allow_eff={q_allow_eff:.0f} psf -> {'PASS' if bearing_ok else 'CHECK'}")
+    lg.add("Bearing: q_actual={:.0f} psf vs q_allow_eff={:.0f} psf -> {}", q_actual, q_allow_eff, 'PASS' if bearing_ok else 'CHECK')
 
     # --- Sliding check
     mu = float(inputs.base_friction_coeff_mu or 0.5)
     SF_sliding = float(inputs.SF_sliding or 1.5)
     R_slide = (mu * V_eff) / max(SF_sliding, 1e-9)
     sliding_ok = H_post <= R_slide
-    log.append(f"Sliding: H={H_post:.0f} lb vs μ·V_eff/SF={mu:.2f}·{V_eff:.0f}/{SF_sliding:.2f}={R_slide:.0f} lb -> {'PASS' if sliding_ok else 'CHECK'}")
+    lg.add("Sliding: H={:.0f} lb vs μ·V_eff/SF={:.2f}·{:.0f}/{:.2f}={:.0f} lb -> {}", H_post, mu, V_eff, SF_sliding, R_slide, 'PASS' if sliding_ok else 'CHECK')
 
     # --- Uplift check
     SF_uplift = float(inputs.SF_uplift or 1.5)
     credit_uplift = float(inputs.credit_connector_uplift_lb or 0.0)
     R_uplift = (W_footing + W_overburden + credit_uplift) / max(SF_uplift, 1e-9)
     uplift_ok = U_post <= R_uplift
-    log.append(f"Uplift: U={U_post:.0f} lb vs (W_footing+W_overburden+credit)/SF=({W_footing:.0f}+{W_overburden:.0f}+{credit_uplift:.0f})/{SF_uplift:.2f}={R_uplift:.0f} lb -> {'PASS' if uplift_ok else 'CHECK'}")
+    lg.add("Uplift: U={:.0f} lb vs (W_footing+W_overburden+credit)/SF=({:.0f}+{:.0f}+{:.0f})/{:.2f}={:.0f} lb -> {}",
+           U_post, W_footing, W_overburden, credit_uplift, SF_uplift, R_uplift, 'PASS' if uplift_ok else 'CHECK')
 
     return FootingChecks(
         V_struct_lb=V_struct,
@@ -124,5 +128,152 @@ def footing_checks(inputs: Inputs, beam_results: Results) -> FootingChecks:
         sliding_ok=sliding_ok,
         R_uplift_lb=R_uplift,
         uplift_ok=uplift_ok,
-        calc_log=log
+        calc_log=lg
     )
+
+
+# ---------------- Sizing mode (Option 2: find the smallest footing that passes) ----------------
+
+DEFAULT_PLAN_SIZES_IN = tuple(range(12, 98, 2))       # square plan, 2 in steps
+DEFAULT_THICKNESSES_IN = tuple(range(6, 38, 2))
+
+@dataclass
+class FootingSize:
+    length_in: float
+    width_in: float
+    thickness_in: float
+    checks: FootingChecks
+
+def footing_demands(inputs: Inputs, beam_results: Results):
+    """(V_struct, H_post, U_post) at the post, same rules as footing_checks."""
+    V_struct = (beam_results.reaction_per_post_lb or 0.0) + float(inputs.post_self_weight_lb or 0.0)
+    if inputs.lateral_line_load_plf is not None:
+        H_post = float(inputs.lateral_line_load_plf) * float(inputs.span_ft) / 2.0
+    elif inputs.wind_wall_psf and inputs.exposed_height_ft:
+        H_post = float(inputs.wind_wall_psf) * float(inputs.exposed_height_ft) * float(inputs.span_ft) / 2.0
+    else:
+        H_post = 0.0
+    if inputs.roof_uplift_psf and inputs.uplift_area_per_post_ft2:
+        U_post = float(inputs.roof_uplift_psf) * float(inputs.uplift_area_per_post_ft2)
+    else:
+        U_post = 0.0
+    return V_struct, H_post, U_post
+
+def footing_params(inputs: Inputs) -> Dict[str, float]:
+    """Site/soil parameters with the same defaults footing_checks applies."""
+    return dict(
+        Dcov_in=float(inputs.footing_depth_below_grade_in or 0.0),
+        gamma_soil=float(inputs.soil_unit_weight_pcf or 120.0),
+        gamma_conc=float(inputs.concrete_unit_weight_pcf or 150.0),
+        include_overburden=_bool_from_yesno(inputs.include_soil_overburden),
+        q_allow=float(inputs.soil_bearing_capacity_psf or 0.0),
+        SF_bearing=float(inputs.SF_bearing or 1.0),
+        mu=float(inputs.base_friction_coeff_mu or 0.5),
+        SF_sliding=float(inputs.SF_sliding or 1.5),
+        SF_uplift=float(inputs.SF_uplift or 1.5),
+        credit=float(inputs.credit_connector_uplift_lb or 0.0),
+    )
+
+def footing_pass_batch(V_struct, H_post, U_post, L_in, W_in, T_in, Dcov_in, gamma_soil, gamma_conc,
+                       include_overburden, q_allow, SF_bearing, mu, SF_sliding, SF_uplift, credit):
+    """
+    Vectorized bearing / sliding / uplift flags, arithmetic identical to footing_checks.
+    All arguments broadcast (e.g. posts × trial sizes). Returns (bearing_ok, sliding_ok, uplift_ok).
+    """
+    import numpy as np
+    L_ft, W_ft, T_ft = L_in / 12.0, W_in / 12.0, T_in / 12.0
+    A_ft2 = L_ft * W_ft
+    W_footing = L_ft * W_ft * T_ft * gamma_conc
+    W_overburden = np.where(include_overburden, A_ft2 * (Dcov_in / 12.0) * gamma_soil, 0.0)
+    V_eff = V_struct + W_footing + W_overburden
+    q_actual = V_struct / np.maximum(A_ft2, 1e-9)
+    bearing_ok = q_actual <= q_allow / np.maximum(SF_bearing, 1e-9)
+    sliding_ok = H_post <= (mu * V_eff) / np.maximum(SF_sliding, 1e-9)
+    uplift_ok = U_post <= (W_footing + W_overburden + credit) / np.maximum(SF_uplift, 1e-9)
+    return bearing_ok, sliding_ok, uplift_ok
+
+def size_footings_batch(V_struct, H_post, U_post, Dcov_in, gamma_soil, gamma_conc, include_overburden,
+                        q_allow, SF_bearing, mu, SF_sliding, SF_uplift, credit,
+                        plan_sizes_in=DEFAULT_PLAN_SIZES_IN, thicknesses_in=DEFAULT_THICKNESSES_IN):
+    """
+    Smallest square footing per post (arrays, one element per post).
+
+    Bearing depends only on plan area and uplift/sliding only on footing (+ overburden) weight,
+    so for every allowed thickness the minimum area is closed form:
+        bearing: A ≥ V·SF_b / q_allow
+        uplift:  A·(T·γc + D·γs) ≥ U·SF_u − credit
+        sliding: A·(T·γc + D·γs) ≥ H·SF_s/μ − V
+    Each bound is snapped up to the allowed plan sizes and confirmed with footing_pass_batch.
+    The least concrete volume wins (ties -> smaller plan). Returns (side_in, thickness_in),
+    NaN where nothing in the allowed sizes passes.
+    """
+    import numpy as np
+    V, H, U = (np.asarray(x, dtype=float)[:, None] for x in np.broadcast_arrays(V_struct, H_post, U_post))
+    p = {k: np.asarray(v, dtype=float if k != "include_overburden" else bool)[..., None] if np.ndim(v) else v
+         for k, v in dict(Dcov_in=Dcov_in, gamma_soil=gamma_soil, gamma_conc=gamma_conc,
+                          include_overburden=include_overburden, q_allow=q_allow, SF_bearing=SF_bearing,
+                          mu=mu, SF_sliding=SF_sliding, SF_uplift=SF_uplift, credit=credit).items()}
+    plan = np.sort(np.asarray(plan_sizes_in, dtype=float))
+    T = np.asarray(thicknesses_in, dtype=float)[None, :]                  # (1,k)
+
+    # weight per ft² of plan for each thickness
+    w_psf = (T / 12.0) * p["gamma_conc"] + np.where(p["include_overburden"], (p["Dcov_in"] / 12.0) * p["gamma_soil"], 0.0)
+    q_eff = p["q_allow"] / np.maximum(p["SF_bearing"], 1e-9)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        A_bear = np.where(V > 0, V / q_eff, 0.0)
+        A_upl = np.where(w_psf > 0, (U * np.maximum(p["SF_uplift"], 1e-9) - p["credit"]) / w_psf,
+                         np.where(U * p["SF_uplift"] - p["credit"] > 0, np.inf, 0.0))
+        slide_need = H * np.maximum(p["SF_sliding"], 1e-9) / p["mu"] - V
+        A_sld = np.where(w_psf > 0, slide_need / w_psf, np.where(slide_need > 0, np.inf, 0.0))
+    A_min = np.maximum(np.maximum(A_bear, A_upl), np.maximum(A_sld, 0.0))   # (n,k) ft²
+    A_min = np.nan_to_num(A_min, nan=np.inf)
+
+    side_min = np.sqrt(A_min) * 12.0
+    idx = np.searchsorted(plan, side_min, side="left")                       # (n,k)
+    # Confirm with the exact check arithmetic; bump one size where rounding made it fall short
+    for _ in range(2):
+        s = plan[np.minimum(idx, len(plan) - 1)]
+        ok = np.all(footing_pass_batch(V, H, U, s, s, T, **p), axis=0) & (idx < len(plan))
+        idx = np.where(ok | (idx >= len(plan)), idx, idx + 1)
+    s = plan[np.minimum(idx, len(plan) - 1)]
+    ok = np.all(footing_pass_batch(V, H, U, s, s, T, **p), axis=0) & (idx < len(plan))
+
+    vol = np.where(ok, s * s * T, np.inf)
+    key = vol + 1e-9 * s                                                    # tie-break on plan size
+    best = key.argmin(1)
+    rows = np.arange(len(best))
+    found = ok[rows, best]
+    side = np.where(found, s[rows, best], np.nan)
+    thick = np.where(found, np.broadcast_to(T, s.shape)[rows, best], np.nan)
+    return side, thick
+
+def size_footing(inputs: Inputs, beam_results: Results, plan_sizes_in=DEFAULT_PLAN_SIZES_IN,
+                 thicknesses_in=DEFAULT_THICKNESSES_IN) -> Optional[FootingSize]:
+    """Smallest square footing from the allowed sizes that passes bearing, sliding and uplift."""
+    V, H, U = footing_demands(inputs, beam_results)
+    side, thick = size_footings_batch([V], [H], [U], plan_sizes_in=plan_sizes_in,
+                                      thicknesses_in=thicknesses_in, **footing_params(inputs))
+    if math.isnan(side[0]):
+        return None
+    s, t = float(side[0]), float(thick[0])
+    sized = replace(inputs, footing_length_in=s, footing_width_in=s, footing_thickness_in=t)
+    return FootingSize(length_in=s, width_in=s, thickness_in=t, checks=footing_checks(sized, beam_results))
+
+def size_footings(inputs_list: List[Inputs], results_list: List[Results], plan_sizes_in=DEFAULT_PLAN_SIZES_IN,
+                  thicknesses_in=DEFAULT_THICKNESSES_IN):
+    """Vectorized sizing for many posts; returns (side_in, thickness_in) arrays (NaN = no fit)."""
+    import numpy as np
+    dem = np.array([footing_demands(i, r) for i, r in zip(inputs_list, results_list)], dtype=float).reshape(-1, 3)
+    params = [footing_params(i) for i in inputs_list]
+    cols = {k: np.array([p[k] for p in params]) for k in (params[0] if params else {})}
+    if not params:
+        return np.array([]), np.array([])
+    return size_footings_batch(dem[:, 0], dem[:, 1], dem[:, 2], plan_sizes_in=plan_sizes_in,
+                               thicknesses_in=thicknesses_in, **cols)
+
+def evaluate_footing(inputs: Inputs, beam_results: Results, log: bool = True):
+    """Option 1: check the given L×W×T; Option 2 (any of them blank): size it. Returns (FootingSize|None, FootingChecks)."""
+    if inputs.footing_length_in and inputs.footing_width_in and inputs.footing_thickness_in:
+        return None, footing_checks(inputs, beam_results, log=log)
+    fsize = size_footing(inputs, beam_results)
+    return fsize, (fsize.checks if fsize else footing_checks(inputs, beam_results, log=log))
@@ -0,0 +1,150 @@
+# src/graph.py
+# Incremental recalculation: beam -> (connectors, footing) as a small dependency graph.
+#
+# Each stage knows which Inputs fields it reads (collected from the source of its functions,
+# so the lists cannot drift from the code). On a re-run only stages whose fields, upstream
+# output or connector catalog changed are recomputed; the rest are reused from the last run
+# of the same workbook. The last run is kept in memory and, when the ResultCache has a disk
+# store, on disk too, so the one-process-per-click macro benefits as well.
+import os
+import ast
+from functools import lru_cache
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .models import Inputs
+from .calc import calc
+from .report import ResultsGrid
+from .connectors import (ConnectorCatalog, compute_connection_demands, select_connectors_batch,
+                         select_or_verify_connectors)
+from .footing import footing_checks, footing_demands, footing_params, size_footing, evaluate_footing
+from .cache import ResultCache, stable_hash
+from . import timing
+
+ALL_FIELDS: FrozenSet[str] = frozenset(f.name for f in fields(Inputs))
+MAX_CATALOGS = 4            # indexed connector catalogs kept in a caller's map (one per distinct spec table)
+
+@lru_cache(maxsize=None)
+def _module_functions(path: str) -> Dict[str, ast.AST]:
+    # One parse per source file (getsource per function re-tokenizes the whole file each time)
+    with open(path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    return {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+
+def fields_read(*funcs: Callable) -> FrozenSet[str]:
+    """Inputs fields read as `inputs.<name>` in the given functions (all fields if source is unavailable)."""
+    names = set()
+    for fn in funcs:
+        try:
+            node = _module_functions(fn.__code__.co_filename)[fn.__name__]
+        except (OSError, KeyError, AttributeError, SyntaxError):
+            return ALL_FIELDS
+        for n in ast.walk(node):
+            if isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name) and n.value.id == "inputs":
+                names.add(n.attr)
+    return frozenset(names & ALL_FIELDS)
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    fields: FrozenSet[str]
+    upstream: Tuple[str, ...] = ()
+    uses_catalog: bool = False
+
+@lru_cache(maxsize=None)
+def stages() -> Tuple[Stage, ...]:
+    # Built on first use: parsing the sources is not paid by a plain `import src.main`
+    return (
+        Stage("beam", fields_read(calc)),
+        Stage("connectors", fields_read(compute_connection_demands, select_connectors_batch, select_or_verify_connectors),
+              upstream=("beam",), uses_catalog=True),
+        Stage("footing", fields_read(footing_checks, footing_demands, footing_params, size_footing, evaluate_footing),
+              upstream=("beam",)),
+    )
+
+@dataclass
+class GraphState:
+    values: Dict[str, Any]                                    # Inputs field -> value at the last run
+    catalog: str                                              # digest of the connector specs
+    outputs: Dict[str, Any] = field(default_factory=dict)     # stage -> output
+    digests: Dict[str, str] = field(default_factory=dict)     # stage -> digest of its output
+    grid: Optional[ResultsGrid] = None                        # Results sheet as last written
+    sheet_stamp: Any = None                                   # backend's results_stamp() right after that write
+
+class RecalcGraph:
+    def __init__(self, cache: Optional[ResultCache] = None):
+        self.cache = cache
+        self._states: Dict[str, GraphState] = {}
+
+    def _state_key(self, wb_path: str) -> str:
+        return stable_hash("graph-state", os.path.abspath(wb_path))
+
+    def state(self, wb_path: str) -> Optional[GraphState]:
+        st = self._states.get(os.path.abspath(wb_path))
+        if st is None and self.cache is not None:
+            st = self.cache.get(self._state_key(wb_path))
+        return st
+
+    def save(self, wb_path: str, st: GraphState):
+        self._states[os.path.abspath(wb_path)] = st
+        if self.cache is not None:
+            self.cache.put(self._state_key(wb_path), st)
+
+    def _compute(self, stage: Stage, inputs: Inputs, out: Dict[str, Any], top_specs, base_specs,
+                 catalog: Optional[ConnectorCatalog] = None):
+        if stage.name == "beam":
+            return calc(inputs)
+        results = out["beam"]
+        if stage.name == "connectors":
+            demands = compute_connection_demands(inputs, results)
+            return select_or_verify_connectors(inputs, demands, top_specs, base_specs, catalog=catalog)
+        return evaluate_footing(inputs, results)
+
+    @staticmethod
+    def _indexed(catalogs: Optional[Dict[str, ConnectorCatalog]], digest: str, top_specs, base_specs):
+        # Caller-owned digest -> ConnectorCatalog map (the server's), so the specs are indexed once
+        if catalogs is None:
+            return None
+        cat = catalogs.get(digest)
+        if cat is None:
+            while len(catalogs) >= MAX_CATALOGS:
+                catalogs.pop(next(iter(catalogs)))
+            cat = catalogs[digest] = ConnectorCatalog(top_specs, base_specs)
+        return cat
+
+    def evaluate(self, wb_path: str, inputs: Inputs, top_specs, base_specs,
+                 catalogs: Optional[Dict[str, ConnectorCatalog]] = None) -> Tuple[GraphState, List[str]]:
+        """
+        Bring every stage up to date for these inputs; returns the new state and the stages recomputed.
+        catalogs: digest of the specs -> indexed ConnectorCatalog, kept by the caller between runs.
+        """
+        values = {name: getattr(inputs, name) for name in ALL_FIELDS}
+        catalog = stable_hash(list(top_specs), list(base_specs))
+        old = self.state(wb_path)
+        changed = set(ALL_FIELDS) if old is None else {k for k, v in values.items() if old.values.get(k) != v}
+        new = GraphState(values, catalog, grid=old.grid if old else None,
+                         sheet_stamp=old.sheet_stamp if old else None)
+        moved = set()                                         # stages whose output differs from last run
+        dirty: List[str] = []
+        for stage in stages():
+            stale = (old is None or stage.name not in old.outputs or bool(changed & stage.fields)
+                     or any(u in moved for u in stage.upstream)
+                     or (stage.uses_catalog and catalog != old.catalog))
+            if not stale:
+                new.outputs[stage.name] = old.outputs[stage.name]
+                new.digests[stage.name] = old.digests[stage.name]
+                continue
+            dirty.append(stage.name)
+            # Content key covers only what the stage depends on, so unrelated edits still hit the cache
+            key = stable_hash(stage.name, {k: values[k] for k in sorted(stage.fields)},
+                              [new.digests[u] for u in stage.upstream], catalog if stage.uses_catalog else None)
+            compute = lambda: self._compute(stage, inputs, new.outputs, top_specs, base_specs,
+                                            self._indexed(catalogs, catalog, top_specs, base_specs)
+                                            if stage.uses_catalog else None)
+            with timing.span(f"stage.{stage.name}"):
+                value = compute() if self.cache is None else self.cache.memo(key, compute)
+            new.outputs[stage.name] = value
+            new.digests[stage.name] = stable_hash(value)
+            if old is None or old.digests.get(stage.name) != new.digests[stage.name]:
+                moved.add(stage.name)
+        return new, dirty
@@ -0,0 +1,190 @@
+# src/inverse.py
+# Inverse capacity: the value of SL_psf, span_ft, tributary_width_ft or beam_d_in at which each
+# check reaches its limit, solved in closed form for whole arrays of designs (no bisection).
+#
+#   lim = solve_limits(inputs_list, "span_ft")
+#   lim.limit, lim.governing_names()            # longest passing span, check that sets it
+#   python -m src.inverse Deck_Screening_Template.xlsm
+#
+# With everything else fixed, each utilization u (demand / capacity, as in calc and
+# footing_checks) is a power law in the target: bending ∝ w L² / (b d²), shear ∝ w L / (b d),
+# bearing and column ∝ R = w L / 2, deflection / (L / ratio) ∝ w L³ / (E b d³), where
+# w = (DL + SL + LL) × trib. So x_limit = x × u^(-1/p), and for SL_psf the limit is where
+# q = DL + SL + LL reaches q / u. Footing bearing is affine in R (post self weight is added);
+# footing uplift depends on none of the targets.
+#
+# Limits are exact up to rounding (u = 1 within a few ulps). inf: the check does not constrain
+# the target, or is not evaluated (column without Fc_axis_prime / post section, footing checks
+# without a given footing size). NaN: the check fails whatever the target. beam_d_in limits are
+# minimum depths; the others are maxima. SL_psf limits are negative when dead + live load
+# alone already fail the check.
+import sys
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .models import Inputs
+from .batch import BATCH_FIELDS, calc_batch, inputs_to_columns
+from .combinations import _given, _or
+from .footing import footing_params
+
+TARGETS = ("SL_psf", "span_ft", "tributary_width_ft", "beam_d_in")
+CHECKS = ("bending", "shear", "bearing", "deflection", "column", "footing_bearing", "footing_uplift")
+
+# Exponent of each beam/post utilization in (span_ft, tributary_width_ft, beam_d_in); all are ∝ q
+_EXPONENTS = {
+    "bending": (2, 1, -2),
+    "shear": (1, 1, -1),
+    "bearing": (1, 1, 0),
+    "deflection": (3, 1, -3),
+    "column": (1, 1, 0),
+}
+
+_FIELDS = BATCH_FIELDS + ["post_self_weight_lb", "roof_uplift_psf", "uplift_area_per_post_ft2",
+                          "footing_length_in", "footing_width_in", "footing_thickness_in"]
+
+# footing_params keys used here, with footing_params' defaults for column input that omits them
+_FOOTING_DEFAULTS = dict(Dcov_in=0.0, gamma_soil=120.0, gamma_conc=150.0, include_overburden=0.0,
+                         q_allow=0.0, SF_bearing=1.0, SF_uplift=1.5, credit=0.0)
+
+@dataclass
+class InverseResult:
+    target: str
+    current: np.ndarray                 # (designs,) target value as given
+    utilization: Dict[str, np.ndarray]  # check -> (designs,) at the current value (0 where not evaluated)
+    limits: Dict[str, np.ndarray]       # check -> (designs,) target value where that check reaches 1
+    limit: np.ndarray                   # governing limit (max allowed; min required for beam_d_in)
+    governing: np.ndarray               # index into CHECKS, -1 where nothing constrains the target
+    checks: Tuple[str, ...] = field(default=CHECKS)
+
+    def governing_names(self) -> np.ndarray:
+        names = np.asarray(self.checks + ("-",), dtype=object)
+        return names[self.governing]
+
+# ---------------- utilizations ----------------
+
+def _columns(designs) -> Dict[str, np.ndarray]:
+    if isinstance(designs, Mapping):
+        cols = {**_FOOTING_DEFAULTS, **{k: np.nan for k in _FIELDS if k not in BATCH_FIELDS}, **designs}
+    else:
+        cols = inputs_to_columns(designs, _FIELDS)
+        params = [footing_params(x) for x in designs]
+        cols.update({k: [p[k] for p in params] for k in _FOOTING_DEFAULTS})
+    return {k: np.atleast_1d(np.asarray(v, dtype=bool if k.startswith("has_") else float))
+            for k, v in cols.items()}
+
+def _state(cols: Dict[str, np.ndarray]):
+    # Utilizations plus the footing terms the limits need
+    beam = calc_batch(**{k: cols[k] for k in BATCH_FIELDS if k in cols})
+    n = len(beam)
+    full = lambda a: np.broadcast_to(a, (n,))
+    c = {k: full(v) for k, v in cols.items()}
+    R = beam.reaction_per_post_lb
+
+    # Footing as footing_checks, where a size is given (Option 1)
+    given = _given(c["footing_length_in"]) & _given(c["footing_width_in"]) & _given(c["footing_thickness_in"])
+    L_ft, W_ft, T_ft = c["footing_length_in"] / 12.0, c["footing_width_in"] / 12.0, c["footing_thickness_in"] / 12.0
+    A_ft2 = L_ft * W_ft
+    W_footing = L_ft * W_ft * T_ft * c["gamma_conc"]
+    W_overburden = np.where(c["include_overburden"] != 0, A_ft2 * (c["Dcov_in"] / 12.0) * c["gamma_soil"], 0.0)
+    W_post = _or(c["post_self_weight_lb"], 0.0)
+    V_allow = np.maximum(A_ft2, 1e-9) * (c["q_allow"] / np.maximum(c["SF_bearing"], 1e-9))
+    U = np.where(_given(c["roof_uplift_psf"]) & _given(c["uplift_area_per_post_ft2"]),
+                 c["roof_uplift_psf"] * c["uplift_area_per_post_ft2"], 0.0)
+    R_uplift = (W_footing + W_overburden + c["credit"]) / np.maximum(c["SF_uplift"], 1e-9)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        util = {
+            "bending": beam.bending_stress_psi / c["Fb_prime"],
+            "shear": beam.shear_stress_psi / c["Fv_prime"],
+            "bearing": beam.bearing_stress_psi / c["Fc_perp_prime"],
+            "deflection": beam.deflection_in / beam.deflection_limit_in,
+            "column": np.where(beam.column_checked, R / beam.column_allowable_axial_lb, 0.0),
+            "footing_bearing": np.where(given, (R + W_post) / V_allow, 0.0),
+            "footing_uplift": np.where(given & (U > 0), U / R_uplift, 0.0),
+        }
+    return c, util, R, np.where(given, V_allow - W_post, np.inf)
+
+def _root(u: np.ndarray, p: int) -> np.ndarray:
+    return {1: u, 2: np.sqrt(u), 3: np.cbrt(u)}[p]
+
+def _limits(target: str, c, util, R, R_allow) -> Dict[str, np.ndarray]:
+    q = c["DL_psf"] + c["SL_psf"] + c["LL_psf"]
+    out = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for name in CHECKS:
+            u = util[name]
+            if target == "SL_psf" and name in _EXPONENTS:
+                v = np.where(u > 0, q / u, np.inf) - c["DL_psf"] - c["LL_psf"]
+            elif target == "SL_psf" and name == "footing_bearing":
+                # R = q × trib × span / 2 and the footing takes R + post self weight
+                q_lim = R_allow / (c["tributary_width_ft"] * c["span_ft"] / 2.0)
+                v = np.where(np.isinf(R_allow), np.inf, q_lim - c["DL_psf"] - c["LL_psf"])
+            elif name in _EXPONENTS and _EXPONENTS[name][TARGETS.index(target) - 1]:
+                x, p = c[target], _EXPONENTS[name][TARGETS.index(target) - 1]
+                v = np.where(u > 0, x / _root(u, p) if p > 0 else x * _root(u, -p), np.inf if p > 0 else 0.0)
+            elif name == "footing_bearing" and target != "beam_d_in":
+                # R ∝ span and ∝ trib
+                x = c[target]
+                v = np.where(np.isinf(R_allow), np.inf,
+                             np.where(R_allow >= 0, np.where(R > 0, x * R_allow / R, np.inf), np.nan))
+            else:
+                # Independent of the target: unconstrained if passing, no solution if failing
+                v = np.where(u <= 1.0, np.inf if target != "beam_d_in" else 0.0, np.nan)
+            out[name] = v
+    return out
+
+# ---------------- solving ----------------
+
+def _result(target: str, c, util, R, R_allow) -> InverseResult:
+    if target not in TARGETS:
+        raise ValueError(f"Unknown target '{target}' (choose from {', '.join(TARGETS)}).")
+    limits = _limits(target, c, util, R, R_allow)
+    stack = np.stack([limits[k] for k in CHECKS])
+    if target == "beam_d_in":
+        limit, idx, free = stack.max(0), stack.argmax(0), 0.0
+    else:
+        limit, idx, free = stack.min(0), stack.argmin(0), np.inf
+    return InverseResult(target=target, current=np.array(c[target], dtype=float), utilization=util,
+                         limits=limits, limit=limit, governing=np.where(limit == free, -1, idx))
+
+def solve_limits(designs, target: str = "span_ft") -> InverseResult:
+    """
+    Limiting value of one target per design. designs: a list of Inputs, or a dict of columns
+    named as the Inputs fields plus the footing_params keys (same form as combination_envelope).
+    """
+    return _result(target, *_state(_columns(designs)))
+
+def solve_all(designs, targets: Sequence[str] = TARGETS) -> Dict[str, InverseResult]:
+    """solve_limits for several targets, sharing one calc_batch pass."""
+    state = _state(_columns(designs))
+    return {t: _result(t, *state) for t in targets}
+
+def limit_table(inputs: Inputs) -> List[Tuple[str, float, float, str]]:
+    """(target, current value, limit, governing check) rows for one design."""
+    return [(t, float(r.current[0]), float(r.limit[0]), str(r.governing_names()[0]))
+            for t, r in solve_all([inputs]).items()]
+
+def format_limits(results: Dict[str, InverseResult], i: int = 0) -> List[str]:
+    lines = [f"{'':<18}" + "".join(f"{t:>20}" for t in results),
+             f"{'current':<18}" + "".join(f"{r.current[i]:>20.4g}" for r in results.values())]
+    for k in CHECKS:
+        lines.append(f"{k:<18}" + "".join(f"{r.limits[k][i]:>20.4g}" for r in results.values()))
+    lines.append(f"{'limit':<18}" + "".join(f"{r.limit[i]:>20.4g}" for r in results.values()))
+    lines.append(f"{'governs':<18}" + "".join(f"{r.governing_names()[i]:>20}" for r in results.values()))
+    return lines
+
+def cli(argv=None) -> int:
+    from .main import BACKENDS, load_backend
+    ap = argparse.ArgumentParser(description="Limiting snow load, span, tributary width and beam depth per check.")
+    ap.add_argument("xlsx")
+    ap.add_argument("--backend", choices=sorted(BACKENDS), default="openpyxl")
+    args = ap.parse_args(argv)
+    inputs = load_backend(args.backend).read_inputs(args.xlsx)
+    print("\n".join(format_limits(solve_all([inputs]))))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
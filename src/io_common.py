@@ -0,0 +1,48 @@
+# src/io_common.py
+# Backend-independent parsing shared by io_xlwings and io_openpyxl:
+# both backends fetch raw cell blocks and hand them to these helpers.
+from typing import Dict, Any, Tuple, List, Iterable, Sequence
+from .models import Inputs
+from .connectors import ConnectorSpecTop, ConnectorSpecBase
+from .schema import SCHEMA, YESNO, _yn
+
+# Inputs sheet labels are the Inputs field names, in order (parse rules: src/schema.py)
+LABELS = list(SCHEMA.labels)
+
+def inputs_dict_from_rows(rows: Iterable[Sequence[Any]]) -> Dict[str, Any]:
+    # rows = [(label, value), ...] from columns A:B of the Inputs sheet
+    data = {}
+    for row in rows:
+        if not row: continue
+        label = row[0]
+        if label in LABELS:
+            data[label] = row[1] if len(row) > 1 else None
+    return data
+
+def inputs_from_dict(d: Dict[str, Any]) -> Inputs:
+    """Inputs from the sheet's label -> value dict; raises InputsParseError listing every bad cell."""
+    return SCHEMA.parse(d)
+
+def connectors_from_rows(rows: Iterable[Sequence[Any]]) -> Tuple[List[ConnectorSpecTop], List[ConnectorSpecBase]]:
+    # rows = columns A:F of the Connectors sheet, starting below the header row
+    tops, bases = [], []
+    for row in rows:
+        if not row or not row[0]: continue
+        row = list(row) + [None] * (6 - len(row))
+        typ = str(row[0]).strip().lower()
+        if typ == "top":
+            tops.append(ConnectorSpecTop(
+                model=str(row[1]),
+                allowable_download_lb=float(row[2] or 0),
+                allowable_uplift_lb=float(row[3] or 0),
+                allowable_lateral_lb=float(row[4] or 0),
+                allowable_moment_lb_in=float(row[5] or 0)
+            ))
+        elif typ == "base":
+            # base table is 4 cols; row[4], row[5] may be None
+            bases.append(ConnectorSpecBase(
+                model=str(row[1]),
+                allowable_shear_lb=float(row[2] or 0),
+                allowable_uplift_lb=float(row[3] or 0)
+            ))
+    return tops, bases
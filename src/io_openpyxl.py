@@ -0,0 +1,119 @@
+# src/io_openpyxl.py
+# Headless I/O backend: reads/writes the .xlsm file directly with openpyxl (no Excel needed).
+# Same function names and return types as io_xlwings, so main can use either one.
+#
+# Note: openpyxl does not evaluate formulas. Inputs computed by formulas are read from the
+# values Excel cached at its last save, and any workbook saved by openpyxl loses those cached
+# values. So results are never written back into the source workbook: they go to a sidecar
+# "<name>_results.xlsx" (see results_path), and the project file stays readable headlessly.
+import os
+from typing import Dict, Any, Tuple, List
+import openpyxl
+from openpyxl.styles import Font
+from .models import Inputs
+from .connectors import ConnectorSpecTop, ConnectorSpecBase
+from .io_common import inputs_dict_from_rows, inputs_from_dict, connectors_from_rows
+from . import timing
+
+_BOLD = Font(bold=True)
+
+_ROWS: Dict[str, Any] = {}     # abspath -> (stamp, {"Inputs": rows, "Connectors": rows})
+_BOOKS: Dict[str, Any] = {}    # abspath -> writable workbook (until save_book)
+
+def _stamp(path: str):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _sheet_rows(wb_path: str, sheet: str) -> List[tuple]:
+    # Load the workbook once (read-only, cached values) and pull both input sheets in one pass each
+    abspath = os.path.abspath(wb_path)
+    stamp = _stamp(abspath)
+    cached = _ROWS.get(abspath)
+    if cached is None or cached[0] != stamp:
+        wb = openpyxl.load_workbook(abspath, read_only=True, data_only=True)
+        try:
+            rows = {
+                "Inputs": list(wb["Inputs"].iter_rows(min_col=1, max_col=2, values_only=True)),
+                "Connectors": list(wb["Connectors"].iter_rows(min_row=2, min_col=1, max_col=6, values_only=True)),
+            }
+        finally:
+            wb.close()
+        cached = _ROWS[abspath] = (stamp, rows)
+        timing.add("rows", sum(len(r) for r in rows.values()))
+    return cached[1][sheet]
+
+@timing.timed("io_openpyxl.read_inputs")
+def read_inputs(wb_path: str) -> Inputs:
+    return inputs_from_dict(inputs_dict_from_rows(_sheet_rows(wb_path, "Inputs")))
+
+@timing.timed("io_openpyxl.read_connectors")
+def read_connectors(wb_path: str) -> Tuple[List[ConnectorSpecTop], List[ConnectorSpecBase]]:
+    return connectors_from_rows(_sheet_rows(wb_path, "Connectors"))
+
+# ---------------- writers ----------------
+
+RESULTS_SUFFIX = "_results.xlsx"
+
+def results_path(wb_path: str) -> str:
+    stem, _ = os.path.splitext(os.path.abspath(wb_path))
+    return stem + RESULTS_SUFFIX
+
+@timing.timed("io_openpyxl.results_stamp")
+def results_stamp(wb_path: str):
+    """(mtime, size) of the sidecar as it is on disk now, or None when it does not exist."""
+    try:
+        return _stamp(results_path(wb_path))
+    except OSError:
+        return None
+
+def _get_book(wb_path: str):
+    # Writers fill a fresh workbook with a single Results sheet until save_book
+    abspath = os.path.abspath(wb_path)
+    wb = _BOOKS.get(abspath)
+    if wb is None:
+        wb = openpyxl.Workbook()
+        wb.active.title = "Results"
+        _BOOKS[abspath] = wb
+    return wb
+
+@timing.timed("io_openpyxl.save_book")
+def save_book(wb_path: str):
+    wb = _BOOKS.pop(os.path.abspath(wb_path), None)
+    if wb is not None:
+        wb.save(results_path(wb_path))
+
+def _put(ws, r: int, values, bold: bool = False):
+    for j, v in enumerate(values, start=1):
+        c = ws.cell(row=r, column=j, value=v)
+        if bold: c.font = _BOLD
+
+def _clear_contents(ws):
+    for row in ws.iter_rows():
+        for c in row:
+            c.value = None
+
+def _autofit(ws):
+    # openpyxl cannot measure text; approximate Excel's autofit from the longest value per column
+    widths: Dict[str, int] = {}
+    for row in ws.iter_rows():
+        for c in row:
+            if c.value is not None:
+                widths[c.column_letter] = max(widths.get(c.column_letter, 0), len(str(c.value)))
+    for col, n in widths.items():
+        ws.column_dimensions[col].width = min(n + 2, 120)
+
+@timing.timed("io_openpyxl.write_results_grid")
+def write_results_grid(wb_path: str, grid, previous=None):
+    # The sidecar file is rewritten whole on save, so `previous` (used by io_xlwings) is ignored
+    ws = _get_book(wb_path)["Results"]
+    _clear_contents(ws)
+    for row in ws.iter_rows():
+        for c in row:
+            if c.font.bold: c.font = Font(bold=False)
+    for i, row in enumerate(grid.rows, start=1):
+        _put(ws, i, row)
+    for r, c, nr, nc in grid.bold:
+        for rr in range(r, r + nr):
+            for cc in range(c, c + nc):
+                ws.cell(row=rr, column=cc).font = _BOLD
+    _autofit(ws)
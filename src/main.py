@@ -1,40 +1,91 @@
 # src/main.py
+import os
 import sys
-from .io_xlwings import read_inputs, write_results, read_connectors, write_connector_results, write_footing_results
-from .calc import calc
-from .report import summary_table, calc_log_lines
-from .connectors import compute_connection_demands, select_or_verify_connectors
-from .footing import footing_checks
-
-def main(xlsx_path: str):
-    inputs = read_inputs(xlsx_path)
-    results = calc(inputs)
-
-    # 1) Primary results
-    summary = summary_table(results)
-    log = calc_log_lines(results)
-    write_results(xlsx_path, summary, log)
-
-    # 2) Connector selection
-    top_specs, base_specs = read_connectors(xlsx_path)
-    demands = compute_connection_demands(inputs, results)
-    selection = select_or_verify_connectors(inputs, demands, top_specs, base_specs)
-
-    r = write_connector_results(
-        xlsx_path,
-        selection.top_model,
-        selection.base_model,
-        selection.top_checks,
-        selection.base_checks,
-        start_row=50
-    )
-
-    # 3) Footing checks (Option 1: evaluate given size)
-    fchk = footing_checks(inputs, results)
-    write_footing_results(xlsx_path, fchk, start_row=r + 2)
-
-    
+import argparse
+import importlib
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from .models import Inputs, Results
+from .report import results_grid
+from .connectors import ConnectionSelection, ConnectorCatalog
+from .footing import FootingChecks, FootingSize
+from .cache import ResultCache, default_cache
+from .graph import RecalcGraph
+from . import timing
+
+# I/O backends: "xlwings" drives a live Excel, "openpyxl" reads/writes the file headlessly
+BACKENDS = {"xlwings": "io_xlwings", "openpyxl": "io_openpyxl"}
+
+def load_backend(name: str):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown I/O backend '{name}' (choose from {', '.join(BACKENDS)}).")
+    return importlib.import_module(f".{BACKENDS[name]}", __package__)
+
+@dataclass
+class RunOutcome:
+    inputs: Inputs
+    results: Results
+    selection: ConnectionSelection
+    footing: FootingChecks
+    footing_size: Optional[FootingSize] = None
+    recomputed: Tuple[str, ...] = ()        # graph stages that were actually re-run
+
+def run(xlsx_path: str, backend: str = "xlwings", write: bool = True,
+        cache: Optional[ResultCache] = None, graph: Optional[RecalcGraph] = None,
+        catalogs: Optional[Dict[str, ConnectorCatalog]] = None) -> RunOutcome:
+    with timing.span("run", file=os.path.basename(xlsx_path), backend=backend) as sp:
+        with timing.span("load_backend"):
+            io = load_backend(backend)
+        with timing.span("read_inputs"):
+            inputs = io.read_inputs(xlsx_path)
+        with timing.span("read_connectors"):
+            top_specs, base_specs = io.read_connectors(xlsx_path)
+
+        # 1) beam -> connector selection / footing checks; only stages touched by changed inputs re-run
+        graph = graph or RecalcGraph(cache)
+        with timing.span("evaluate") as ev:
+            state, dirty = graph.evaluate(xlsx_path, inputs, top_specs, base_specs, catalogs)
+            ev.set("recomputed", dirty)
+        results, selection = state.outputs["beam"], state.outputs["connectors"]
+        fsize, fchk = state.outputs["footing"]
+
+        # 2) Results sheet: laid out in memory; only rows that differ from the last write are pushed.
+        #    The last grid is trusted only while the sheet still carries the stamp of that write
+        #    (sidecar deleted, workbook closed unsaved, Results edited by hand -> full rewrite).
+        if write:
+            with timing.span("sensitivity"):
+                from .sensitivity import top_drivers      # NumPy, loaded only when a sheet is written
+                drivers = top_drivers(inputs, fsize)
+            with timing.span("results_grid"):
+                grid = results_grid(results, selection, fchk, footing_size=fsize, drivers=drivers)
+            stamp = io.results_stamp(xlsx_path)
+            previous = state.grid if stamp is not None and stamp == state.sheet_stamp else None
+            sp.set("sheet_written", grid != previous)
+            if grid != previous:
+                with timing.span("write_results"):
+                    io.write_results_grid(xlsx_path, grid, previous=previous)
+                    io.save_book(xlsx_path)
+                state.grid, state.sheet_stamp = grid, io.results_stamp(xlsx_path)
+        graph.save(xlsx_path, state)
+    return RunOutcome(inputs, results, selection, fchk, fsize, tuple(dirty))
+
+def main(xlsx_path: str, backend: str = "xlwings", cache_dir: Optional[str] = None, use_cache: bool = True):
+    cache = None
+    if use_cache:
+        cache = ResultCache(disk_dir=cache_dir) if cache_dir else default_cache()
+    run(xlsx_path, backend, cache=cache)
+
 
 if __name__ == "__main__":
-    xlsx = sys.argv[1] if len(sys.argv) > 1 else r"excel\Deck_Screening_Template.xlsm"
-    main(xlsx)
+    ap = argparse.ArgumentParser(description="Deck cover screening checks for one workbook.")
+    ap.add_argument("xlsx", nargs="?", default=r"excel\Deck_Screening_Template.xlsm")
+    ap.add_argument("--backend", choices=sorted(BACKENDS), default="xlwings",
+                    help="xlwings = live Excel (default); openpyxl = read/write the file without Excel")
+    ap.add_argument("--cache-dir", default=None,
+                    help="keep results on disk between runs (default: $DECK_CACHE_DIR, else in-process only)")
+    ap.add_argument("--no-cache", action="store_true", help="always recompute and rewrite the Results sheet")
+    ap.add_argument("--no-timing", action="store_true", help="do not append stage timings to run_log.txt ($DECK_TIMING=0)")
+    args = ap.parse_args()
+    if args.no_timing:
+        timing.set_enabled(False)
+    main(args.xlsx, backend=args.backend, cache_dir=args.cache_dir, use_cache=not args.no_cache)
@@ -1,8 +1,9 @@
 # src/models.py
 from dataclasses import dataclass
 from typing import Optional, Dict, List
+from .calclog import CalcLog
 
-@dataclass
+@dataclass(slots=True)
 class Inputs:
     # Geometry
     span_ft: float
@@ -54,7 +55,7 @@ class Inputs:
     footing_depth_below_grade_in: Optional[float] = None
     post_self_weight_lb: Optional[float] = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class Results:
     # Beam
     line_load_plf: float
@@ -75,5 +76,5 @@ class Results:
     column_allowable_axial_lb: Optional[float]
     # Lateral
     lateral_warnings: Dict[str, bool]
-    # Log
-    calc_log: List[str]
+    # Log (structured records, rendered on demand)
+    calc_log: CalcLog
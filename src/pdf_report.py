@@ -0,0 +1,234 @@
+# src/pdf_report.py
+# Printable calc packages: one PDF page per design with the result summary, shear / moment /
+# deflection diagrams and a footing sketch.
+#
+#   render_pdf(inputs_list, "calc_package.pdf", labels=names, workers=4)
+#   python -m src.pdf_report Deck_Screening_Template.xlsm -o calc_package.pdf
+#   python -m src.pdf_report sweep.jsonl -o sweep.pdf -j 8          # JSONL / CSV jobs as in src/stream.py
+#
+# Rendering uses Matplotlib's Agg canvas without pyplot. The page (figure, axes, lines, patches,
+# text) is built once per process; each design only updates the artists' data and limits, and
+# the page is written straight into a PdfPages stream, so memory does not grow with the number
+# of designs. Text uses the PDF core fonts (no glyph embedding, about 3x faster per page), so
+# page text is limited to cp1252: Δ, ′ and the Unicode minus are spelled out. With workers > 1,
+# chunks of designs are rendered to part files by separate processes and joined with pypdf
+# (optional; without it rendering stays in one process).
+import os
+import sys
+import logging
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.patches import Polygon, Rectangle
+from matplotlib.ticker import MaxNLocator
+
+from .models import Inputs, Results
+from .calc import calc, pf
+from .footing import FootingChecks, FootingSize, evaluate_footing
+from .report import summary_table
+from . import timing
+
+PAGE_IN = (8.5, 11.0)
+_N = 81                                  # points per diagram
+_XI = np.linspace(0.0, 1.0, _N)
+_DEFL_SHAPE = 16.0 / 5.0 * (_XI - 2.0 * _XI ** 3 + _XI ** 4)     # 5wL⁴/384EI shape, 1 at midspan
+
+_RC = {"pdf.use14corefonts": True, "axes.unicode_minus": False}
+_ASCII = str.maketrans({"Δ": "", "′": "'", "—": "-"})
+
+# ---------------- page template ----------------
+
+class _Page:
+    """Figure with every artist created once; draw() only changes data, limits and text."""
+
+    def __init__(self):
+        self.fig = Figure(figsize=PAGE_IN)
+        FigureCanvasAgg(self.fig)
+        f = self.fig
+        self.title = f.text(0.06, 0.965, "", fontsize=14, weight="bold", va="top")
+        self.subtitle = f.text(0.06, 0.94, "", fontsize=9, va="top")
+        self.status = f.text(0.94, 0.965, "", fontsize=14, weight="bold", va="top", ha="right")
+        self.summary = f.text(0.06, 0.915, "", fontsize=7.5, family="monospace", va="top")
+        self.footer = f.text(0.5, 0.02, "Screening-level values; not a substitute for an engineer's sealed design.",
+                             fontsize=6.5, ha="center", color="0.4")
+
+        self.diagrams = []
+        for k, (name, unit, color) in enumerate((("Shear V", "lb", "tab:blue"), ("Moment M", "lb·ft", "tab:red"),
+                                                 ("Deflection", "in", "tab:green"))):
+            ax = f.add_axes((0.10, 0.455 - k * 0.15, 0.50, 0.11))
+            ax.axhline(0.0, color="0.3", lw=0.6)
+            fill = ax.add_patch(Polygon(np.zeros((2, 2)), closed=True, fc=color, alpha=0.25, lw=0))
+            line, = ax.plot([], [], color=color, lw=1.4)
+            label = ax.text(0.99, 0.93, "", transform=ax.transAxes, ha="right", va="top", fontsize=7)
+            ax.set_ylabel(f"{name} ({unit})", fontsize=7)
+            ax.tick_params(labelsize=6.5, labelbottom=k == 2)
+            ax.xaxis.set_major_locator(MaxNLocator(8))
+            ax.yaxis.set_major_locator(MaxNLocator(4))
+            ax.grid(True, lw=0.3, alpha=0.5)
+            self.diagrams.append((ax, line, fill, label))
+        self.diagrams[-1][0].set_xlabel("x (ft)", fontsize=7)
+        self.limit_line, = self.diagrams[2][0].plot([], [], color="0.3", lw=0.8, ls="--")
+
+        # Footing section: grade, footing, post stub (inches, origin at post centre / grade)
+        ax = self.sketch = f.add_axes((0.66, 0.155, 0.30, 0.41))
+        ax.set_aspect("equal", adjustable="box")
+        ax.set_axis_off()
+        self.sketch_title = ax.set_title("Footing (section)", fontsize=8)
+        self.grade, = ax.plot([], [], color="saddlebrown", lw=1.2)
+        self.soil = ax.add_patch(Rectangle((0, 0), 0, 0, fc="tan", alpha=0.35, lw=0))
+        self.footing = ax.add_patch(Rectangle((0, 0), 0, 0, fc="0.75", ec="0.2", lw=1.0, hatch="//"))
+        self.post = ax.add_patch(Rectangle((0, 0), 0, 0, fc="burlywood", ec="0.3", lw=0.8))
+        self.dims = ax.text(0.5, -0.02, "", transform=ax.transAxes, ha="center", va="top", fontsize=7,
+                            family="monospace")
+
+    # -- one design --
+
+    def draw(self, label: str, x: Inputs, res: Results, fsize: Optional[FootingSize], fchk: FootingChecks):
+        L, w = x.span_ft, res.line_load_plf
+        xs = _XI * L
+        V = w * (L / 2.0 - xs)
+        M = w * xs * (L - xs) / 2.0
+        D = -res.deflection_in * _DEFL_SHAPE
+        for (ax, line, fill, text), y, fmt in zip(self.diagrams, (V, M, D), ("{:,.0f} lb", "{:,.0f} lb·ft", "{:.3f} in")):
+            line.set_data(xs, y)
+            fill.set_xy(np.column_stack([np.r_[0.0, xs, L], np.r_[0.0, y, 0.0]]))
+            ext = max(float(np.abs(y).max()), 1e-9)
+            ax.set_xlim(0.0, L)
+            ax.set_ylim(-1.15 * ext if y.min() < 0 else -0.1 * ext, 1.15 * ext if y.max() > 0 else 0.1 * ext)
+            text.set_text("max " + fmt.format(float(np.abs(y).max())))
+        lim = res.deflection_limit_in
+        self.limit_line.set_data([0.0, L], [-lim, -lim])
+        ax = self.diagrams[2][0]
+        ax.set_ylim(min(ax.get_ylim()[0], -1.15 * lim), ax.get_ylim()[1])
+        self.diagrams[2][3].set_text(f"max {res.deflection_in:.3f} in (limit L/{x.deflection_limit_ratio:g} = {lim:.3f} in)")
+
+        ok = [res.bending_ok, res.shear_ok, res.bearing_ok, res.deflection_ok, res.column_axial_ok is not False,
+              fchk.bearing_ok, fchk.sliding_ok, fchk.uplift_ok]
+        self.title.set_text(label)
+        self.subtitle.set_text(f"Span {L:.4g} ft, tributary {x.tributary_width_ft:.4g} ft, beam {x.beam_b_in:g}×{x.beam_d_in:g} in, "
+                               f"DL {x.DL_psf:.4g} + SL {x.SL_psf:.4g} + LL {x.LL_psf:.4g} psf")
+        self.status.set_text(pf(all(ok)))
+        self.status.set_color("tab:green" if all(ok) else "tab:red")
+        self.summary.set_text("\n".join(_summary_lines(res, fchk)))
+        self._footing(x, fsize, fchk)
+
+    def _footing(self, x: Inputs, fsize: Optional[FootingSize], fchk: FootingChecks):
+        if fsize is not None:
+            Lf, T, how = fsize.length_in, fsize.thickness_in, "sized"
+        else:
+            Lf, T, how = x.footing_length_in, x.footing_thickness_in, "given"
+        Wf = fsize.width_in if fsize is not None else x.footing_width_in
+        has = bool(Lf and Wf and T)
+        Dcov = float(x.footing_depth_below_grade_in or 0.0)
+        pb = float(x.post_section_b_in or 5.5)
+        for a in (self.footing, self.soil, self.post, self.grade):
+            a.set_visible(has)
+        if not has:
+            self.dims.set_text("No footing size given and none of the\nstandard sizes passes.")
+            return
+        half = max(Lf, 24.0) * 0.9
+        self.grade.set_data([-half, half], [0.0, 0.0])
+        self.soil.set_bounds(-half, -(Dcov + T) - 6.0, 2 * half, Dcov + T + 6.0)
+        self.footing.set_bounds(-Lf / 2.0, -(Dcov + T), Lf, T)
+        self.post.set_bounds(-pb / 2.0, -Dcov, pb, Dcov + 0.6 * Lf)
+        self.sketch.set_xlim(-half, half)
+        self.sketch.set_ylim(-(Dcov + T) - 8.0, 0.6 * Lf + 4.0)
+        self.sketch_title.set_text(f"Footing (section), {how}")
+        self.dims.set_text(f"L×W×T = {Lf:g}×{Wf:g}×{T:g} in\ncover {Dcov:.3g} in\n"
+                           f"bearing {pf(fchk.bearing_ok)}  sliding {pf(fchk.sliding_ok)}  uplift {pf(fchk.uplift_ok)}")
+
+def _summary_lines(res: Results, fchk: FootingChecks) -> List[str]:
+    lines = [f"{' '.join(item.translate(_ASCII).split()):<46}{value.translate(_ASCII):>26}  {status}"
+             for item, value, status in summary_table(res)]
+    lines.append(f"{'Footing bearing q / q_allow (psf)':<46}{f'{fchk.q_actual_psf:,.0f} / {fchk.q_allow_eff_psf:,.0f}':>26}  {pf(fchk.bearing_ok)}")
+    lines.append(f"{'Footing sliding H / R (lb)':<46}{f'{fchk.H_post_lb:,.0f} / {fchk.R_slide_lb:,.0f}':>26}  {pf(fchk.sliding_ok)}")
+    lines.append(f"{'Footing uplift U / R (lb)':<46}{f'{fchk.U_post_lb:,.0f} / {fchk.R_uplift_lb:,.0f}':>26}  {pf(fchk.uplift_ok)}")
+    return lines
+
+# ---------------- rendering ----------------
+
+def _render_part(job: Tuple[Sequence[Inputs], Sequence[str], str]) -> int:
+    # One process: one page template, pages appended to one PdfPages file
+    designs, labels, path = job
+    # The core-font metrics report weight "medium"; the per-process lookup warning is noise
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    with matplotlib.rc_context(_RC), PdfPages(path) as pdf:
+        page = _Page()
+        for x, label in zip(designs, labels):
+            res = calc(x, log=False)
+            fsize, fchk = evaluate_footing(x, res, log=False)
+            page.draw(label, x, res, fsize, fchk)
+            pdf.savefig(page.fig)
+    return len(designs)
+
+def _have_pypdf() -> bool:
+    try:
+        import pypdf  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def render_pdf(designs: Iterable[Inputs], path: str, labels: Optional[Sequence[str]] = None,
+               workers: int = 1, chunk_size: int = 50) -> int:
+    """Write one page per design to path (atomically); returns the page count."""
+    designs = list(designs)
+    labels = list(labels) if labels is not None else [f"Design {i + 1}" for i in range(len(designs))]
+    if len(labels) != len(designs):
+        raise ValueError(f"{len(labels)} labels for {len(designs)} designs.")
+    out_dir = os.path.dirname(os.path.abspath(path))
+    with timing.span("pdf_report", pages=len(designs), workers=workers):
+        with tempfile.TemporaryDirectory(dir=out_dir, prefix=".pdf_parts_") as tmp:
+            chunks = [(designs[i:i + chunk_size], labels[i:i + chunk_size], os.path.join(tmp, f"part{i // chunk_size:05d}.pdf"))
+                      for i in range(0, len(designs), chunk_size)]
+            if workers > 1 and len(chunks) > 1 and _have_pypdf():
+                with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+                    list(pool.map(_render_part, chunks))
+                from pypdf import PdfWriter
+                writer = PdfWriter()
+                for _, _, part in chunks:
+                    writer.append(part)
+                final = os.path.join(tmp, "merged.pdf")
+                with open(final, "wb") as fh:
+                    writer.write(fh)
+            else:
+                final = os.path.join(tmp, "all.pdf")
+                _render_part((designs, labels, final))
+            os.replace(final, path)
+        timing.add("rows", len(designs))
+    return len(designs)
+
+# ---------------- command line ----------------
+
+def _read_designs(path: str, backend: str) -> Tuple[List[Inputs], List[str]]:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".csv"):
+        from .stream import READERS, parse_row
+        with open(path, newline="", encoding="utf-8") as fh:
+            rows = list(READERS[ext[1:]](fh))
+        return [parse_row(r) for r in rows], [str(r.get("id") or f"Row {i}") for i, r in enumerate(rows)]
+    from .main import load_backend
+    return [load_backend(backend).read_inputs(path)], [os.path.splitext(os.path.basename(path))[0]]
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="PDF calc package: summary, V/M/Δ diagrams and footing sketch per design.")
+    ap.add_argument("input", help="workbook (.xlsm/.xlsx) or jobs file (.jsonl/.csv, rows of Inputs fields)")
+    ap.add_argument("-o", "--out", default=None, help="output PDF (default: <input>_calc.pdf)")
+    ap.add_argument("-j", "--workers", type=int, default=1, help="rendering processes (needs pypdf to join parts)")
+    ap.add_argument("--chunk", type=int, default=50, help="designs per part file")
+    ap.add_argument("--backend", default="openpyxl", help="workbook I/O backend")
+    args = ap.parse_args(argv)
+    designs, labels = _read_designs(args.input, args.backend)
+    out = args.out or os.path.splitext(args.input)[0] + "_calc.pdf"
+    n = render_pdf(designs, out, labels, args.workers, args.chunk)
+    print(f"{n} pages -> {out}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,220 @@
+# src/reliability.py
+# Monte Carlo reliability: probability that each screening check fails when loads, wood
+# properties and soil capacity vary around the nominal Inputs.
+#
+#   dists = {"SL_psf": Gumbel(25, 0.35), "Fb_prime": LogNormal(1000, 0.20), "E": LogNormal(1.6e6, 0.10)}
+#   rel = simulate(inputs, dists, n_samples=10_000_000, seed=1)
+#   print("\n".join(format_report(rel)))
+#
+# Samples are drawn and checked in fixed-size chunks (calc_batch + footing_pass_batch), so
+# memory stays flat whatever n_samples is. Each chunk has its own generator spawned from one
+# SeedSequence: the same seed, n_samples and chunk_size give identical results.
+#
+#   python -m src.reliability Deck_Screening_Template.xlsm -n 1e6 --dist SL_psf=gumbel:25,0.35 --dist E=lognormal:1.6e6,0.1
+import sys
+import math
+import argparse
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .models import Inputs
+from .calc import calc
+from .batch import calc_batch, BATCH_FIELDS
+from .footing import footing_params, footing_pass_batch, size_footing
+
+# ---------------- distributions ----------------
+
+@dataclass(frozen=True)
+class Normal:
+    mean: float
+    std: float
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.normal(self.mean, self.std, n)
+
+@dataclass(frozen=True)
+class LogNormal:
+    mean: float
+    cov: float          # coefficient of variation (std / mean)
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        s = math.sqrt(math.log1p(self.cov * self.cov))
+        return rng.lognormal(math.log(self.mean) - 0.5 * s * s, s, n)
+
+@dataclass(frozen=True)
+class Gumbel:
+    mean: float
+    cov: float          # Type I extreme value, the usual model for annual-max snow / wind
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        beta = self.cov * self.mean * math.sqrt(6.0) / math.pi
+        return rng.gumbel(self.mean - 0.5772156649015329 * beta, beta, n)
+
+@dataclass(frozen=True)
+class Uniform:
+    low: float
+    high: float
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        return rng.uniform(self.low, self.high, n)
+
+DISTRIBUTIONS = {"normal": Normal, "lognormal": LogNormal, "gumbel": Gumbel, "uniform": Uniform}
+
+# Inputs fields that may be sampled: the numeric beam/post fields plus the ones the footing uses
+_FOOTING_FIELDS = {
+    "soil_bearing_capacity_psf": "q_allow", "soil_unit_weight_pcf": "gamma_soil",
+    "concrete_unit_weight_pcf": "gamma_conc", "base_friction_coeff_mu": "mu",
+    "credit_connector_uplift_lb": "credit",
+}
+_LOAD_FIELDS = ("roof_uplift_psf", "uplift_area_per_post_ft2", "lateral_line_load_plf", "wind_wall_psf",
+                "exposed_height_ft", "post_self_weight_lb")
+SAMPLEABLE = frozenset(f for f in BATCH_FIELDS if not f.startswith("has_")) | set(_FOOTING_FIELDS) | set(_LOAD_FIELDS)
+
+CHECKS = ("bending", "shear", "bearing", "deflection", "column",
+          "footing_bearing", "footing_sliding", "footing_uplift", "any")
+
+# ---------------- results ----------------
+
+@dataclass
+class CheckReliability:
+    failures: int
+    n: int              # samples where the check applies (column: only where it is evaluated)
+    pf: float
+    ci_low: float
+    ci_high: float
+
+@dataclass
+class ReliabilityResult:
+    n_samples: int
+    seed: int
+    chunk_size: int
+    confidence: float
+    checks: Dict[str, CheckReliability] = field(default_factory=dict)
+    footing_size_in: Optional[tuple] = None     # (L, W, T) used for the footing checks
+
+def wilson_interval(k: int, n: int, confidence: float = 0.95):
+    """Wilson score interval for a binomial proportion k/n (well behaved for k = 0 and small pf)."""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    p = k / n
+    denom = 1.0 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+# ---------------- simulation ----------------
+
+def _footing_chunk(nominal: Inputs, cols: Dict[str, np.ndarray], R: np.ndarray, size, n: int):
+    # Same demand rules as footing.footing_demands, evaluated per sample ("given" = not None / nonzero)
+    def val(name):
+        v = cols.get(name, getattr(nominal, name))
+        return np.asarray(np.nan if v is None else v, dtype=float)
+    given = lambda x: ~np.isnan(x) & (x != 0)
+    span, lat, ww, eh = val("span_ft"), val("lateral_line_load_plf"), val("wind_wall_psf"), val("exposed_height_ft")
+    ru, ua, ps = val("roof_uplift_psf"), val("uplift_area_per_post_ft2"), val("post_self_weight_lb")
+    V = R + np.where(given(ps), ps, 0.0)
+    with np.errstate(invalid="ignore"):
+        H = np.where(~np.isnan(lat), lat * span / 2.0, np.where(given(ww) & given(eh), ww * eh * span / 2.0, 0.0))
+        U = np.where(given(ru) & given(ua), ru * ua, 0.0)
+    p = footing_params(nominal)
+    for name, key in _FOOTING_FIELDS.items():
+        if name in cols:
+            p[key] = cols[name]
+    L, W, T = size
+    ok = footing_pass_batch(V, H, U, L, W, T, **p)
+    return [np.broadcast_to(x, (n,)) for x in ok]
+
+def simulate(inputs: Inputs, distributions: Dict[str, object], n_samples: int = 1_000_000,
+             chunk_size: int = 100_000, seed: int = 0, confidence: float = 0.95) -> ReliabilityResult:
+    """Failure probability per check (and for any check) with Wilson confidence intervals."""
+    unknown = sorted(set(distributions) - SAMPLEABLE)
+    if unknown:
+        raise ValueError(f"Cannot sample {', '.join(unknown)} (choose from {', '.join(sorted(SAMPLEABLE))}).")
+    names = sorted(distributions)                   # fixed draw order -> reproducible
+    base = {f: getattr(inputs, f) for f in BATCH_FIELDS}
+
+    # Footing: the given L×W×T, or the size chosen at nominal values (Option 2 in main)
+    size = None
+    if inputs.footing_length_in and inputs.footing_width_in and inputs.footing_thickness_in:
+        size = (inputs.footing_length_in, inputs.footing_width_in, inputs.footing_thickness_in)
+    else:
+        fs = size_footing(inputs, calc(inputs, log=False))
+        if fs is not None:
+            size = (fs.length_in, fs.width_in, fs.thickness_in)
+
+    fails = dict.fromkeys(CHECKS, 0)
+    applies = dict.fromkeys(CHECKS, 0)
+    n_chunks = max(1, -(-n_samples // chunk_size))
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        n = min(chunk_size, n_samples - i * chunk_size)
+        rng = np.random.default_rng(child)
+        cols = {name: distributions[name].sample(rng, n) for name in names}
+        beam = calc_batch(**{**base, **{k: v for k, v in cols.items() if k in base}})
+        ok = {"bending": beam.bending_ok, "shear": beam.shear_ok, "bearing": beam.bearing_ok,
+              "deflection": beam.deflection_ok}
+        any_fail = np.zeros(n, dtype=bool)
+        for name, flag in ok.items():
+            flag = np.broadcast_to(flag, (n,))
+            fails[name] += int(n - np.count_nonzero(flag))
+            applies[name] += n
+            any_fail |= ~flag
+        checked = np.broadcast_to(beam.column_checked, (n,))
+        col_fail = checked & ~np.broadcast_to(beam.column_axial_ok, (n,))
+        fails["column"] += int(np.count_nonzero(col_fail))
+        applies["column"] += int(np.count_nonzero(checked))
+        any_fail |= col_fail
+        if size is not None:
+            R = np.broadcast_to(beam.reaction_per_post_lb, (n,))
+            for name, flag in zip(("footing_bearing", "footing_sliding", "footing_uplift"),
+                                  _footing_chunk(inputs, cols, R, size, n)):
+                fails[name] += int(n - np.count_nonzero(flag))
+                applies[name] += n
+                any_fail |= ~flag
+        fails["any"] += int(np.count_nonzero(any_fail))
+        applies["any"] += n
+
+    out = ReliabilityResult(n_samples, seed, chunk_size, confidence, footing_size_in=size)
+    for name in CHECKS:
+        k, m = fails[name], applies[name]
+        lo, hi = wilson_interval(k, m, confidence)
+        out.checks[name] = CheckReliability(k, m, k / m if m else 0.0, lo, hi)
+    return out
+
+def format_report(rel: ReliabilityResult) -> List[str]:
+    lines = [f"Monte Carlo: {rel.n_samples:,} samples, seed {rel.seed}, {rel.confidence:.0%} Wilson intervals",
+             f"{'Check':<18}{'Failures':>12}{'Pf':>12}{'CI low':>12}{'CI high':>12}"]
+    for name, c in rel.checks.items():
+        if c.n == 0:
+            lines.append(f"{name:<18}{'(not checked)':>12}")
+            continue
+        lines.append(f"{name:<18}{c.failures:>12,}{c.pf:>12.3e}{c.ci_low:>12.3e}{c.ci_high:>12.3e}")
+    return lines
+
+def parse_distribution(text: str):
+    """'SL_psf=gumbel:25,0.35' -> ("SL_psf", Gumbel(25, 0.35))."""
+    try:
+        name, spec = text.split("=", 1)
+        kind, args = spec.split(":", 1)
+        return name.strip(), DISTRIBUTIONS[kind.strip().lower()](*(float(a) for a in args.split(",")))
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Bad distribution '{text}' (expected name=kind:a,b with kind in "
+                         f"{', '.join(DISTRIBUTIONS)}).") from e
+
+def cli(argv=None) -> int:
+    from .main import BACKENDS, load_backend
+    ap = argparse.ArgumentParser(description="Failure probabilities of the screening checks by Monte Carlo.")
+    ap.add_argument("xlsx")
+    ap.add_argument("--dist", action="append", default=[], metavar="NAME=KIND:A,B",
+                    help="e.g. SL_psf=gumbel:25,0.35  E=lognormal:1.6e6,0.1  Fb_prime=normal:1000,150")
+    ap.add_argument("-n", "--samples", type=float, default=1e6)
+    ap.add_argument("--chunk", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--backend", choices=sorted(BACKENDS), default="openpyxl")
+    args = ap.parse_args(argv)
+    inputs = load_backend(args.backend).read_inputs(args.xlsx)
+    rel = simulate(inputs, dict(parse_distribution(d) for d in args.dist), int(args.samples), args.chunk, args.seed)
+    print("\n".join(format_report(rel)))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -1,4 +1,6 @@
 # src/report.py
+from dataclasses import dataclass, field
+from typing import Any, List, Tuple
 from .models import Results
 
 def summary_table(res: Results):
@@ -27,4 +29,125 @@ def summary_table(res: Results):
     return rows
 
 def calc_log_lines(res: Results):
-    return res.calc_log
+    # Formatting happens here, not in calc
+    return list(res.calc_log)
+
+# ---------------- Results sheet layout (built in memory, written in one go) ----------------
+
+@dataclass
+class ResultsGrid:
+    rows: List[List[Any]]                                             # rectangular block anchored at A1
+    bold: List[Tuple[int, int, int, int]] = field(default_factory=list)  # (row, col, n_rows, n_cols), 1-based
+
+    @property
+    def width(self) -> int:
+        return max((len(r) for r in self.rows), default=0)
+
+    def padded(self, width: int = 0) -> List[List[Any]]:
+        w = max(self.width, width)
+        return [r + [None] * (w - len(r)) for r in self.rows]
+
+class _GridBuilder:
+    def __init__(self, gap: int):
+        self.rows: List[List[Any]] = []
+        self.bold: List[Tuple[int, int, int, int]] = []
+        self.gap = gap
+
+    def row(self, values=(), bold=False):
+        values = list(values)
+        self.rows.append(values)
+        if bold and values:
+            self.bold.append((len(self.rows), 1, 1, len(values)))
+
+    def blank(self, n=1):
+        for _ in range(n):
+            self.rows.append([])
+
+    def end_section(self):
+        # Sections are separated by a fixed gap below whatever the previous one needed
+        while self.rows and not self.rows[-1]:
+            self.rows.pop()
+        self.blank(self.gap)
+
+def _connector_rows(b: _GridBuilder, title, model, checks):
+    b.row([title], bold=True)
+    b.row(["Model","Demand","Capacity","Utilization","Status"], bold=True)
+    b.row([model,"","","",""])
+    for k, d in checks.items():
+        cap = d["cap"] if d["cap"] else 0.0
+        util = (d["demand"]/cap) if cap > 0 else 0.0
+        b.row([k, d["demand"], cap, util, "PASS" if d["pass"] else "CHECK"])
+    b.end_section()
+
+def results_grid(res: Results, selection=None, fchk=None, gap: int = 2, footing_size=None, drivers=None) -> ResultsGrid:
+    b = _GridBuilder(gap)
+
+    summary = summary_table(res)
+    b.row(["RESULT SUMMARY"], bold=True)
+    b.blank()
+    b.row(["Item","Value","Status"], bold=True)
+    for r in summary:
+        b.row(r)
+    b.end_section()
+
+    if drivers:
+        # (check, utilization, input, elasticity, du/dx) rows from sensitivity.top_drivers
+        b.row(["TOP DRIVERS (elasticity = % change in utilization per 1% change in input)"], bold=True)
+        b.blank()
+        b.row(["Check","Utilization","Input","Elasticity","∂u/∂input"], bold=True)
+        last = None
+        for check, util, name, e, dudx in drivers:
+            first = check != last
+            b.row([check if first else "", f"{util:.3f}" if first else "", name, f"{e:+.2f}", f"{dudx:.4g}"])
+            last = check
+        b.end_section()
+
+    log = calc_log_lines(res)
+    b.row(["CALCULATION LOG"], bold=True)
+    b.blank()
+    for l in log:
+        b.row([l])
+    b.end_section()
+
+    if selection is not None:
+        _connector_rows(b, "TOP CONNECTOR", selection.top_model or "(auto-selected)", selection.top_checks)
+        _connector_rows(b, "BASE CONNECTOR", selection.base_model or "(auto-selected)", selection.base_checks)
+
+    if fchk is not None:
+        def status(ok): return "PASS" if ok else "CHECK"
+        b.row(["FOOTING CHECKS (per post)"], bold=True)
+        b.blank()
+        b.row(["Item","Demand/Actual","Capacity/Allowable","Status"], bold=True)
+        b.row(["Bearing (psf)", f"{fchk.q_actual_psf:.0f}", f"{fchk.q_allow_eff_psf:.0f}", status(fchk.bearing_ok)])
+        b.row(["Sliding (lb)", f"{fchk.H_post_lb:.0f}", f"{fchk.R_slide_lb:.0f}", status(fchk.sliding_ok)])
+        b.row(["Uplift (lb)", f"{fchk.U_post_lb:.0f}", f"{fchk.R_uplift_lb:.0f}", status(fchk.uplift_ok)])
+        if footing_size is not None:
+            b.row(["Sized footing L×W×T (in)",
+                   f"{footing_size.length_in:.0f} × {footing_size.width_in:.0f} × {footing_size.thickness_in:.0f}", "", "SIZED"])
+        b.blank()
+        b.row(["FOOTING CALC LOG"], bold=True)
+        for l in fchk.calc_log:
+            b.row([l])
+        b.end_section()
+
+    while b.rows and not b.rows[-1]:
+        b.rows.pop()
+    return ResultsGrid(rows=b.rows, bold=b.bold)
+
+def changed_row_spans(old: ResultsGrid, new: ResultsGrid) -> List[Tuple[int, int]]:
+    """1-based inclusive row ranges where new differs from old (including rows only one of them has)."""
+    spans: List[Tuple[int, int]] = []
+    w = max(old.width, new.width)
+    a, b = old.padded(w), new.padded(w)
+    old_bold, new_bold = set(old.bold), set(new.bold)
+    bold_rows = {r for (r, _, nr, _) in old_bold ^ new_bold for r in range(r, r + nr)}
+    start = None
+    for i in range(max(len(a), len(b))):
+        same = (i < len(a) and i < len(b) and a[i] == b[i]) and (i + 1) not in bold_rows
+        if not same and start is None:
+            start = i + 1
+        elif same and start is not None:
+            spans.append((start, i)); start = None
+    if start is not None:
+        spans.append((start, max(len(a), len(b))))
+    return spans
@@ -0,0 +1,127 @@
+# src/runner.py
+# Re-screen many project workbooks in parallel with the file-based (openpyxl) backend.
+# Each workbook's Results go to <name>_results.xlsx beside it; the summary CSV collects pass/fail.
+#
+#   python -m src.runner projects/                       # every .xlsm/.xlsx in the folder
+#   python -m src.runner "projects/**/*.xlsm" -j 8 --summary q3_summary.csv
+import os
+import sys
+import csv
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional
+
+from .main import run
+from .calc import pf
+from .io_openpyxl import RESULTS_SUFFIX
+
+SUMMARY_COLUMNS = [
+    "file", "status", "bending", "shear", "bearing", "deflection", "column",
+    "top_connector", "top_connector_check", "base_connector", "base_connector_check",
+    "footing_bearing", "footing_sliding", "footing_uplift", "seconds", "error",
+]
+
+def expand_targets(targets: Iterable[str]) -> List[str]:
+    """Directories -> their .xlsm/.xlsx files; anything else is treated as a glob pattern."""
+    out: List[str] = []
+    for t in targets:
+        if os.path.isdir(t):
+            found = [p for ext in ("*.xlsm", "*.xlsx") for p in glob.glob(os.path.join(t, ext))]
+        else:
+            found = glob.glob(t, recursive=True)
+        # skip Excel's "~$name.xlsm" lock files and our own <name>_results.xlsx outputs
+        out += sorted(p for p in found if not os.path.basename(p).startswith("~$")
+                      and not p.endswith(RESULTS_SUFFIX))
+    return list(dict.fromkeys(out))
+
+def _checks_status(checks: Dict[str, Dict[str, float]]) -> str:
+    if not checks:
+        return ""
+    return pf(all(c["pass"] for c in checks.values()))
+
+def screen_workbook(path: str, write: bool = True) -> Dict[str, str]:
+    """Run one workbook; never raises (errors are reported in the row)."""
+    t0 = time.perf_counter()
+    try:
+        out = run(path, backend="openpyxl", write=write)
+    except Exception as e:
+        return {"file": path, "status": "ERROR", "error": f"{type(e).__name__}: {e}",
+                "seconds": f"{time.perf_counter() - t0:.3f}"}
+    res, sel, f = out.results, out.selection, out.footing
+    row = {
+        "file": path,
+        "bending": pf(res.bending_ok),
+        "shear": pf(res.shear_ok),
+        "bearing": pf(res.bearing_ok),
+        "deflection": pf(res.deflection_ok),
+        "column": "SKIPPED" if res.column_axial_ok is None else pf(res.column_axial_ok),
+        "top_connector": sel.top_model or "",
+        "top_connector_check": _checks_status(sel.top_checks),
+        "base_connector": sel.base_model or "",
+        "base_connector_check": _checks_status(sel.base_checks),
+        "footing_bearing": pf(f.bearing_ok),
+        "footing_sliding": pf(f.sliding_ok),
+        "footing_uplift": pf(f.uplift_ok),
+        "seconds": f"{time.perf_counter() - t0:.3f}",
+        "error": "",
+    }
+    row["status"] = "CHECK" if "CHECK" in row.values() else "PASS"
+    return row
+
+def run_many(paths: List[str], workers: Optional[int] = None, summary_csv: Optional[str] = None,
+             write: bool = True, progress: bool = True) -> List[Dict[str, str]]:
+    workers = workers or os.cpu_count() or 1
+    rows: Dict[str, Dict[str, str]] = {}
+    n = len(paths)
+
+    def report(row):
+        rows[row["file"]] = row
+        if progress:
+            msg = row["error"] if row["status"] == "ERROR" else f"{row['seconds']} s"
+            print(f"[{len(rows)}/{n}] {row['status']:<5} {row['file']} ({msg})", file=sys.stderr, flush=True)
+
+    if workers == 1 or n <= 1:
+        for p in paths:
+            report(screen_workbook(p, write))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, n)) as pool:
+            futures = {pool.submit(screen_workbook, p, write): p for p in paths}
+            for fut in as_completed(futures):
+                try:
+                    report(fut.result())
+                except Exception as e:          # worker process died (e.g. killed / out of memory)
+                    report({"file": futures[fut], "status": "ERROR", "error": f"{type(e).__name__}: {e}"})
+
+    ordered = [rows[p] for p in paths]
+    if summary_csv:
+        with open(summary_csv, "w", newline="", encoding="utf-8") as fh:
+            w = csv.DictWriter(fh, fieldnames=SUMMARY_COLUMNS, restval="")
+            w.writeheader()
+            w.writerows(ordered)
+    return ordered
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Re-screen a folder (or glob) of deck screening workbooks without Excel.")
+    ap.add_argument("targets", nargs="+", help="directories and/or glob patterns of .xlsm/.xlsx files")
+    ap.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("--summary", default="screening_summary.csv", help="combined pass/fail CSV")
+    ap.add_argument("--no-write", action="store_true", help="do not write <name>_results.xlsx next to each workbook")
+    ap.add_argument("-q", "--quiet", action="store_true", help="no per-file progress lines")
+    args = ap.parse_args(argv)
+
+    paths = expand_targets(args.targets)
+    if not paths:
+        print("No workbooks found.", file=sys.stderr)
+        return 2
+    t0 = time.perf_counter()
+    rows = run_many(paths, workers=args.workers, summary_csv=args.summary,
+                    write=not args.no_write, progress=not args.quiet)
+    counts = {s: sum(r["status"] == s for r in rows) for s in ("PASS", "CHECK", "ERROR")}
+    print(f"{len(rows)} workbooks in {time.perf_counter() - t0:.1f} s: "
+          f"{counts['PASS']} pass, {counts['CHECK']} check, {counts['ERROR']} error -> {args.summary}", file=sys.stderr)
+    return 1 if counts["ERROR"] else 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,200 @@
+# src/schema.py
+# Inputs parsing compiled once from dataclasses.fields(Inputs): one conversion rule per field,
+# applied to a dict, a list of dicts or a pandas DataFrame column by column. Every bad cell is
+# collected and reported in a single InputsParseError.
+#
+#   SCHEMA.parse(d)                          # one Inputs (the Inputs sheet as a label -> value dict)
+#   SCHEMA.parse_rows(rows)                  # list of dicts -> List[Inputs]
+#   SCHEMA.parse_frame(df)                   # DataFrame whose columns are Inputs field names
+#   SCHEMA.parse_rows(rows, batch=True)      # -> soa.InputsBatch (also parse_frame)
+#
+# Rules, from each field's annotation and default (the Inputs sheet's long-standing behaviour):
+#   float, no default       required; blank or not a number is an error
+#   float with a default    blank, 0 or missing -> the default (LL_psf, deflection_limit_ratio, ...)
+#   Optional[float] = None  blank or missing -> None; the column inputs also treat 0 as blank
+#   bool                    yes/no text via _yn (numbers by truth value, anything else False)
+#   Optional[str]           blank -> None, otherwise kept as given
+# A NaN cell (how pandas spells an empty cell) counts as blank. Keys that are not Inputs
+# fields are ignored.
+import typing
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+from .models import Inputs
+
+YESNO = {"yes": True, "no": False, "y": True, "n": False, "true": True, "false": False, "1": True, "0": False}
+
+def _yn(v):
+    if isinstance(v, bool): return v
+    if v is None: return False
+    if isinstance(v, (int, float)): return bool(v)
+    return YESNO.get(str(v).strip().lower(), False)
+
+# Column-check inputs where 0 on the sheet means "not given"
+ZERO_IS_BLANK = frozenset({"Fc_axis_prime", "post_section_b_in", "post_section_d_in"})
+
+def _blank(v) -> bool:
+    return v is None or (isinstance(v, str) and v == "") or (isinstance(v, float) and v != v)
+
+@dataclass(frozen=True)
+class CellError:
+    row: Any                # row index / DataFrame index label; None for a single dict
+    field: str
+    value: Any
+    message: str
+
+    def __str__(self):
+        where = f"row {self.row}, " if self.row is not None else ""
+        return f"{where}{self.field}: {self.message}" + ("" if self.value is None else f" ({self.value!r})")
+
+class InputsParseError(ValueError):
+    """All bad cells of one parse; .errors lists them in row, then field order."""
+
+    def __init__(self, errors: Sequence[CellError]):
+        self.errors = list(errors)
+        shown = "; ".join(str(e) for e in self.errors[:20])
+        more = f"; ... and {len(self.errors) - 20} more" if len(self.errors) > 20 else ""
+        super().__init__(f"{len(self.errors)} bad input cell{'s' if len(self.errors) != 1 else ''}: {shown}{more}")
+
+# ---------------- plan ----------------
+
+@dataclass(frozen=True)
+class FieldRule:
+    name: str
+    kind: str                   # required / default / optional / flag / text
+    default: Any = None
+    zero_blank: bool = False
+
+    def convert(self, v):
+        """Python value for one cell; raises ValueError with a short message for a bad cell."""
+        try:
+            return _converter(self)(v)
+        except (TypeError, ValueError):
+            raise ValueError("missing" if _blank(v) else "not a number") from None
+
+def _converter(rule: FieldRule) -> Callable[[Any], Any]:
+    # One small function per kind, so the per-cell work is a single call with no dispatch.
+    # Blank is None, "" or NaN (v != v); float() raises for anything that is not a number.
+    if rule.kind == "flag":
+        return lambda v: _yn(v) if v == v else False
+    if rule.kind == "text":
+        return lambda v: (v or None) if v == v else None
+    if rule.kind == "required":
+        def required(v):
+            x = float(v)
+            if x != x:
+                raise ValueError("missing")
+            return x
+        return required
+    if rule.kind == "default":
+        d = rule.default
+        return lambda v: float(v) if v and v == v else d
+    if rule.zero_blank:
+        return lambda v: None if v is None or v == "" or v == 0 or v != v else float(v)
+    return lambda v: None if v is None or v == "" or v != v else float(v)
+
+def _rule(f) -> FieldRule:
+    t = f.type
+    if typing.get_origin(t) is typing.Union:
+        t = next(a for a in typing.get_args(t) if a is not type(None))
+    if t is bool:
+        return FieldRule(f.name, "flag")
+    if t is str:
+        return FieldRule(f.name, "text")
+    if f.default is MISSING:
+        return FieldRule(f.name, "required")
+    if f.default is not None:
+        return FieldRule(f.name, "default", float(f.default))
+    return FieldRule(f.name, "optional", None, f.name in ZERO_IS_BLANK)
+
+class InputsSchema:
+    def __init__(self, cls=Inputs):
+        self.cls = cls
+        self.rules: Tuple[FieldRule, ...] = tuple(_rule(f) for f in fields(cls))
+        self.labels: Tuple[str, ...] = tuple(r.name for r in self.rules)
+        self._plan = tuple((r.name, _converter(r)) for r in self.rules)
+
+    def _column(self, rule: FieldRule, fn, values: Sequence[Any], rows: Sequence[Any], errors: List[CellError]) -> list:
+        # Whole column in one pass; only a column with a bad cell pays for per-cell reporting
+        try:
+            return list(map(fn, values))
+        except (TypeError, ValueError):
+            out = []
+            for row, v in zip(rows, values):
+                try:
+                    out.append(rule.convert(v))
+                except ValueError as e:
+                    errors.append(CellError(row, rule.name, None if _blank(v) else v, str(e)))
+                    out.append(None)
+            return out
+
+    def _raise(self, errors: List[CellError], index: Sequence[Any]):
+        pos = {row: i for i, row in enumerate(index)}
+        order = {name: i for i, name in enumerate(self.labels)}
+        raise InputsParseError(sorted(errors, key=lambda e: (pos[e.row], order[e.field])))
+
+    def _build(self, n: int, cols: Dict[str, list], batch: bool):
+        if batch:
+            from .soa import InputsBatch
+            return InputsBatch.from_columns(n, **cols)
+        return [self.cls(*row) for row in zip(*(cols[name] for name in self.labels))]
+
+    def parse(self, d: Dict[str, Any]):
+        """One Inputs from a label -> value dict."""
+        try:
+            return self.cls(*[fn(d.get(name)) for name, fn in self._plan])
+        except (TypeError, ValueError):
+            pass
+        errors: List[CellError] = []
+        for rule in self.rules:
+            v = d.get(rule.name)
+            try:
+                rule.convert(v)
+            except ValueError as e:
+                errors.append(CellError(None, rule.name, None if _blank(v) else v, str(e)))
+        raise InputsParseError(errors)
+
+    def parse_rows(self, rows: Iterable[Dict[str, Any]], batch: bool = False):
+        """List of Inputs (or an InputsBatch) from dicts; row numbers in errors count from 0."""
+        rows = list(rows)
+        index = range(len(rows))
+        errors: List[CellError] = []
+        cols = {rule.name: self._column(rule, fn, [r.get(rule.name) for r in rows], index, errors)
+                for rule, (_, fn) in zip(self.rules, self._plan)}
+        if errors:
+            self._raise(errors, index)
+        return self._build(len(rows), cols, batch)
+
+    def parse_frame(self, df, batch: bool = False):
+        """List of Inputs (or an InputsBatch) from a DataFrame; errors carry the index labels."""
+        import numpy as np
+        n, index = len(df), list(df.index)
+        errors: List[CellError] = []
+        cols: Dict[str, Any] = {}
+        for rule, (_, fn) in zip(self.rules, self._plan):
+            if rule.name not in df.columns:
+                cols[rule.name] = self._column(rule, fn, [None] * n, index, errors)
+                continue
+            col = df[rule.name]
+            if col.dtype.kind not in "fiu" or rule.kind in ("flag", "text"):
+                cols[rule.name] = self._column(rule, fn, col.tolist(), index, errors)
+                continue
+            # Numeric column: the rule applied to the whole array
+            a = col.to_numpy(dtype=float, na_value=np.nan)
+            blank = np.isnan(a)
+            if rule.kind == "required":
+                errors.extend(CellError(index[i], rule.name, None, "missing") for i in np.flatnonzero(blank))
+            elif rule.kind == "default":
+                a = np.where(blank | (a == 0), rule.default, a)
+            elif rule.zero_blank:
+                a = np.where(a == 0, np.nan, a)
+            if batch:
+                cols[rule.name] = a
+            else:
+                vals = a.tolist()
+                cols[rule.name] = [None if v != v else v for v in vals] if rule.kind == "optional" else vals
+        if errors:
+            self._raise(errors, index)
+        return self._build(n, cols, batch)
+
+SCHEMA = InputsSchema()
@@ -0,0 +1,167 @@
+# src/sections.py
+# "Find the lightest section" mode: search a lumber catalog (sizes × plies × grades)
+# for the smallest-area beam that passes bending, shear, bearing and deflection.
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import Inputs, Results
+from .calc import calc
+
+@dataclass(frozen=True)
+class LumberSize:
+    nominal: str        # e.g. "2x10"
+    b_in: float         # dressed thickness of one ply
+    d_in: float         # dressed depth
+
+@dataclass(frozen=True)
+class Grade:
+    name: str
+    Fb_prime: float
+    Fv_prime: float
+    Fc_perp_prime: float
+    E: float
+
+@dataclass(frozen=True)
+class SectionCandidate:
+    size: LumberSize
+    plies: int
+    grade: Grade
+
+    @property
+    def b_in(self) -> float:
+        return self.size.b_in * self.plies
+
+    @property
+    def d_in(self) -> float:
+        return self.size.d_in
+
+    @property
+    def area_in2(self) -> float:
+        return self.b_in * self.d_in
+
+    @property
+    def label(self) -> str:
+        ply = f"{self.plies}-ply " if self.plies > 1 else ""
+        return f"{ply}{self.size.nominal} {self.grade.name}"
+
+@dataclass
+class SectionSearchResult:
+    best: Optional[SectionCandidate]
+    results: Optional[Results]
+    runners_up: List[Tuple[SectionCandidate, Results]] = field(default_factory=list)
+    n_checked: int = 0          # number of section/grade combinations actually evaluated
+
+# ---- Default catalog (dressed sizes; screening-level design values in psi) ----
+# Replace the grade values with adjusted F' values for your load duration / wet service.
+DEFAULT_SIZES = [
+    LumberSize("2x6", 1.5, 5.5), LumberSize("2x8", 1.5, 7.25),
+    LumberSize("2x10", 1.5, 9.25), LumberSize("2x12", 1.5, 11.25),
+    LumberSize("4x6", 3.5, 5.5), LumberSize("4x8", 3.5, 7.25),
+    LumberSize("4x10", 3.5, 9.25), LumberSize("4x12", 3.5, 11.25),
+    LumberSize("6x6", 5.5, 5.5), LumberSize("6x8", 5.5, 7.5),
+    LumberSize("6x10", 5.5, 9.5), LumberSize("6x12", 5.5, 11.5),
+]
+DEFAULT_GRADES = [
+    Grade("SPF No.2", 875, 135, 425, 1_400_000),
+    Grade("DF-L No.2", 900, 180, 625, 1_600_000),
+    Grade("Hem-Fir No.2", 850, 150, 405, 1_300_000),
+    Grade("WRC No.2", 725, 155, 425, 1_100_000),
+]
+DEFAULT_PLIES = (1, 2, 3)
+
+
+def build_catalog(sizes: Sequence[LumberSize] = DEFAULT_SIZES,
+                  grades: Sequence[Grade] = DEFAULT_GRADES,
+                  plies: Sequence[int] = DEFAULT_PLIES) -> List[SectionCandidate]:
+    # Built-up plies only make sense for dimension lumber (2x); timbers are single pieces
+    out = []
+    for g in grades:
+        for s in sizes:
+            for n in (plies if s.b_in < 2.0 else (1,)):
+                out.append(SectionCandidate(s, n, g))
+    return out
+
+
+def _beam_ok(inputs: Inputs, b: float, d: float, g: Grade) -> bool:
+    # Same arithmetic as calc.calc for bending, shear and deflection (bearing is section-independent)
+    w_plf = (inputs.DL_psf + inputs.SL_psf + inputs.LL_psf) * inputs.tributary_width_ft
+    w_lbin = w_plf / 12.0
+    L_in = inputs.span_ft * 12.0
+    L2_in = L_in * L_in
+    S = b * (d * d) / 6.0
+    I = b * (d * d * d) / 12.0
+    V_max = w_plf * inputs.span_ft / 2.0
+    if w_lbin * L2_in / 8.0 / S > g.Fb_prime:
+        return False
+    if 1.5 * V_max / (b * d) > g.Fv_prime:
+        return False
+    return 5 * w_lbin * (L2_in * L2_in) / (384.0 * g.E * I) <= L_in / inputs.deflection_limit_ratio
+
+
+def _bearing_ok(inputs: Inputs, g: Grade) -> bool:
+    R = (inputs.DL_psf + inputs.SL_psf + inputs.LL_psf) * inputs.tributary_width_ft * inputs.span_ft / 2.0
+    return R / max(inputs.post_base_bearing_area_in2, 1e-6) <= g.Fc_perp_prime
+
+
+def with_section(inputs: Inputs, c: SectionCandidate) -> Inputs:
+    return replace(inputs, beam_b_in=c.b_in, beam_d_in=c.d_in,
+                   Fb_prime=c.grade.Fb_prime, Fv_prime=c.grade.Fv_prime,
+                   Fc_perp_prime=c.grade.Fc_perp_prime, E=c.grade.E)
+
+
+def find_lightest_section(inputs: Inputs, catalog: Optional[Sequence[SectionCandidate]] = None,
+                          n_runners_up: int = 3) -> SectionSearchResult:
+    """
+    Smallest-area catalog section that passes all beam checks for these Inputs.
+
+    For a fixed width and grade, fb, fv and Δ all fall as d grows (S ∝ d², A ∝ d, I ∝ d³),
+    so each (width, grade) group is binary-searched for its shallowest passing depth; deeper
+    sizes in the group can only be heavier. Groups whose shallowest size is already heavier
+    than the current top-k, or whose grade fails bearing, are skipped without evaluation.
+    """
+    catalog = build_catalog() if catalog is None else catalog
+
+    groups: Dict[Tuple[float, Grade], List[SectionCandidate]] = {}
+    for c in catalog:
+        groups.setdefault((c.b_in, c.grade), []).append(c)
+
+    keep = n_runners_up + 1
+    winners: List[SectionCandidate] = []
+    n_checked = 0
+    # Narrow groups first: they tend to hold the lightest passing sizes and tighten the bound early
+    for (b, g), cands in sorted(groups.items(), key=lambda kv: (kv[0][0], kv[0][1].name)):
+        cands = sorted(cands, key=lambda c: c.d_in)
+        bound = winners[-1].area_in2 if len(winners) >= keep else float("inf")
+        if cands[0].area_in2 > bound:
+            continue
+        n_checked += 1
+        if not _bearing_ok(inputs, g):
+            continue
+        lo, hi = 0, len(cands)         # first passing index in [lo, hi)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if cands[mid].area_in2 > bound:
+                hi = mid
+                continue
+            n_checked += 1
+            if _beam_ok(inputs, b, cands[mid].d_in, g):
+                hi = mid
+            else:
+                lo = mid + 1
+        if lo < len(cands) and cands[lo].area_in2 <= bound:
+            winners.append(cands[lo])
+            winners.sort(key=lambda c: (c.area_in2, c.d_in, c.label))
+            del winners[keep:]
+
+    if not winners:
+        return SectionSearchResult(best=None, results=None, n_checked=n_checked)
+
+    ranked = [(c, calc(with_section(inputs, c))) for c in winners]
+    best, best_res = ranked[0]
+    return SectionSearchResult(best=best, results=best_res, runners_up=ranked[1:], n_checked=n_checked)
+
+
+def find_lightest_sections(inputs_list: Sequence[Inputs], catalog: Optional[Sequence[SectionCandidate]] = None,
+                           n_runners_up: int = 3) -> List[SectionSearchResult]:
+    catalog = build_catalog() if catalog is None else catalog
+    return [find_lightest_section(i, catalog, n_runners_up) for i in inputs_list]
@@ -0,0 +1,226 @@
+# src/sensitivity.py
+# Closed-form sensitivities of every utilization (demand / capacity) in Results and
+# FootingChecks to the Inputs fields, for arrays of designs in one vectorized pass.
+#
+#   s = sensitivity(inputs_list)
+#   s.derivative["bending"]["span_ft"]          # ∂(fb / Fb') / ∂span, one value per design
+#   s.elasticity["deflection"]["beam_d_in"]     # % change in utilization per 1 % change in d (-3)
+#   top_drivers(inputs)                          # ranked rows for the Results sheet
+#
+# Each utilization is a product of powers of the inputs and of a few sums (q = DL + SL + LL,
+# V_struct = R + post self weight, V_eff = V_struct + footing + overburden weight, ...), so
+# g = ∂ln u / ∂x is a sum of p / x and share-of-sum terms; ∂u/∂x = u·g and elasticity = x·g.
+# Utilizations are NaN where a check is not evaluated (column without Fc_axis_prime / post
+# section, footing checks without a footing size). Fields left blank and replaced by a
+# default (γ, μ, safety factors) get no entry; blank-means-zero fields (LL, post self weight,
+# credit, cover depth) do. Kinks (the 1e-6 / 1e-9 floors, the column's min of crushing and
+# buckling) use the branch that is active at the design point.
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .models import Inputs
+from .batch import BATCH_FIELDS, inputs_to_columns
+from .combinations import _given, _or
+from .footing import _bool_from_yesno
+
+CHECKS = ("bending", "shear", "bearing", "deflection", "column",
+          "footing_bearing", "footing_sliding", "footing_uplift")
+
+_FIELDS = BATCH_FIELDS + ["post_self_weight_lb", "roof_uplift_psf", "uplift_area_per_post_ft2",
+                          "lateral_line_load_plf", "wind_wall_psf", "exposed_height_ft",
+                          "footing_length_in", "footing_width_in", "footing_thickness_in",
+                          "footing_depth_below_grade_in", "soil_bearing_capacity_psf", "soil_unit_weight_pcf",
+                          "concrete_unit_weight_pcf", "base_friction_coeff_mu", "SF_bearing", "SF_sliding",
+                          "SF_uplift", "credit_connector_uplift_lb", "include_soil_overburden"]
+
+# Beam checks: exponent of each factor of the utilization ("q" = DL + SL + LL)
+_BEAM = {
+    "bending": {"q": 1, "span_ft": 2, "tributary_width_ft": 1, "beam_b_in": -1, "beam_d_in": -2, "Fb_prime": -1},
+    "shear": {"q": 1, "span_ft": 1, "tributary_width_ft": 1, "beam_b_in": -1, "beam_d_in": -1, "Fv_prime": -1},
+    "bearing": {"q": 1, "span_ft": 1, "tributary_width_ft": 1, "post_base_bearing_area_in2": -1, "Fc_perp_prime": -1},
+    "deflection": {"q": 1, "span_ft": 3, "tributary_width_ft": 1, "beam_b_in": -1, "beam_d_in": -3, "E": -1,
+                   "deflection_limit_ratio": 1},
+}
+
+@dataclass
+class Sensitivity:
+    utilization: Dict[str, np.ndarray]                                   # check -> (designs,)
+    derivative: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)  # check -> field -> ∂u/∂x
+    elasticity: Dict[str, Dict[str, np.ndarray]] = field(default_factory=dict)  # check -> field -> (x/u) ∂u/∂x
+
+    def drivers(self, check: str, i: int = 0, top: Optional[int] = None) -> List[Tuple[str, float, float]]:
+        """(field, elasticity, derivative) for design i, largest |elasticity| first."""
+        rows = [(k, float(e[i]), float(self.derivative[check][k][i])) for k, e in self.elasticity[check].items()
+                if np.isfinite(e[i]) and e[i] != 0]
+        rows.sort(key=lambda r: -abs(r[1]))
+        return rows[:top] if top else rows
+
+# ---------------- gradients ----------------
+
+def _columns(designs) -> Dict[str, np.ndarray]:
+    if isinstance(designs, Mapping):
+        cols = {**{k: np.nan for k in _FIELDS if k not in BATCH_FIELDS}, "include_soil_overburden": 0.0, **designs}
+    else:
+        cols = inputs_to_columns(designs, _FIELDS[:-1])
+        cols["include_soil_overburden"] = [_bool_from_yesno(x.include_soil_overburden) for x in designs]
+    return {k: np.atleast_1d(np.asarray(v, dtype=bool if k.startswith("has_") else float)) for k, v in cols.items()}
+
+def sensitivity(designs) -> Sensitivity:
+    """
+    Utilizations and their gradients for a list of Inputs (or a dict of columns named as the
+    Inputs fields, as for calc_batch). Footing checks follow footing_checks with the given size.
+    """
+    c = _columns(designs)
+    n = np.broadcast(*c.values()).shape[0]
+    c = {k: np.broadcast_to(v, (n,)) for k, v in c.items()}
+    g: Dict[str, Dict[str, np.ndarray]] = {k: {} for k in CHECKS}
+
+    def add(check, name, v):
+        g[check][name] = g[check].get(name, 0.0) + v
+
+    span, trib, b, d, E = c["span_ft"], c["tributary_width_ft"], c["beam_b_in"], c["beam_d_in"], c["E"]
+    DL, SL, LL = c["DL_psf"], c["SL_psf"], c["LL_psf"]
+    q = DL + SL + LL
+    R = q * trib * span / 2.0                   # reaction per post (= Vmax)
+    u = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Beam: same arithmetic as calc_batch
+        w_plf = q * trib
+        w_lbin = w_plf / 12.0
+        L_in = span * 12.0
+        L2_in = L_in * L_in
+        S, I = b * (d * d) / 6.0, b * (d * d * d) / 12.0
+        V = w_plf * span / 2.0
+        A_bear = c["post_base_bearing_area_in2"]
+        u["bending"] = w_lbin * L2_in / 8.0 / S / c["Fb_prime"]
+        u["shear"] = 1.5 * V / (b * d) / c["Fv_prime"]
+        u["bearing"] = V / np.maximum(A_bear, 1e-6) / c["Fc_perp_prime"]
+        u["deflection"] = 5 * w_lbin * (L2_in * L2_in) / (384.0 * E * I) / (L_in / c["deflection_limit_ratio"])
+        for check, powers in _BEAM.items():
+            for name, p in powers.items():
+                if name == "q":
+                    for k in ("DL_psf", "SL_psf", "LL_psf"):
+                        add(check, k, p / q)
+                elif name == "post_base_bearing_area_in2":
+                    add(check, name, np.where(A_bear > 1e-6, p / A_bear, 0.0))
+                else:
+                    add(check, name, p / c[name])
+
+        # Column: R / min(Fc'·A, 0.3·Pcrit)
+        Fc, pb, pd, Le = c["Fc_axis_prime"], c["post_section_b_in"], c["post_section_d_in"], c["post_unsupported_height_in"]
+        checked = _given(Fc) & _given(pb) & _given(pd)
+        A = pb * pd
+        r = np.sqrt(pb * (pd * pd * pd) / 12.0 / A)
+        slender = Le / np.maximum(r, 1e-6)
+        s2 = slender * slender
+        Pcrit = (np.pi ** 2) * E * A / (s2 + 1e-6)
+        crush = Fc * A <= 0.3 * Pcrit
+        u["column"] = np.where(checked, R / np.minimum(Fc * A, 0.3 * Pcrit), np.nan)
+        k = np.where(r > 1e-6, s2 / (s2 + 1e-6), 0.0)           # ∂ln(s² + 1e-6) / ∂ln s, halved
+        for name in ("DL_psf", "SL_psf", "LL_psf"):
+            add("column", name, 1.0 / q)
+        add("column", "span_ft", 1.0 / span)
+        add("column", "tributary_width_ft", 1.0 / trib)
+        add("column", "Fc_axis_prime", np.where(crush, -1.0 / Fc, 0.0))
+        add("column", "post_section_b_in", -1.0 / pb)
+        add("column", "post_section_d_in", np.where(crush, -1.0, -(1.0 + 2.0 * k)) / pd)
+        add("column", "E", np.where(crush, 0.0, -1.0 / E))
+        add("column", "post_unsupported_height_in", np.where(crush, 0.0, 2.0 * k / Le))
+
+        # Footing, as footing_checks with the given L × W × T
+        given = _given(c["footing_length_in"]) & _given(c["footing_width_in"]) & _given(c["footing_thickness_in"])
+        Lf, Wf, Tf = c["footing_length_in"], c["footing_width_in"], c["footing_thickness_in"]
+        Dcov = _or(c["footing_depth_below_grade_in"], 0.0)
+        gs, gc = _or(c["soil_unit_weight_pcf"], 120.0), _or(c["concrete_unit_weight_pcf"], 150.0)
+        A_ft2 = (Lf / 12.0) * (Wf / 12.0)
+        W_footing = (Lf / 12.0) * (Wf / 12.0) * (Tf / 12.0) * gc
+        incl = c["include_soil_overburden"] != 0
+        W_over = np.where(incl, A_ft2 * (Dcov / 12.0) * gs, 0.0)
+        W_post = _or(c["post_self_weight_lb"], 0.0)
+        V_struct = R + W_post
+        V_eff = V_struct + W_footing + W_over
+
+        # ∂(W_footing + W_overburden)/∂x, shared by sliding (through V_eff) and uplift
+        weights = {
+            "footing_length_in": (W_footing + W_over) / Lf,
+            "footing_width_in": (W_footing + W_over) / Wf,
+            "footing_thickness_in": W_footing / Tf,
+            "footing_depth_below_grade_in": np.where(incl, A_ft2 / 12.0 * gs, 0.0),
+            "concrete_unit_weight_pcf": np.where(_given(c["concrete_unit_weight_pcf"]), W_footing / gc, np.nan),
+            "soil_unit_weight_pcf": np.where(_given(c["soil_unit_weight_pcf"]), W_over / gs, np.nan),
+        }
+        # ∂R/∂x
+        reaction = {"DL_psf": R / q, "SL_psf": R / q, "LL_psf": R / q, "span_ft": R / span, "tributary_width_ft": R / trib}
+
+        qa, SFb = _or(c["soil_bearing_capacity_psf"], 0.0), _or(c["SF_bearing"], 1.0)
+        u["footing_bearing"] = np.where(given, V_struct / np.maximum(A_ft2, 1e-9) / (qa / np.maximum(SFb, 1e-9)), np.nan)
+        for name, dR in reaction.items():
+            add("footing_bearing", name, dR / V_struct)
+        add("footing_bearing", "post_self_weight_lb", 1.0 / V_struct)
+        add("footing_bearing", "footing_length_in", np.where(A_ft2 > 1e-9, -1.0 / Lf, 0.0))
+        add("footing_bearing", "footing_width_in", np.where(A_ft2 > 1e-9, -1.0 / Wf, 0.0))
+        add("footing_bearing", "soil_bearing_capacity_psf", -1.0 / qa)
+        add("footing_bearing", "SF_bearing", np.where(_given(c["SF_bearing"]) & (SFb > 1e-9), 1.0 / SFb, np.nan))
+
+        # Sliding: H / (μ·V_eff / SF)
+        lat, ww, eh = c["lateral_line_load_plf"], c["wind_wall_psf"], c["exposed_height_ft"]
+        use_lat, use_wind = ~np.isnan(lat), np.isnan(lat) & _given(ww) & _given(eh)
+        H = np.where(use_lat, lat * span / 2.0, np.where(use_wind, ww * eh * span / 2.0, 0.0))
+        mu, SFs = _or(c["base_friction_coeff_mu"], 0.5), _or(c["SF_sliding"], 1.5)
+        u["footing_sliding"] = np.where(given, H / (mu * V_eff / np.maximum(SFs, 1e-9)), np.nan)
+        add("footing_sliding", "span_ft", np.where(H > 0, 1.0 / span, 0.0))
+        add("footing_sliding", "lateral_line_load_plf", np.where(use_lat, 1.0 / lat, np.nan))
+        add("footing_sliding", "wind_wall_psf", np.where(use_wind, 1.0 / ww, np.nan))
+        add("footing_sliding", "exposed_height_ft", np.where(use_wind, 1.0 / eh, np.nan))
+        for name, dV in {**reaction, **weights, "post_self_weight_lb": 1.0}.items():
+            add("footing_sliding", name, -dV / V_eff)
+        add("footing_sliding", "base_friction_coeff_mu", np.where(_given(c["base_friction_coeff_mu"]), -1.0 / mu, np.nan))
+        add("footing_sliding", "SF_sliding", np.where(_given(c["SF_sliding"]) & (SFs > 1e-9), 1.0 / SFs, np.nan))
+
+        # Uplift: U / ((W_footing + W_overburden + credit) / SF)
+        roof, area = c["roof_uplift_psf"], c["uplift_area_per_post_ft2"]
+        has_U = _given(roof) & _given(area)
+        U = np.where(has_U, roof * area, 0.0)
+        credit, SFu = _or(c["credit_connector_uplift_lb"], 0.0), _or(c["SF_uplift"], 1.5)
+        resist = W_footing + W_over + credit
+        u["footing_uplift"] = np.where(given, U / (resist / np.maximum(SFu, 1e-9)), np.nan)
+        add("footing_uplift", "roof_uplift_psf", np.where(has_U, 1.0 / roof, np.nan))
+        add("footing_uplift", "uplift_area_per_post_ft2", np.where(has_U, 1.0 / area, np.nan))
+        for name, dW in {**weights, "credit_connector_uplift_lb": 1.0}.items():
+            add("footing_uplift", name, -dW / resist)
+        add("footing_uplift", "SF_uplift", np.where(_given(c["SF_uplift"]) & (SFu > 1e-9), 1.0 / SFu, np.nan))
+
+        out = Sensitivity(utilization={k: np.broadcast_to(u[k], (n,)) for k in CHECKS})
+        for check in CHECKS:
+            uc = out.utilization[check]
+            live = ~np.isnan(uc)
+            out.derivative[check], out.elasticity[check] = {}, {}
+            for name, gx in g[check].items():
+                gx = np.where(live, np.broadcast_to(gx, (n,)), np.nan)
+                x = np.where(np.isnan(c[name]), 0.0, c[name])
+                # u = 0 (no demand): both reported as 0
+                out.derivative[check][name] = np.where(uc > 0, uc * gx, np.where(np.isnan(gx), np.nan, 0.0))
+                out.elasticity[check][name] = np.where(uc > 0, x * gx, np.where(np.isnan(gx), np.nan, 0.0))
+    return out
+
+# ---------------- report ----------------
+
+def top_drivers(inputs: Inputs, footing_size=None, per_check: int = 3) -> List[Tuple[str, float, str, float, float]]:
+    """
+    (check, utilization, input, elasticity, ∂u/∂input) rows for one design: checks from the
+    highest utilization down, each with its per_check inputs of largest |elasticity|.
+    footing_size (a FootingSize from Option 2) stands in for a blank footing size.
+    """
+    from dataclasses import replace
+    if footing_size is not None:
+        inputs = replace(inputs, footing_length_in=footing_size.length_in, footing_width_in=footing_size.width_in,
+                         footing_thickness_in=footing_size.thickness_in)
+    s = sensitivity([inputs])
+    ranked = sorted((k for k in CHECKS if np.isfinite(s.utilization[k][0])), key=lambda k: -s.utilization[k][0])
+    rows = []
+    for check in ranked:
+        for name, e, dudx in s.drivers(check, 0, per_check):
+            rows.append((check, float(s.utilization[check][0]), name, e, dudx))
+    return rows
@@ -0,0 +1,201 @@
+# src/server.py
+# Long-lived local calc server for the Excel macro: modules, the Excel attach (io_xlwings._get_book),
+# the result cache, the recalculation graph and the indexed connector catalog stay warm between
+# clicks. The Connectors sheet is still read on every click (it may have been edited); the
+# catalog is rebuilt only when those specs change.
+#
+#   python -m src.server --port 8765 --idle-timeout 1800
+#
+#   GET  /health     -> {"ok": true, "pid": ..., "runs": ..., "queued": ...}
+#   POST /run        {"xlsx": "C:\\...\\Deck_Screening_Template.xlsm", "backend": "xlwings"}
+#   POST /shutdown
+#
+# Listens on 127.0.0.1 only. All runs go through one worker thread: Excel COM objects must stay
+# on the thread that created them, and runs are handled one at a time. A click for a workbook
+# that already has a run waiting in the queue joins that run instead of queueing another.
+# Once the server starts to stop (idle timeout, /shutdown) new runs are refused with 503 and
+# "closing": true, so nothing is queued behind a worker that has already exited.
+import os
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from .main import BACKENDS, run
+from .calc import pf
+from .cache import ResultCache, default_cache
+from .graph import RecalcGraph
+from .connectors import ConnectorCatalog
+
+DEFAULT_PORT = int(os.environ.get("DECK_SERVER_PORT", "8765"))
+DEFAULT_IDLE_TIMEOUT_S = 30 * 60
+
+def _co_initialize():
+    # xlwings on Windows: each thread that touches COM must initialize it first
+    try:
+        import pythoncom
+    except ImportError:
+        return None
+    pythoncom.CoInitialize()
+    return pythoncom
+
+def _summary(out, seconds: float) -> Dict[str, Any]:
+    r = out.results
+    flags = [r.bending_ok, r.shear_ok, r.bearing_ok, r.deflection_ok, out.footing.bearing_ok,
+             out.footing.sliding_ok, out.footing.uplift_ok]
+    if r.column_axial_ok is not None:
+        flags.append(r.column_axial_ok)
+    return {"ok": True, "status": pf(all(flags)), "seconds": round(seconds, 4), "recomputed": list(out.recomputed),
+            "top_connector": out.selection.top_model, "base_connector": out.selection.base_model}
+
+class CalcServer:
+    def __init__(self, port: int = DEFAULT_PORT, idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+                 cache: Optional[ResultCache] = None):
+        self.idle_timeout_s = idle_timeout_s
+        self.graph = RecalcGraph(cache)
+        self.catalogs: Dict[str, ConnectorCatalog] = {}    # digest of the specs -> indexed catalog
+        self.runs = 0
+        self.started = time.time()
+        self._last_activity = time.monotonic()
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._pending: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._closing = False                           # set under _lock; no submits accepted after
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.calc_server = self
+        self._worker = threading.Thread(target=self._work, name="deck-calc", daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def submit(self, xlsx: str, backend: str) -> Future:
+        key = (os.path.abspath(xlsx), backend)
+        with self._lock:
+            if self._closing:
+                fut = Future()
+                fut.set_result({"ok": False, "closing": True, "error": "calc server is shutting down"})
+                return fut
+            self._last_activity = time.monotonic()
+            fut = self._pending.get(key)
+            if fut is None:
+                fut = self._pending[key] = Future()
+                self._queue.put(key)
+        return fut
+
+    def health(self) -> Dict[str, Any]:
+        return {"ok": True, "pid": os.getpid(), "uptime_s": round(time.time() - self.started, 1),
+                "runs": self.runs, "queued": self._queue.qsize(), "closing": self._closing}
+
+    def _work(self):
+        com = _co_initialize()
+        try:
+            while True:
+                try:
+                    key = self._queue.get(timeout=1.0)
+                except queue.Empty:
+                    with self._lock:
+                        # Checked together with submit's queue.put, so no run is left behind in the queue
+                        if (self.idle_timeout_s and self._queue.empty()
+                                and time.monotonic() - self._last_activity > self.idle_timeout_s):
+                            self._closing = True
+                    if self._closing:
+                        threading.Thread(target=self._httpd.shutdown, daemon=True).start()
+                        return
+                    continue
+                if key is None:
+                    return
+                with self._lock:
+                    fut = self._pending.pop(key)      # later clicks for this workbook queue a new run
+                if not fut.set_running_or_notify_cancel():
+                    continue
+                t0 = time.perf_counter()
+                try:
+                    out = run(key[0], backend=key[1], cache=self.graph.cache, graph=self.graph,
+                              catalogs=self.catalogs)
+                except Exception as e:
+                    fut.set_result({"ok": False, "error": f"{type(e).__name__}: {e}"})
+                else:
+                    self.runs += 1
+                    fut.set_result(_summary(out, time.perf_counter() - t0))
+                finally:
+                    self._last_activity = time.monotonic()
+        finally:
+            if com is not None:
+                com.CoUninitialize()
+
+    def serve_forever(self):
+        self._worker.start()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            with self._lock:
+                self._closing = True
+            self._queue.put(None)                       # after any runs already queued
+            self._httpd.server_close()
+
+    def shutdown(self):
+        with self._lock:
+            self._closing = True
+        threading.Thread(target=self._httpd.shutdown, daemon=True).start()
+
+class _Handler(BaseHTTPRequestHandler):
+    def _reply(self, code: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            return self._reply(200, self.server.calc_server.health())
+        self._reply(404, {"ok": False, "error": f"unknown path {self.path}"})
+
+    def do_POST(self):
+        srv = self.server.calc_server
+        if self.path == "/shutdown":
+            self._reply(200, {"ok": True})
+            return srv.shutdown()
+        if self.path != "/run":
+            return self._reply(404, {"ok": False, "error": f"unknown path {self.path}"})
+        try:
+            n = int(self.headers.get("Content-Length") or 0)
+            req = json.loads(self.rfile.read(n) or b"{}")
+            xlsx, backend = req["xlsx"], req.get("backend", "xlwings")
+            if backend not in BACKENDS:
+                raise ValueError(f"unknown backend '{backend}'")
+        except (ValueError, KeyError, TypeError) as e:
+            return self._reply(400, {"ok": False, "error": f"bad request: {e}"})
+        result = srv.submit(xlsx, backend).result()
+        self._reply(200 if result["ok"] else 503 if result.get("closing") else 500, result)
+
+    def log_message(self, fmt, *args):
+        pass    # the macro does not read stderr; keep the console quiet
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Keep the deck screening calc warm for the Excel macro.")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT_S,
+                    help="seconds without requests before the server exits (0 = never)")
+    ap.add_argument("--cache-dir", default=None, help="disk store for results (default: $DECK_CACHE_DIR)")
+    args = ap.parse_args(argv)
+    cache = ResultCache(disk_dir=args.cache_dir) if args.cache_dir else default_cache()
+    try:
+        server = CalcServer(args.port, args.idle_timeout, cache)
+    except OSError as e:            # port taken: most likely another server is already running
+        print(f"Cannot listen on 127.0.0.1:{args.port}: {e}", file=sys.stderr)
+        return 1
+    print(f"Deck screening server on http://127.0.0.1:{server.port} (pid {os.getpid()})", file=sys.stderr, flush=True)
+    server.serve_forever()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
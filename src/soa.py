@@ -0,0 +1,250 @@
+# src/soa.py
+# Struct-of-arrays containers for large batches: one NumPy array per Inputs / Results field
+# instead of one Python object per design (about 0.8 KB per Inputs and 0.66 KB per unlogged Results;
+# a batch holds both in about 325 bytes per design).
+#
+#   batch = InputsBatch.from_inputs(inputs_list)       # or InputsBatch.from_columns(...)
+#   res = batch.calc()                                  # calc_batch -> ResultsBatch, no copies
+#   row = batch[17]; row.span_ft                        # zero-copy row view (duck-types as Inputs)
+#   part = batch[1000:2000]                             # slices are array views too
+#   batch.to_inputs() / res.to_results()                # back to dataclasses
+#
+# Column kinds come from the dataclass annotations: floats -> float64, Optional[...] adds a
+# "present" mask (missing floats also hold NaN so columns feed calc_batch directly), flags ->
+# bool (yes/no text as on the Inputs sheet), connector models -> int32 codes into a per-batch category list (-1 = None). A column
+# that is the same for every row (site parameters, safety factors in a sweep) is kept as a
+# zero-stride view of one element. Results calc logs are not stored (re-run calc on a row).
+import math
+import typing
+from dataclasses import MISSING, fields
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import Inputs, Results
+from .batch import BATCH_FIELDS, BatchResults, calc_batch, _f64
+from .calclog import NullLog
+from .io_common import _yn
+
+def _field_kinds(cls, skip=()) -> Dict[str, Tuple[str, bool]]:
+    # field -> (kind, optional) with kind in float / bool / category
+    out = {}
+    for f in fields(cls):
+        if f.name in skip:
+            continue
+        t, optional = f.type, False
+        if typing.get_origin(t) is typing.Union:
+            args = [a for a in typing.get_args(t) if a is not type(None)]
+            t, optional = args[0], True
+        out[f.name] = ({float: "float", bool: "bool", str: "category"}[t], optional)
+    return out
+
+def _compact(a: np.ndarray) -> np.ndarray:
+    # Same value in every row -> zero-stride view of a single element
+    if len(a) > 1:
+        first = a[:1]
+        same = a == first
+        if a.dtype.kind == "f":
+            same |= np.isnan(a) & np.isnan(first)
+        if same.all():
+            return np.broadcast_to(first.copy(), a.shape)
+    return a
+
+def _nbytes(a: np.ndarray) -> int:
+    return a.itemsize if (a.ndim and a.strides[0] == 0) else a.nbytes
+
+class RowView:
+    """Row i of a batch: attribute reads go straight to the columns, nothing is copied."""
+    __slots__ = ("_batch", "_i")
+
+    def __init__(self, batch: "_ColumnBatch", i: int):
+        self._batch, self._i = batch, i
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._batch._value(name, self._i)
+
+    def __repr__(self):
+        return f"RowView({type(self._batch).__name__}, row {self._i})"
+
+class _ColumnBatch:
+    _KINDS: Dict[str, Tuple[str, bool]] = {}
+
+    def __init__(self, n: int, values: Dict[str, np.ndarray], present: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]]):
+        self.n = n
+        self.values = values            # field -> array (float64 / bool / int32 codes)
+        self.present = present          # optional field -> bool mask (True = not None)
+        self.categories = categories    # category field -> labels for the codes
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return type(self)(len(range(*i.indices(self.n))), {k: v[i] for k, v in self.values.items()},
+                              {k: v[i] for k, v in self.present.items()}, self.categories,
+                              *self._extra_slice(i))
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return RowView(self, i)
+
+    def _extra_slice(self, i: slice) -> tuple:
+        return ()
+
+    def _value(self, name: str, i: int):
+        kind = self._KINDS.get(name)
+        if kind is None:
+            raise AttributeError(name)
+        if kind[1] and not self.present[name][i]:
+            return None
+        v = self.values[name][i]
+        if kind[0] == "category":
+            return self.categories[name][v] if v >= 0 else None
+        return v.item()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns (zero-stride constant columns count once)."""
+        return sum(_nbytes(a) for d in (self.values, self.present) for a in d.values())
+
+    @classmethod
+    def _from_objects(cls, objs: Sequence[Any]):
+        n = len(objs)
+        values, present, categories = {}, {}, {}
+        for name, (kind, optional) in cls._KINDS.items():
+            vals = [getattr(o, name) for o in objs]
+            if optional:
+                present[name] = _compact(np.fromiter((v is not None for v in vals), bool, n))
+            if kind == "category":
+                labels: Dict[str, int] = {}
+                codes = np.fromiter((-1 if v is None else labels.setdefault(v, len(labels)) for v in vals), np.int32, n)
+                values[name], categories[name] = _compact(codes), list(labels)
+            elif kind == "bool":
+                values[name] = _compact(np.fromiter((_yn(v) for v in vals), bool, n))
+            else:
+                values[name] = _compact(np.fromiter((math.nan if v is None else v for v in vals), np.float64, n))
+        return values, present, categories
+
+    def _lists(self) -> Dict[str, list]:
+        # Python values per field (None where not present) for rebuilding dataclasses
+        out = {}
+        for name, (kind, optional) in self._KINDS.items():
+            col = self.values[name].tolist()
+            if kind == "category":
+                labels = self.categories[name]
+                col = [labels[c] if c >= 0 else None for c in col]
+            if optional:
+                col = [v if p else None for v, p in zip(col, self.present[name].tolist())]
+            out[name] = col
+        return out
+
+# ---------------- Inputs ----------------
+
+class InputsBatch(_ColumnBatch):
+    _KINDS = _field_kinds(Inputs)
+
+    @classmethod
+    def from_inputs(cls, inputs: Sequence[Inputs]) -> "InputsBatch":
+        return cls(len(inputs), *cls._from_objects(inputs))
+
+    @classmethod
+    def from_columns(cls, n: Optional[int] = None, **columns) -> "InputsBatch":
+        """Build from per-field arrays, lists (None allowed) or scalars; omitted fields take Inputs defaults."""
+        unknown = sorted(set(columns) - set(cls._KINDS))
+        if unknown:
+            raise ValueError(f"Not Inputs fields: {', '.join(unknown)}")
+        n = n if n is not None else max((np.size(v) for v in columns.values()), default=0)
+        defaults = {f.name: f.default for f in fields(Inputs)}
+        values, present, categories = {}, {}, {}
+        for name, (kind, optional) in cls._KINDS.items():
+            v = columns.get(name, defaults[name])
+            if v is MISSING:
+                raise ValueError(f"Inputs field {name} is required.")
+            scalar = v is None or isinstance(v, str) or np.ndim(v) == 0
+            if kind == "category":
+                vals = [v] * n if scalar else list(v)
+                labels: Dict[str, int] = {}
+                codes = np.fromiter((-1 if x is None else labels.setdefault(x, len(labels)) for x in vals), np.int32, n)
+                values[name], categories[name] = _compact(codes), list(labels)
+                mask = codes >= 0
+            elif kind == "bool":
+                vals = [v] * n if scalar else list(v)
+                values[name] = _compact(np.fromiter((_yn(x) for x in vals), bool, n))
+                mask = np.fromiter((x is not None for x in vals), bool, n)
+            else:
+                values[name] = _compact(np.broadcast_to(_f64(v), (n,)))
+                mask = ~np.isnan(values[name])
+            if optional:
+                present[name] = _compact(np.asarray(mask))
+        return cls(n, values, present, categories)
+
+    def inputs(self, i: int) -> Inputs:
+        """Inputs dataclass for row i."""
+        return Inputs(**{name: self._value(name, i) for name in self._KINDS})
+
+    def to_inputs(self) -> List[Inputs]:
+        cols = self._lists()
+        return [Inputs(*row) for row in zip(*(cols[f] for f in self._KINDS))]
+
+    def columns(self, names: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Arrays in calc_batch form (floats with NaN for None, flags as bool) - views, not copies."""
+        return {name: self.values[name] for name in (names or BATCH_FIELDS)}
+
+    def calc(self) -> "ResultsBatch":
+        return ResultsBatch.from_batch(calc_batch(**self.columns()))
+
+# ---------------- Results ----------------
+
+class ResultsBatch(_ColumnBatch):
+    _KINDS = _field_kinds(Results, skip=("lateral_warnings", "calc_log"))
+
+    def __init__(self, n, values, present, categories, lateral: Optional[Dict[str, np.ndarray]] = None):
+        super().__init__(n, values, present, categories)
+        self.lateral = lateral or {}    # lateral_warnings key -> bool column
+
+    def _extra_slice(self, i: slice) -> tuple:
+        return ({k: v[i] for k, v in self.lateral.items()},)
+
+    def _value(self, name: str, i: int):
+        if name == "lateral_warnings":
+            return {k: bool(v[i]) for k, v in self.lateral.items()}
+        if name == "calc_log":
+            return NullLog()
+        return super()._value(name, i)
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + sum(_nbytes(a) for a in self.lateral.values())
+
+    @classmethod
+    def from_results(cls, results: Sequence[Results]) -> "ResultsBatch":
+        values, present, categories = cls._from_objects(results)
+        keys = list(results[0].lateral_warnings) if results else []
+        lateral = {k: _compact(np.fromiter((r.lateral_warnings[k] for r in results), bool, len(results))) for k in keys}
+        return cls(len(results), values, present, categories, lateral)
+
+    @classmethod
+    def from_batch(cls, beam: BatchResults) -> "ResultsBatch":
+        """Wrap calc_batch output without copying (column_checked becomes the column masks)."""
+        n = len(beam)
+        full = lambda a: np.broadcast_to(a, (n,))
+        values = {name: full(getattr(beam, name)) for name in cls._KINDS}
+        checked = full(beam.column_checked)
+        present = {"column_axial_ok": checked, "column_allowable_axial_lb": checked}
+        return cls(n, values, present, {}, {k: full(v) for k, v in beam.lateral_warnings.items()})
+
+    def result(self, i: int) -> Results:
+        """Results dataclass for row i (no calc log)."""
+        return Results(**{name: self._value(name, i) for name in self._KINDS},
+                       lateral_warnings=self._value("lateral_warnings", i), calc_log=NullLog())
+
+    def to_results(self) -> List[Results]:
+        cols = self._lists()
+        names = list(self._KINDS)
+        lat = {k: v.tolist() for k, v in self.lateral.items()}
+        return [Results(*row, lateral_warnings={k: lat[k][i] for k in lat}, calc_log=NullLog())
+                for i, row in enumerate(zip(*(cols[f] for f in names)))]
@@ -0,0 +1,233 @@
+# src/span_tables.py
+# Allowable-span tables: the longest simple span passing bending, shear and deflection for every
+# section × grade (sections.build_catalog) × tributary width × snow/live load on a grid.
+#
+#   table = load_span_table()                                   # built once, then read from disk
+#   table.max_span("2-ply 2x10 SPF No.2", tributary_ft=8, load_psf=40)
+#   python -m src.span_tables "2-ply 2x10 SPF No.2" --trib 8 --load 40
+#
+# With w = (dead + load) × trib, calc's three checks give closed-form limits: bending
+# L ∝ w^-1/2, shear L ∝ w^-1, deflection L ∝ w^-1/3. Each grid value is the smallest of them,
+# confirmed (and nudged down where rounding demands) with calc_batch, then stored as float32
+# rounded down. ln L is the minimum of terms linear in ln trib + ln(dead + load), i.e. concave
+# in those coordinates, so bilinear interpolation there never overestimates; queries below the
+# grid use its edge (spans only grow as loads fall) and queries above it raise ValueError.
+#
+# Tables are .npz files named by TABLE_VERSION (CODE_VERSION plus the source of the modules
+# that build the table: batch, sections, span_tables) and a hash of the grid definition, under
+# $DECK_CACHE_DIR/span_tables (else ~/.cache/deck_screening/span_tables); tables of other
+# versions are deleted when a new table is written.
+import os
+import sys
+import json
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .sections import SectionCandidate, build_catalog
+from .batch import calc_batch
+from .cache import CODE_VERSION, source_version, stable_hash
+
+CHECKS = ("bending", "shear", "deflection")
+TABLE_VERSION = source_version(("batch.py", "sections.py", "span_tables.py"), salt=CODE_VERSION)
+
+@dataclass(frozen=True)
+class SpanGrid:
+    sections: Tuple[SectionCandidate, ...] = field(default_factory=lambda: tuple(build_catalog()))
+    tributary_ft: Tuple[float, ...] = (2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 12.0, 14.0, 16.0)
+    load_psf: Tuple[float, ...] = (10.0, 20.0, 25.0, 30.0, 35.0, 40.0, 50.0, 60.0, 70.0, 80.0, 100.0)  # snow + live
+    dead_psf: float = 10.0
+    deflection_limit_ratio: float = 240.0
+
+    def key(self) -> str:
+        return stable_hash("span-table", TABLE_VERSION, self)
+
+@dataclass
+class SpanTable:
+    labels: Tuple[str, ...]
+    tributary_ft: np.ndarray            # (T,) ascending
+    load_psf: np.ndarray                # (Q,) ascending
+    dead_psf: float
+    deflection_limit_ratio: float
+    spans_ft: np.ndarray                # (sections, T, Q) float32, rounded down
+    governs: np.ndarray                 # (sections, T, Q) index into CHECKS
+    key: str = ""
+
+    def __post_init__(self):
+        self._index = {s.lower(): i for i, s in enumerate(self.labels)}
+
+    def section_index(self, section: Union[str, SectionCandidate]) -> int:
+        label = section.label if isinstance(section, SectionCandidate) else section
+        try:
+            return self._index[label.strip().lower()]
+        except KeyError:
+            raise KeyError(f"Section '{label}' is not in the span table.") from None
+
+    def max_span(self, section: Union[str, SectionCandidate], tributary_ft, load_psf):
+        """Conservative maximum span (ft); scalars or arrays broadcast together."""
+        i = self.section_index(section)
+        t = np.asarray(tributary_ft, dtype=float)
+        q = np.asarray(load_psf, dtype=float)
+        if np.any(t > self.tributary_ft[-1]) or np.any(q > self.load_psf[-1]):
+            raise ValueError(f"Outside the span table (tributary ≤ {self.tributary_ft[-1]:g} ft, "
+                             f"load ≤ {self.load_psf[-1]:g} psf); build a table with a wider grid.")
+        x = np.log(np.maximum(t, self.tributary_ft[0]))
+        y = np.log(self.dead_psf + np.maximum(q, self.load_psf[0]))
+        xs = np.log(self.tributary_ft)
+        ys = np.log(self.dead_psf + self.load_psf)
+        ix = np.clip(np.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+        iy = np.clip(np.searchsorted(ys, y, side="right") - 1, 0, len(ys) - 2)
+        fx = np.clip((x - xs[ix]) / (xs[ix + 1] - xs[ix]), 0.0, 1.0)
+        fy = np.clip((y - ys[iy]) / (ys[iy + 1] - ys[iy]), 0.0, 1.0)
+        lnL = np.log(self.spans_ft[i].astype(float))
+        v = ((1 - fx) * (1 - fy) * lnL[ix, iy] + fx * (1 - fy) * lnL[ix + 1, iy]
+             + (1 - fx) * fy * lnL[ix, iy + 1] + fx * fy * lnL[ix + 1, iy + 1])
+        out = np.exp(v) * (1.0 - 1e-12)                 # absorb exp/log rounding
+        return float(out) if out.ndim == 0 else out
+
+    def rows(self, section: Union[str, SectionCandidate]):
+        """(tributary_ft, load_psf, span_ft, governing check) for every grid point of one section."""
+        i = self.section_index(section)
+        return [(float(t), float(q), float(self.spans_ft[i, a, b]), CHECKS[self.governs[i, a, b]])
+                for a, t in enumerate(self.tributary_ft) for b, q in enumerate(self.load_psf)]
+
+# ---------------- build ----------------
+
+def _limits(b, d, Fb, Fv, E, w_plf, ratio):
+    # Closed-form span (ft) at which each of calc's beam checks reaches its limit
+    w_lbin = w_plf / 12.0
+    S = b * (d * d) / 6.0
+    I = b * (d * d * d) / 12.0
+    L_bend = np.sqrt(8.0 * S * Fb / w_lbin) / 12.0
+    L_shear = 4.0 * Fv * b * d / (3.0 * w_plf)
+    L_defl = np.cbrt(384.0 * E * I / (5.0 * w_lbin * ratio)) / 12.0
+    return np.stack(np.broadcast_arrays(L_bend, L_shear, L_defl))
+
+def _beam_pass(span, b, d, Fb, Fv, E, trib, load, grid: SpanGrid):
+    n = span.size
+    one = np.ones(n)
+    r = calc_batch(span_ft=span, tributary_width_ft=trib, beam_b_in=b, beam_d_in=d,
+                   post_unsupported_height_in=one, post_base_bearing_area_in2=one,
+                   Fb_prime=Fb, Fv_prime=Fv, Fc_perp_prime=one, E=E,
+                   DL_psf=np.full(n, grid.dead_psf), SL_psf=load, LL_psf=np.zeros(n),
+                   deflection_limit_ratio=np.full(n, grid.deflection_limit_ratio),
+                   Fc_axis_prime=None, post_section_b_in=None, post_section_d_in=None,
+                   has_knee_braces=False, has_moment_top_connector=False, has_hold_downs_or_shear_base=False)
+    return r.bending_ok & r.shear_ok & r.deflection_ok
+
+def build_span_table(grid: Optional[SpanGrid] = None) -> SpanTable:
+    grid = grid or SpanGrid()
+    secs = grid.sections
+    prop = lambda f: np.array([f(c) for c in secs], dtype=float)[:, None, None]
+    b, d = prop(lambda c: c.b_in), prop(lambda c: c.d_in)
+    Fb, Fv, E = prop(lambda c: c.grade.Fb_prime), prop(lambda c: c.grade.Fv_prime), prop(lambda c: c.grade.E)
+    trib = np.asarray(grid.tributary_ft, dtype=float)[None, :, None]
+    load = np.asarray(grid.load_psf, dtype=float)[None, None, :]
+    w_plf = (grid.dead_psf + load + 0.0) * trib                      # same sum order as calc: DL + SL + LL
+    limits = _limits(b, d, Fb, Fv, E, w_plf, grid.deflection_limit_ratio)
+    governs = limits.argmin(0).astype(np.uint8)
+    span = limits.min(0)
+
+    # Confirm with calc_batch; step down one ulp at a time where rounding puts a limit just over
+    full = lambda a: np.broadcast_to(a, span.shape).ravel()
+    args = [full(a) for a in (b, d, Fb, Fv, E)]
+    cols = (full(trib), full(load), grid)
+    flat = span.ravel().copy()
+    for _ in range(64):
+        bad = ~_beam_pass(flat, *args, *cols)
+        if not bad.any():
+            break
+        flat[bad] = np.nextafter(flat[bad], 0.0)
+    else:
+        raise RuntimeError("Span table limits could not be confirmed with calc_batch.")
+    f32 = flat.astype(np.float32)
+    over = f32.astype(float) > flat
+    f32[over] = np.nextafter(f32[over], np.float32(0))
+    if not _beam_pass(f32.astype(float), *args, *cols).all():
+        raise RuntimeError("Rounded span table values fail calc_batch.")
+    return SpanTable(labels=tuple(c.label for c in secs), tributary_ft=np.asarray(grid.tributary_ft, dtype=float),
+                     load_psf=np.asarray(grid.load_psf, dtype=float), dead_psf=grid.dead_psf,
+                     deflection_limit_ratio=grid.deflection_limit_ratio,
+                     spans_ft=f32.reshape(span.shape), governs=governs, key=grid.key())
+
+# ---------------- disk cache ----------------
+
+def default_dir() -> str:
+    root = os.environ.get("DECK_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "deck_screening")
+    return os.path.join(root, "span_tables")
+
+def table_path(grid: SpanGrid, cache_dir: Optional[str] = None) -> str:
+    return os.path.join(cache_dir or default_dir(), f"span_table_{TABLE_VERSION}_{grid.key()[:16]}.npz")
+
+def save_span_table(table: SpanTable, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    meta = json.dumps({"key": table.key, "dead_psf": table.dead_psf,
+                       "deflection_limit_ratio": table.deflection_limit_ratio, "labels": list(table.labels)})
+    tmp = path + ".tmp.npz"
+    np.savez_compressed(tmp, spans_ft=table.spans_ft, governs=table.governs,
+                        tributary_ft=table.tributary_ft, load_psf=table.load_psf, meta=np.array(meta))
+    os.replace(tmp, path)
+    for name in os.listdir(os.path.dirname(path)):
+        if name.startswith("span_table_") and not name.startswith(f"span_table_{TABLE_VERSION}_"):
+            try:
+                os.remove(os.path.join(os.path.dirname(path), name))
+            except OSError:
+                pass
+
+def read_span_table(path: str) -> SpanTable:
+    with np.load(path) as z:
+        meta = json.loads(str(z["meta"]))
+        return SpanTable(labels=tuple(meta["labels"]), tributary_ft=z["tributary_ft"], load_psf=z["load_psf"],
+                         dead_psf=meta["dead_psf"], deflection_limit_ratio=meta["deflection_limit_ratio"],
+                         spans_ft=z["spans_ft"], governs=z["governs"], key=meta["key"])
+
+_TABLES: Dict[str, SpanTable] = {}
+
+def load_span_table(grid: Optional[SpanGrid] = None, cache_dir: Optional[str] = None,
+                    rebuild: bool = False) -> SpanTable:
+    """Table for this grid: from memory, else from disk, else built and saved."""
+    grid = grid or SpanGrid()
+    path = table_path(grid, cache_dir)
+    table = None if rebuild else _TABLES.get(path)
+    if table is None and not rebuild and os.path.exists(path):
+        try:
+            table = read_span_table(path)
+        except (OSError, ValueError, KeyError):
+            table = None                # unreadable / partial file: rebuild it
+        if table is not None and table.key != grid.key():
+            table = None
+    if table is None:
+        table = build_span_table(grid)
+        try:
+            save_span_table(table, path)
+        except OSError:
+            pass                        # read-only cache location: keep the in-memory table
+    _TABLES[path] = table
+    return table
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Maximum simple span from the precomputed span tables.")
+    ap.add_argument("section", nargs="?", help='e.g. "2-ply 2x10 SPF No.2" (omit with --list-sections)')
+    ap.add_argument("--trib", type=float, help="tributary width (ft)")
+    ap.add_argument("--load", type=float, help="snow + live load (psf)")
+    ap.add_argument("--list-sections", action="store_true")
+    ap.add_argument("--rebuild", action="store_true")
+    args = ap.parse_args(argv)
+    table = load_span_table(rebuild=args.rebuild)
+    if args.list_sections or not args.section:
+        print("\n".join(table.labels))
+        return 0
+    if args.trib is None or args.load is None:
+        print(f"{'trib ft':>8}{'load psf':>10}{'span ft':>10}  governs")
+        for t, q, s, g in table.rows(args.section):
+            print(f"{t:>8g}{q:>10g}{s:>10.2f}  {g}")
+        return 0
+    span = table.max_span(args.section, args.trib, args.load)
+    print(f"{args.section}: max span {span:.2f} ft at {args.trib:g} ft tributary, "
+          f"{table.dead_psf:g} psf dead + {args.load:g} psf, L/{table.deflection_limit_ratio:g}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,330 @@
+# src/store.py
+# Columnar results store for batch runs (10^5+ rows), instead of the Excel Results sheet.
+#
+#   with ResultsStore("out/run1") as st:                    # one directory per store
+#       for chunk in chunks:
+#           beam = calc_batch(**cols)
+#           st.append(beam_columns(beam), footing_columns(fchecks), selection_columns(selections))
+#   cols = open_results("out/run1")                         # column -> array, memory-mapped
+#   write_summary_xlsx("out/run1", "out/run1_summary.xlsx") # pass rates / ranges for Excel users
+#
+# Layout: <dir>/schema.json plus either one part-NNNNN.parquet file per append (pyarrow installed;
+# each part is complete on its own) or one raw little-endian .bin file per column, read back with
+# np.memmap. Text columns (connector models, optional calc logs) are stored as UTF-8 bytes plus an
+# int64 offsets file. The row count (and part count) in schema.json is updated after each chunk's
+# data is written, so a run that dies mid-append still reads back as the chunks completed before it.
+# A store only ever deletes files it lists in its own schema.json.
+import os
+import json
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .models import Results
+from .batch import BatchResults
+from .footing import FootingChecks
+from .connectors import ConnectionSelection, TOP_CHECKS, BASE_CHECKS
+from .report import ResultsGrid, _GridBuilder
+from . import timing
+
+SCHEMA_FILE = "schema.json"
+PARQUET_PART = "part-{:05d}.parquet"
+FORMATS = ("auto", "parquet", "raw")
+
+def _have_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+# ---------------- flattening to columns ----------------
+
+# Results scalar fields; optional column values are split like BatchResults (checked flag + NaN)
+RESULT_FIELDS = ("line_load_plf", "max_moment_lb_in", "max_shear_lb", "bending_stress_psi", "shear_stress_psi",
+                 "bearing_stress_psi", "deflection_in", "deflection_limit_in", "reaction_per_post_lb",
+                 "bending_ok", "shear_ok", "bearing_ok", "deflection_ok",
+                 "column_checked", "column_axial_ok", "column_allowable_axial_lb")
+FOOTING_FIELDS = ("V_struct_lb", "H_post_lb", "U_post_lb", "W_footing_lb", "W_overburden_lb", "V_eff_lb",
+                  "q_actual_psf", "q_allow_eff_psf", "bearing_ok", "R_slide_lb", "sliding_ok",
+                  "R_uplift_lb", "uplift_ok")
+
+def beam_columns(beam: BatchResults) -> Dict[str, np.ndarray]:
+    """calc_batch output as store columns (same names as results_columns)."""
+    n = len(beam)
+    cols = {f: np.broadcast_to(getattr(beam, f), (n,)) for f in RESULT_FIELDS}
+    for k, v in beam.lateral_warnings.items():
+        cols[f"lateral_{k}"] = np.broadcast_to(v, (n,))
+    return cols
+
+def results_columns(results: Sequence[Results], include_log: bool = False) -> Dict[str, np.ndarray]:
+    """A list of calc.calc Results as store columns (calc log text only with include_log)."""
+    cols: Dict[str, Any] = {f: [getattr(r, f) for r in results] for f in RESULT_FIELDS[:13]}
+    cols["column_checked"] = [r.column_axial_ok is not None for r in results]
+    cols["column_axial_ok"] = [bool(r.column_axial_ok) for r in results]
+    cols["column_allowable_axial_lb"] = [np.nan if r.column_allowable_axial_lb is None else r.column_allowable_axial_lb
+                                         for r in results]
+    for k in (results[0].lateral_warnings if results else {}):
+        cols[f"lateral_{k}"] = [r.lateral_warnings[k] for r in results]
+    if include_log:
+        cols["calc_log"] = ["\n".join(r.calc_log.lines()) for r in results]
+    return {k: np.asarray(v) for k, v in cols.items()}
+
+def footing_columns(checks: Sequence[Optional[FootingChecks]], include_log: bool = False,
+                    prefix: str = "footing_") -> Dict[str, np.ndarray]:
+    """FootingChecks per row (None = not checked: NaN / False) as prefixed store columns."""
+    cols: Dict[str, Any] = {}
+    for f in FOOTING_FIELDS:
+        miss = False if f.endswith("_ok") else np.nan
+        cols[prefix + f] = [miss if c is None else getattr(c, f) for c in checks]
+    if include_log:
+        cols[prefix + "log"] = ["" if c is None else "\n".join(c.calc_log.lines()) for c in checks]
+    return {k: np.asarray(v) for k, v in cols.items()}
+
+def selection_columns(selections: Sequence[ConnectionSelection]) -> Dict[str, np.ndarray]:
+    """Connector models and demand / capacity / pass per check (NaN / False where no connector)."""
+    cols: Dict[str, Any] = {
+        "top_model": [s.top_model or "" for s in selections],
+        "base_model": [s.base_model or "" for s in selections],
+    }
+    for side, names in (("top", TOP_CHECKS), ("base", BASE_CHECKS)):
+        for k in names:
+            for part, miss in (("demand", np.nan), ("cap", np.nan), ("pass", False)):
+                cols[f"{side}_{k}_{part}"] = [getattr(s, f"{side}_checks").get(k, {}).get(part, miss) for s in selections]
+    return {k: np.asarray(v, dtype=bool if k.endswith("_pass") else None) for k, v in cols.items()}
+
+# ---------------- store ----------------
+
+def _kind(a: np.ndarray) -> str:
+    if a.dtype.kind in "USO":
+        return "text"
+    if a.dtype.kind == "b":
+        return "bool"
+    if a.dtype.kind in "iu":
+        return "int"
+    return "float"
+
+_DTYPES = {"bool": "|b1", "int": "<i8", "float": "<f8"}
+
+class TextColumn:
+    """Read-only, memory-mapped text column: len(), [i], [a:b] and iteration decode on demand."""
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self._off, self._data = offsets, data
+
+    def __len__(self) -> int:
+        return len(self._off) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return bytes(self._data[self._off[i]:self._off[i + 1]]).decode("utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def to_numpy(self) -> np.ndarray:
+        return np.array(list(self), dtype=object)
+
+class ResultsStore:
+    """Append-only columnar sink. The first append fixes the column set; later chunks must match."""
+    def __init__(self, path: str, format: str = "auto", overwrite: bool = False):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown store format '{format}' (choose from {', '.join(FORMATS)}).")
+        if format == "auto":
+            format = "parquet" if _have_pyarrow() else "raw"
+        self.path, self.format = path, format
+        if os.path.exists(os.path.join(path, SCHEMA_FILE)):
+            if not overwrite:
+                raise FileExistsError(f"{path} already holds a results store (pass overwrite=True to replace it).")
+            for name in store_files(path):
+                if os.path.exists(os.path.join(path, name)):
+                    os.remove(os.path.join(path, name))
+        elif os.path.isdir(path) and os.listdir(path) and not overwrite:
+            raise FileExistsError(f"{path} is not empty and not a results store (pass overwrite=True to use it anyway).")
+        os.makedirs(path, exist_ok=True)
+        self.columns: Dict[str, str] = {}           # name -> kind, in first-append order
+        self.n_rows = 0
+        self.n_parts = 0
+        self._write_schema()
+
+    def _write_schema(self):
+        tmp = os.path.join(self.path, SCHEMA_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"format": self.format, "n_rows": self.n_rows, "n_parts": self.n_parts,
+                       "columns": self.columns}, fh, indent=1)
+        os.replace(tmp, os.path.join(self.path, SCHEMA_FILE))
+
+    @timing.timed("store.append")
+    def append(self, *column_sets: Mapping[str, Any]):
+        """Append one chunk of rows given as one or more {column: array} dicts of equal length."""
+        cols: Dict[str, np.ndarray] = {}
+        for cs in column_sets:
+            cols.update({k: np.asarray(v) for k, v in cs.items()})
+        lengths = {len(v) for v in cols.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns in one chunk differ in length: {sorted(lengths)}.")
+        n = lengths.pop() if lengths else 0
+        if not self.columns:
+            self.columns = {k: _kind(v) for k, v in cols.items()}
+        elif set(cols) != set(self.columns):
+            missing, extra = sorted(set(self.columns) - set(cols)), sorted(set(cols) - set(self.columns))
+            raise ValueError(f"Chunk columns differ from the store's: missing {missing}, unexpected {extra}.")
+        if n == 0:
+            return
+        if self.format == "parquet":
+            self._append_parquet(cols)
+            self.n_parts += 1
+        else:
+            self._append_raw(cols, first=self.n_rows == 0)
+        self.n_rows += n
+        self._write_schema()
+        timing.add("rows", n)
+
+    def _append_raw(self, cols: Dict[str, np.ndarray], first: bool):
+        # The first chunk truncates: a same-named file left in the directory is replaced, not extended
+        mode = "wb" if first else "ab"
+        for name, kind in self.columns.items():
+            base = os.path.join(self.path, name)
+            if kind == "text":
+                enc = [str(s).encode("utf-8") for s in cols[name]]
+                start = 0 if first else os.path.getsize(base + ".bin")
+                offsets = start + np.cumsum([len(b) for b in enc], dtype=np.int64)
+                if first:
+                    offsets = np.concatenate([[0], offsets]).astype(np.int64)
+                with open(base + ".bin", mode) as fh:
+                    fh.write(b"".join(enc))
+                with open(base + ".offsets.bin", mode) as fh:
+                    fh.write(offsets.astype("<i8").tobytes())
+            else:
+                with open(base + ".bin", mode) as fh:
+                    fh.write(np.ascontiguousarray(cols[name], dtype=_DTYPES[kind]).tobytes())
+
+    def _append_parquet(self, cols: Dict[str, np.ndarray]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        arrays = {}
+        for name, kind in self.columns.items():
+            v = cols[name]
+            arrays[name] = pa.array([str(s) for s in v], pa.string()) if kind == "text" else \
+                pa.array(np.ascontiguousarray(v, dtype=_DTYPES[kind]))
+        table = pa.table(arrays)
+        # Each part is written whole (footer included) and renamed into place before schema.json counts it
+        path = os.path.join(self.path, PARQUET_PART.format(self.n_parts))
+        pq.write_table(table, path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        pass        # every append is already complete on disk; kept for the context-manager protocol
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+# ---------------- reading ----------------
+
+def read_schema(path: str) -> Dict[str, Any]:
+    with open(os.path.join(path, SCHEMA_FILE), encoding="utf-8") as fh:
+        return json.load(fh)
+
+def store_files(path: str) -> List[str]:
+    """Files of the store at `path` (schema.json and the data files it lists)."""
+    schema = read_schema(path)
+    if schema["format"] == "parquet":
+        n = schema.get("n_parts", 0)
+        data = [PARQUET_PART.format(i) for i in range(n)] + [PARQUET_PART.format(n) + ".tmp"]
+    else:
+        data = [n for c, k in schema["columns"].items()
+                for n in ((c + ".bin", c + ".offsets.bin") if k == "text" else (c + ".bin",))]
+    return data + [SCHEMA_FILE, SCHEMA_FILE + ".tmp"]
+
+def open_results(path: str, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Column name -> data. Raw stores return read-only np.memmap views (TextColumn for text), so
+    nothing is loaded until it is touched; Parquet stores are read through a memory map.
+    """
+    schema = read_schema(path)
+    names = list(columns) if columns is not None else list(schema["columns"])
+    unknown = [c for c in names if c not in schema["columns"]]
+    if unknown:
+        raise KeyError(f"Columns not in store {path}: {', '.join(unknown)}")
+    n = schema["n_rows"]
+    if schema["format"] == "parquet":
+        import pyarrow.parquet as pq
+        if n == 0:
+            return {c: np.empty(0) for c in names}
+        import pyarrow as pa
+        # Only the parts schema.json counts: a part being written when a run died is ignored
+        parts = [pq.read_table(os.path.join(path, PARQUET_PART.format(i)), columns=names, memory_map=True)
+                 for i in range(schema["n_parts"])]
+        table = pa.concat_tables(parts)
+        return {c: table.column(c).to_numpy() for c in names}
+    out: Dict[str, Any] = {}
+    for c in names:
+        kind, base = schema["columns"][c], os.path.join(path, c)
+        if kind == "text":
+            off = np.memmap(base + ".offsets.bin", dtype="<i8", mode="r", shape=(n + 1,)) if n else np.zeros(1, np.int64)
+            nbytes = int(off[-1])
+            data = np.memmap(base + ".bin", dtype=np.uint8, mode="r", shape=(nbytes,)) if nbytes else np.empty(0, np.uint8)
+            out[c] = TextColumn(off, data)
+        else:
+            dt = np.dtype(_DTYPES[kind])
+            out[c] = np.memmap(base + ".bin", dtype=dt, mode="r", shape=(n,)) if n else np.empty(0, dt)
+    return out
+
+# ---------------- Excel summary ----------------
+
+def summary_grid(path: str) -> ResultsGrid:
+    """Pass rates for *_ok / *_pass columns and min / mean / max for numeric ones."""
+    schema = read_schema(path)
+    data = open_results(path, [c for c, k in schema["columns"].items() if k != "text"])
+    n = schema["n_rows"]
+    b = _GridBuilder(gap=2)
+    b.row(["RESULTS STORE SUMMARY"], bold=True)
+    b.blank()
+    b.row(["Rows", n])
+    b.row(["Format", schema["format"]])
+    b.end_section()
+
+    checks = [c for c, k in schema["columns"].items() if k == "bool" and c.endswith(("_ok", "_pass"))]
+    b.row(["Check", "Pass", "Fail", "Pass rate"], bold=True)
+    for c in checks:
+        ok = int(np.count_nonzero(data[c]))
+        b.row([c, ok, n - ok, ok / n if n else 0.0])
+    b.end_section()
+
+    b.row(["Quantity", "Min", "Mean", "Max"], bold=True)      # other flags: mean = fraction set
+    for c, k in schema["columns"].items():
+        if k != "text" and c not in checks:
+            v = np.asarray(data[c], dtype=float)
+            finite = v[np.isfinite(v)]
+            if len(finite):
+                b.row([c, float(finite.min()), float(finite.mean()), float(finite.max())])
+            else:
+                b.row([c, "", "", ""])
+    while b.rows and not b.rows[-1]:
+        b.rows.pop()
+    return ResultsGrid(rows=b.rows, bold=b.bold)
+
+def write_summary_xlsx(path: str, xlsx_path: str, sheet: str = "Summary") -> str:
+    """Write summary_grid to a standalone workbook (openpyxl) and return its path."""
+    import openpyxl
+    from openpyxl.styles import Font
+    grid = summary_grid(path)
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = sheet
+    for i, row in enumerate(grid.rows, start=1):
+        for j, v in enumerate(row, start=1):
+            ws.cell(row=i, column=j, value=v)
+    for r, c, nr, nc in grid.bold:
+        for rr in range(r, r + nr):
+            for cc in range(c, c + nc):
+                ws.cell(row=rr, column=cc).font = Font(bold=True)
+    ws.column_dimensions["A"].width = max((len(str(r[0])) for r in grid.rows if r), default=10) + 2
+    wb.save(xlsx_path)
+    return xlsx_path
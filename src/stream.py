@@ -0,0 +1,250 @@
+# src/stream.py
+# Streaming batch mode: line-delimited JSON or CSV jobs in, one result row per job out.
+#
+#   python -m src.stream sweep.jsonl --catalog Deck_Screening_Template.xlsm --out results.jsonl
+#   generate_jobs | python -m src.stream - --format csv --catalog book.xlsm > results.csv
+#   python -m src.stream sweep.csv --catalog book.xlsm --store out/sweep     # columnar store (src/store.py)
+#
+# Each input row holds Inputs fields under the Inputs sheet labels (io_common.LABELS); blanks
+# follow the sheet's rules and unknown keys are ignored, except "id", which is copied to the
+# output. Rows are parsed lazily, processed in fixed-size chunks (calc_batch → one connector
+# selection pass → vectorized footing check / sizing) and written before the next chunk is
+# read, so memory depends on the chunk size only. A row that fails to parse gives an ERROR row.
+import os
+import sys
+import csv
+import json
+import math
+import argparse
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .models import Inputs
+from .calc import pf
+from .batch import calc_inputs_batch
+from .io_common import LABELS, inputs_from_dict
+from .connectors import ConnectorCatalog, compute_connection_demands, select_connectors_batch
+from .footing import footing_demands, footing_params, footing_pass_batch, size_footings_batch
+from . import timing
+
+OUTPUT_COLUMNS = [
+    "row", "id", "status", "bending", "shear", "bearing", "deflection", "column",
+    "bending_stress_psi", "shear_stress_psi", "deflection_in", "reaction_per_post_lb",
+    "top_connector", "top_connector_check", "base_connector", "base_connector_check",
+    "footing_bearing", "footing_sliding", "footing_uplift",
+    "footing_length_in", "footing_width_in", "footing_thickness_in", "error",
+]
+_FOOTING_KEYS = ("Dcov_in", "gamma_soil", "gamma_conc", "include_overburden", "q_allow", "SF_bearing",
+                 "mu", "SF_sliding", "SF_uplift", "credit")
+
+# ---------------- input ----------------
+
+_UNPARSED = "__unparsed__"      # placeholder key for a line that is not a JSON object
+
+def read_jsonl(fh: TextIO) -> Iterator[Dict[str, Any]]:
+    # A malformed line still yields a row (which parse_row rejects) so it becomes an ERROR row in place
+    for n, line in enumerate(fh, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            d = json.loads(line)
+        except ValueError as e:
+            d = {_UNPARSED: f"line {n}: {e}"}
+        yield d if isinstance(d, dict) else {_UNPARSED: f"line {n}: not a JSON object"}
+
+def read_csv(fh: TextIO) -> Iterator[Dict[str, Any]]:
+    yield from csv.DictReader(fh)
+
+READERS = {"jsonl": read_jsonl, "csv": read_csv}
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+_LABELS = frozenset(LABELS)
+
+def parse_row(d: Dict[str, Any]) -> Inputs:
+    if _UNPARSED in d:
+        raise ValueError(d[_UNPARSED])
+    return inputs_from_dict({k: v for k, v in d.items() if k in _LABELS})
+
+# ---------------- processing ----------------
+
+def _flags(ok: np.ndarray) -> List[str]:
+    return [pf(o) for o in ok.tolist()]
+
+def process_chunk(inputs: List[Inputs], catalog: Optional[ConnectorCatalog] = None) -> List[Dict[str, Any]]:
+    """Beam, connector and footing results for one chunk (same rules as main.run, no calc logs)."""
+    n = len(inputs)
+    beam = calc_inputs_batch(inputs)
+    results = [beam.result(i) for i in range(n)]
+    selections = None
+    if catalog is not None:
+        demands = [compute_connection_demands(x, r) for x, r in zip(inputs, results)]
+        selections = select_connectors_batch(inputs, demands, catalog)
+
+    # Footing: Option 1 checks the given L×W×T, Option 2 (any of them blank) sizes one
+    V, H, U = np.array([footing_demands(x, r) for x, r in zip(inputs, results)], dtype=float).reshape(-1, 3).T
+    params = [footing_params(x) for x in inputs]
+    p = {k: np.array([q[k] for q in params]) for k in _FOOTING_KEYS}
+    given = np.array([bool(x.footing_length_in and x.footing_width_in and x.footing_thickness_in) for x in inputs])
+    L = np.array([x.footing_length_in or np.nan for x in inputs], dtype=float)
+    W = np.array([x.footing_width_in or np.nan for x in inputs], dtype=float)
+    T = np.array([x.footing_thickness_in or np.nan for x in inputs], dtype=float)
+    if not given.all():
+        idx = np.flatnonzero(~given)
+        side, thick = size_footings_batch(V[idx], H[idx], U[idx], **{k: v[idx] for k, v in p.items()})
+        L[idx], W[idx], T[idx] = side, side, thick
+    with np.errstate(invalid="ignore"):
+        f_bear, f_slide, f_upl = footing_pass_batch(V, H, U, L, W, T, **p)
+
+    cols = {
+        "bending": _flags(beam.bending_ok),
+        "shear": _flags(beam.shear_ok),
+        "bearing": _flags(beam.bearing_ok),
+        "deflection": _flags(beam.deflection_ok),
+        "footing_bearing": _flags(f_bear),
+        "footing_sliding": _flags(f_slide),
+        "footing_uplift": _flags(f_upl),
+    }
+    rows = []
+    for i in range(n):
+        row = {k: v[i] for k, v in cols.items()}
+        row["column"] = pf(bool(beam.column_axial_ok[i])) if beam.column_checked[i] else "SKIPPED"
+        for k in ("bending_stress_psi", "shear_stress_psi", "deflection_in", "reaction_per_post_lb"):
+            row[k] = float(getattr(beam, k)[i])
+        if selections is not None:
+            s = selections[i]
+            row["top_connector"], row["base_connector"] = s.top_model or "", s.base_model or ""
+            row["top_connector_check"] = pf(all(c["pass"] for c in s.top_checks.values())) if s.top_checks else ""
+            row["base_connector_check"] = pf(all(c["pass"] for c in s.base_checks.values())) if s.base_checks else ""
+        if not np.isnan(T[i]):
+            row["footing_length_in"], row["footing_width_in"], row["footing_thickness_in"] = float(L[i]), float(W[i]), float(T[i])
+        row["status"] = "CHECK" if "CHECK" in row.values() or np.isnan(T[i]) else "PASS"
+        rows.append(row)
+    return rows
+
+def stream_results(rows: Iterable[Dict[str, Any]], catalog: Optional[ConnectorCatalog] = None,
+                   chunk_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+    """Yield one output row per input row, in input order, chunk by chunk."""
+    start = 0
+    for chunk in chunked(rows, chunk_size):
+        parsed: List[Tuple[int, Inputs]] = []
+        out: List[Dict[str, Any]] = [{"row": start + i, "id": d.get("id", "")} for i, d in enumerate(chunk)]
+        for i, d in enumerate(chunk):
+            try:
+                parsed.append((i, parse_row(d)))
+            except (KeyError, ValueError, TypeError) as e:
+                out[i].update(status="ERROR", error=f"{type(e).__name__}: {e}")
+        if parsed:
+            for (i, _), res in zip(parsed, process_chunk([x for _, x in parsed], catalog)):
+                out[i].update(res)
+        timing.add("rows", len(chunk))
+        start += len(chunk)
+        yield from out
+
+# ---------------- output ----------------
+
+def _finite(v):
+    # NaN / ±inf (e.g. E = 0 gives an infinite deflection) have no JSON spelling: written as null
+    return None if isinstance(v, float) and not math.isfinite(v) else v
+
+class _JsonlWriter:
+    def __init__(self, fh: TextIO):
+        self.fh = fh
+    def write(self, row: Dict[str, Any]):
+        self.fh.write(json.dumps({k: _finite(v) for k, v in row.items()}, allow_nan=False) + "\n")
+    def close(self):
+        pass
+
+class _CsvWriter:
+    def __init__(self, fh: TextIO):
+        self.w = csv.DictWriter(fh, fieldnames=OUTPUT_COLUMNS, restval="")
+        self.w.writeheader()
+    def write(self, row: Dict[str, Any]):
+        self.w.writerow(row)
+    def close(self):
+        pass
+
+class _StoreWriter:
+    # Buffers one chunk of rows, then appends them to a ResultsStore as columns
+    def __init__(self, path: str, chunk_size: int):
+        from .store import ResultsStore
+        self.store, self.size, self.buf = ResultsStore(path, overwrite=True), chunk_size, []
+    def write(self, row: Dict[str, Any]):
+        self.buf.append(row)
+        if len(self.buf) >= self.size:
+            self._flush()
+    def _flush(self):
+        if self.buf:
+            num = {"row", "bending_stress_psi", "shear_stress_psi", "deflection_in", "reaction_per_post_lb",
+                   "footing_length_in", "footing_width_in", "footing_thickness_in"}
+            cols = {k: np.array([r.get(k, np.nan if k in num else "") for r in self.buf],
+                                dtype=float if k in num else str) for k in OUTPUT_COLUMNS}
+            cols["id"] = np.array([str(r.get("id", "")) for r in self.buf])
+            self.store.append(cols)
+            self.buf = []
+    def close(self):
+        self._flush()
+        self.store.close()
+
+def _format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    return "csv" if ext == "csv" else "jsonl"
+
+def run_stream(src: TextIO, out, in_format: str = "jsonl", catalog: Optional[ConnectorCatalog] = None,
+               chunk_size: int = 10_000) -> Dict[str, int]:
+    """Stream src through stream_results into a writer (write/close); returns status counts."""
+    counts = {"PASS": 0, "CHECK": 0, "ERROR": 0}
+    with timing.span("stream", chunk_size=chunk_size):
+        for row in stream_results(READERS[in_format](src), catalog, chunk_size):
+            out.write(row)
+            counts[row["status"]] += 1
+        out.close()
+    return counts
+
+def cli(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Screen a stream of designs (JSONL or CSV rows of Inputs fields).")
+    ap.add_argument("input", help="jobs file (.jsonl / .csv) or - for stdin")
+    ap.add_argument("--format", choices=sorted(READERS), default=None, help="input format (default: from extension)")
+    ap.add_argument("--catalog", default=None, help="workbook whose Connectors sheet is the connector catalog")
+    ap.add_argument("--out", default="-", help="output .jsonl / .csv file, or - for stdout (default)")
+    ap.add_argument("--out-format", choices=sorted(READERS), default=None)
+    ap.add_argument("--store", default=None, help="write a columnar results store to this directory instead")
+    ap.add_argument("--chunk", type=int, default=10_000, help="rows per processing chunk")
+    args = ap.parse_args(argv)
+
+    catalog = None
+    if args.catalog:
+        from .io_openpyxl import read_connectors
+        catalog = ConnectorCatalog(*read_connectors(args.catalog))
+    src = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    dst = None
+    try:
+        if args.store:
+            writer = _StoreWriter(args.store, args.chunk)
+        else:
+            dst = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+            fmt = args.out_format or (_format(args.out, None) if args.out != "-" else "jsonl")
+            writer = _CsvWriter(dst) if fmt == "csv" else _JsonlWriter(dst)
+        counts = run_stream(src, writer, _format(args.input, args.format), catalog, args.chunk)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not None and dst is not sys.stdout:
+            dst.close()
+    print(f"{sum(counts.values())} rows: {counts['PASS']} pass, {counts['CHECK']} check, {counts['ERROR']} error",
+          file=sys.stderr)
+    return 1 if counts["ERROR"] else 0
+
+if __name__ == "__main__":
+    sys.exit(cli())
@@ -0,0 +1,116 @@
+# src/timing.py
+# Lightweight span timing: where a run spends its time (Excel attach, reads, calc stages, writes).
+#
+#   with timing.span("calc"):            # or @timing.timed("io_xlwings.read_inputs")
+#       ...
+#       timing.add("rows", n)            # counters: rows, com_calls, ... (summed into parent spans)
+#
+# When the outermost span closes, every span of that run is appended to run_log.txt as one JSON
+# line each. Off with DECK_TIMING=0 (or main's --no-timing): span() then returns a shared no-op
+# object and timed() wrappers just call through.
+import os
+import json
+import time
+import uuid
+import threading
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOG_PATH = os.environ.get("DECK_RUN_LOG") or os.path.join(_ROOT, "run_log.txt")
+
+_enabled = os.environ.get("DECK_TIMING", "1").strip().lower() not in ("0", "off", "false", "no")
+_local = threading.local()      # per thread: open span stack + finished records of the current run
+
+def enabled() -> bool:
+    return _enabled
+
+def set_enabled(flag: bool):
+    global _enabled
+    _enabled = bool(flag)
+
+class _NullSpan:
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc): return False
+    def add(self, key: str, n: int = 1): pass
+    def set(self, key: str, value: Any): pass
+
+_NULL = _NullSpan()
+
+class _Span:
+    __slots__ = ("name", "fields", "counts", "t0", "parent", "run")
+
+    def __init__(self, name: str, fields: Dict[str, Any]):
+        self.name, self.fields, self.counts = name, fields, {}
+
+    def add(self, key: str, n: int = 1):
+        self.counts[key] = self.counts.get(key, 0) + n
+
+    def set(self, key: str, value: Any):
+        self.fields[key] = value
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        if not stack:
+            _local.records = []
+            _local.run = uuid.uuid4().hex[:8]
+        self.parent = stack[-1] if stack else None
+        self.run = _local.run
+        stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self.t0) * 1000.0
+        _local.stack.pop()
+        rec = {"ts": time.strftime("%Y-%m-%dT%H:%M:%S"), "run": self.run, "span": self.name,
+               "parent": self.parent.name if self.parent else None, "ms": round(ms, 3)}
+        rec.update(self.counts)
+        rec.update(self.fields)
+        if exc_type is not None:
+            rec["error"] = exc_type.__name__
+        _local.records.append(rec)
+        if self.parent is not None:
+            for k, v in self.counts.items():
+                self.parent.add(k, v)
+        else:
+            flush(_local.records)
+        return False
+
+def span(name: str, **fields):
+    """Context manager timing a block; extra keyword fields are copied into its record."""
+    return _Span(name, fields) if _enabled else _NULL
+
+def add(key: str, n: int = 1):
+    """Bump a counter on the innermost open span (no-op when timing is off or no span is open)."""
+    if _enabled:
+        stack = getattr(_local, "stack", None)
+        if stack:
+            stack[-1].add(key, n)
+
+def timed(name: Optional[str] = None):
+    """Decorator form of span()."""
+    def deco(fn):
+        label = name or f"{fn.__module__}.{fn.__qualname__}"
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def flush(records: List[Dict[str, Any]], path: Optional[str] = None):
+    # One write per run so concurrent runner processes do not interleave partial lines
+    if not records:
+        return
+    data = "".join(json.dumps(r, default=str) + "\n" for r in records)
+    try:
+        with open(path or LOG_PATH, "a", encoding="utf-8") as fh:
+            fh.write(data)
+    except OSError:
+        pass        # timing must never break a run (read-only install, locked file, ...)
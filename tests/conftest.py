@@ -0,0 +1,4 @@
+# Keep test runs out of the repo's run_log.txt
+import os
+
+os.environ.setdefault("DECK_TIMING", "0")
@@ -0,0 +1,49 @@
+# Vectorized calc (src/batch.py): every Results field equals the scalar calc exactly.
+from dataclasses import fields, replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Results
+from src.calc import calc
+from src.batch import calc_batch, calc_inputs_batch, inputs_to_columns
+from benchmarks.fixtures import synthetic_inputs
+
+FIELDS = [f.name for f in fields(Results) if f.name != "calc_log"]
+
+def _designs():
+    xs = synthetic_inputs(400, seed=31)
+    # Column inputs half given, blank, zero (= not given) or partly given; every lateral flag combination
+    extra = []
+    for i, x in enumerate(xs[:64]):
+        extra.append(replace(x, Fc_axis_prime=[None, 0.0, 950.0, 950.0][i % 4],
+                             post_section_b_in=[3.5, 3.5, None, 5.5][i % 4], post_section_d_in=5.5,
+                             has_knee_braces=bool(i & 1), has_moment_top_connector=bool(i & 2),
+                             has_hold_downs_or_shear_base=bool(i & 4)))
+    return xs + extra
+
+def _assert_same(got: Results, ref: Results):
+    for name in FIELDS:
+        assert getattr(got, name) == getattr(ref, name), name
+        assert type(getattr(got, name)) is type(getattr(ref, name)), name
+
+def test_batch_matches_scalar_calc_exactly():
+    xs = _designs()
+    batch = calc_inputs_batch(xs)
+    assert len(batch) == len(xs)
+    assert batch.column_checked.any() and not batch.column_checked.all()
+    flags = {(x.has_knee_braces, x.has_moment_top_connector, x.has_hold_downs_or_shear_base) for x in xs}
+    assert len(flags) == 8
+    for i, x in enumerate(xs):
+        _assert_same(batch.result(i), calc(x, log=False))
+        _assert_same(batch.result(i), calc(x))                  # logging does not change a number
+
+def test_scalars_broadcast_and_match():
+    xs = _designs()[:50]
+    cols = inputs_to_columns(xs)
+    cols["DL_psf"] = 12.5                                     # one value for every design
+    cols["has_knee_braces"] = True
+    batch = calc_batch(**cols)
+    for i, x in enumerate(xs):
+        _assert_same(batch.result(i), calc(replace(x, DL_psf=12.5, has_knee_braces=True), log=False))
@@ -0,0 +1,67 @@
+# Result cache (src/cache.py): what must miss (edited inputs, other code versions, damaged files).
+import os
+from dataclasses import replace
+
+import pytest
+
+from src import cache as cache_mod
+from src.cache import ResultCache, stable_hash
+from src.calc import calc
+from benchmarks.fixtures import synthetic_inputs
+
+X = synthetic_inputs(1, seed=11)[0]
+
+def _memo(c, x, calls):
+    def compute():
+        calls.append(x)
+        return calc(x, log=False)
+    return c.memo(stable_hash("beam", x), compute)
+
+def test_same_inputs_hit_across_processes_and_edits_miss(tmp_path):
+    calls = []
+    _memo(ResultCache(disk_dir=str(tmp_path)), X, calls)
+    assert _memo(ResultCache(disk_dir=str(tmp_path)), X, calls) == calc(X, log=False)    # fresh process: disk hit
+    assert len(calls) == 1
+    for edit in ({"span_ft": X.span_ft + 1e-9}, {"has_knee_braces": not X.has_knee_braces},
+                 {"top_connector_model": "T00001"}, {"lateral_line_load_plf": None}):
+        y = replace(X, **edit)
+        if y == X:
+            continue
+        assert _memo(ResultCache(disk_dir=str(tmp_path)), y, calls) == calc(y, log=False)
+        assert calls[-1] is y
+
+def test_code_version_change_misses_and_prunes_old_entries(tmp_path, monkeypatch):
+    old = ResultCache(disk_dir=str(tmp_path))
+    key = stable_hash("beam", X)
+    old.put(key, "old result")
+    old_dir = old.disk_dir
+    monkeypatch.setattr(cache_mod, "CODE_VERSION", "f" * len(cache_mod.CODE_VERSION))
+    assert stable_hash("beam", X) != key
+    new = ResultCache(disk_dir=str(tmp_path))
+    assert new.get(key) is None                     # even the old key is not found under the new version
+    assert not os.path.exists(old_dir)
+
+def test_prune_leaves_everything_it_did_not_create(tmp_path, monkeypatch):
+    # Siblings of the cache in a user-chosen --cache-dir, including CODE_VERSION-length names
+    keep = [tmp_path / "my_thesis_drafts", tmp_path / ("a" * 16), tmp_path / "deck_cache" / ("b" * 16),
+            tmp_path / "deck_cache" / "not_a_version_16"]
+    for d in keep:
+        d.mkdir(parents=True)
+        (d / "notes.txt").write_text("keep me")
+    ResultCache(disk_dir=str(tmp_path)).put(stable_hash("beam", X), "old result")
+    monkeypatch.setattr(cache_mod, "CODE_VERSION", "f" * len(cache_mod.CODE_VERSION))
+    ResultCache(disk_dir=str(tmp_path))
+    assert all((d / "notes.txt").read_text() == "keep me" for d in keep)
+    assert sorted(os.listdir(tmp_path / "deck_cache")) == sorted(["b" * 16, "f" * 16, "not_a_version_16"])
+
+@pytest.mark.parametrize("damage", [b"", b"not a pickle", b"\x80\x05\x95" + bytes(range(40))])
+def test_corrupt_entry_is_a_miss_and_is_rewritten(tmp_path, damage):
+    key = stable_hash("beam", X)
+    c = ResultCache(disk_dir=str(tmp_path))
+    c.put(key, calc(X, log=False))
+    with open(c._path(key), "wb") as fh:
+        fh.write(damage)
+    calls = []
+    assert _memo(ResultCache(disk_dir=str(tmp_path)), X, calls) == calc(X, log=False)
+    assert len(calls) == 1
+    assert ResultCache(disk_dir=str(tmp_path)).get(key) == calc(X, log=False)
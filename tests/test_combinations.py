@@ -0,0 +1,52 @@
+# Load-combination envelope (src/combinations.py) against a design worked by hand.
+#
+# 10 ft span, 5 ft tributary, 3x6 beam (S = 18 in³, I = 54 in⁴): per case the beam line load is
+# D 50, S 100, W -100 plf (roof uplift 20 psf), so D gives M = 7500 lb·in and R = 250 lb.
+# Post wind uplift 20 psf × 50 ft² = 1000 lb, lateral 40 plf × 10 / 2 = 200 lb.
+# Footing 36 × 36 × 12 in at 150 pcf = 1350 lb, no overburden, μ = 0.5.
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Inputs
+from src.calc import calc
+from src.combinations import combination_envelope
+
+DESIGN = Inputs(
+    span_ft=10.0, tributary_width_ft=5.0, beam_b_in=3.0, beam_d_in=6.0, post_unsupported_height_in=96.0,
+    post_base_bearing_area_in2=10.0, Fb_prime=1000.0, Fv_prime=100.0, Fc_perp_prime=500.0, E=1.6e6,
+    DL_psf=10.0, SL_psf=20.0, LL_psf=0.0, deflection_limit_ratio=240.0,
+    roof_uplift_psf=20.0, uplift_area_per_post_ft2=50.0, lateral_line_load_plf=40.0,
+    concrete_unit_weight_pcf=150.0, base_friction_coeff_mu=0.5, SF_sliding=1.5, SF_uplift=1.5,
+    footing_length_in=36.0, footing_width_in=36.0, footing_thickness_in=12.0, post_self_weight_lb=0.0,
+)
+
+# check -> (governing ASD combination, utilization or demand)
+ASD_EXPECTED = {
+    "bending": ("D+S", 22500.0 / 18.0 / 1000.0),                 # (7500 + 15000) / S / Fb'
+    "shear": ("D+S", 1.5 * 750.0 / 18.0 / 100.0),
+    "bearing": ("D+S", 750.0 / 10.0 / 500.0),
+    "deflection": ("D+S", 0.390625 / 0.5),                       # 5 (150/12) 120⁴ / (384 E I) vs L/240
+    "connector_download": ("D+S", 750.0),
+    "connector_uplift": ("0.6D+0.6W", 600.0 - 150.0),
+    "connector_lateral": ("D+0.6W", 120.0),                      # first of the two 0.6W combinations
+    "footing_uplift": ("0.6D+0.6W", 450.0 / (0.6 * 1350.0)),     # footing weight takes the 0.6 D factor
+    "footing_sliding": ("0.6D+0.6W", 120.0 / (0.5 * (0.6 * 1350.0 - 450.0))),
+}
+
+@pytest.mark.parametrize("check", sorted(ASD_EXPECTED))
+def test_asd_governing_combination_and_value(check):
+    env = combination_envelope([DESIGN], "ASD")
+    name, value = ASD_EXPECTED[check]
+    assert env.governing_names(check)[0] == name
+    got = env.utilization[check][0] if check in env.utilization else env.demand[check][0, env.governing[check][0]]
+    assert got == pytest.approx(value)
+
+def test_lrfd_footing_uplift_uses_factored_dead_load():
+    env = combination_envelope([DESIGN], "LRFD")
+    assert env.governing_names("footing_uplift")[0] == "0.9D+W"
+    assert env.utilization["footing_uplift"][0] == pytest.approx((1000.0 - 0.9 * 250.0) / (0.9 * 1350.0))
+
+def test_d_plus_l_plus_s_reproduces_calc_reaction():
+    env = combination_envelope([DESIGN], combinations={"D+L+S": {"D": 1.0, "L": 1.0, "S": 1.0}})
+    assert env.effect("shear_lb")[0] == pytest.approx(calc(DESIGN, log=False).max_shear_lb)
@@ -0,0 +1,77 @@
+# Connector auto-selection (src/connectors.py): the Pareto-pruned batch selector against an
+# exhaustive scan of the whole catalog with the scalar check functions.
+import random
+from dataclasses import replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Inputs
+from src.connectors import (ConnectionDemands, ConnectorCatalog, ConnectorSpecTop, ConnectorSpecBase,
+                            _top_checks, _base_checks, select_connectors_batch)
+from benchmarks.fixtures import synthetic_catalog
+
+BLANK = Inputs(span_ft=10.0, tributary_width_ft=5.0, beam_b_in=3.5, beam_d_in=9.25, post_unsupported_height_in=96.0,
+               post_base_bearing_area_in2=12.0, Fb_prime=1000.0, Fv_prime=150.0, Fc_perp_prime=500.0, E=1.6e6,
+               DL_psf=10.0, SL_psf=40.0)
+
+def _worst(checks):
+    # Worst utilization as the selector defines it: unrated (zero) capacities count 0 when they pass
+    return max(c["demand"] / c["cap"] if c["cap"] > 0 else (0.0 if c["pass"] else float("inf"))
+               for c in checks.values())
+
+def _exhaustive(dem, specs, checks_fn):
+    scored = [(all(c["pass"] for c in ch.values()), _worst(ch)) for ch in (checks_fn(dem, s) for s in specs)]
+    passing = [u for ok, u in scored if ok]
+    return (True, min(passing)) if passing else (False, min(u for _, u in scored))
+
+def _demands(rnd, n):
+    return [ConnectionDemands(rnd.uniform(0, 6000), rnd.uniform(0, 3000), rnd.uniform(0, 2000),
+                              rnd.choice([0.0, rnd.uniform(0, 15000)]), rnd.uniform(0, 3000), rnd.uniform(0, 4000))
+            for _ in range(n)]
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_selection_matches_exhaustive_search(seed):
+    rnd = random.Random(seed)
+    tops, bases = synthetic_catalog(rnd.choice([3, 40, 400]), seed=seed)
+    tops += [ConnectorSpecTop(t.model + "-dup", t.allowable_download_lb, t.allowable_uplift_lb,
+                              t.allowable_lateral_lb, t.allowable_moment_lb_in) for t in tops[:5]]
+    bases += [ConnectorSpecBase(b.model + "-dup", b.allowable_shear_lb, b.allowable_uplift_lb) for b in bases[:5]]
+    demands = _demands(rnd, 200)
+    picks = select_connectors_batch([BLANK] * len(demands), demands, ConnectorCatalog(tops, bases))
+    for dem, sel in zip(demands, picks):
+        for checks, specs, fn in ((sel.top_checks, tops, _top_checks), (sel.base_checks, bases, _base_checks)):
+            ok, best = _exhaustive(dem, specs, fn)
+            assert all(c["pass"] for c in checks.values()) == ok
+            assert _worst(checks) == pytest.approx(best)
+
+def test_named_model_is_verified_not_replaced():
+    tops, bases = synthetic_catalog(20, seed=9)
+    x = replace(BLANK, top_connector_model=tops[3].model)
+    sel = select_connectors_batch([x], _demands(random.Random(1), 1), ConnectorCatalog(tops, bases))[0]
+    assert sel.top_model == tops[3].model
+
+def test_catalog_is_memoized_on_the_spec_lists(monkeypatch):
+    from src import connectors
+    monkeypatch.setattr(connectors, "_CATALOGS", [])
+    tops, bases = synthetic_catalog(200, seed=9)
+    cat = connectors.catalog_for(tops, bases)
+    assert connectors.catalog_for(list(tops), list(bases)) is cat           # same specs, new list objects
+    assert connectors.catalog_for(tops[:-1], bases) is not cat              # a spec removed
+    swapped = tops[:5] + [replace(tops[5], allowable_uplift_lb=1.0)] + tops[6:]
+    assert connectors.catalog_for(swapped, bases) is not cat                # a spec replaced by a new object
+    for seed in range(connectors._MAX_CATALOGS):
+        connectors.catalog_for(*synthetic_catalog(20, seed=100 + seed))
+    assert len(connectors._CATALOGS) == connectors._MAX_CATALOGS
+    assert connectors.catalog_for(tops, bases) is not cat                   # evicted, rebuilt
+
+    # The memoized path selects exactly what a freshly indexed catalog does
+    from src.connectors import compute_connection_demands, select_or_verify_connectors
+    from src.calc import calc
+    from benchmarks.fixtures import synthetic_inputs
+    for x in synthetic_inputs(30, seed=9):
+        x = replace(x, top_connector_model=None, base_connector_model=None)
+        dem = compute_connection_demands(x, calc(x, log=False))
+        assert (select_or_verify_connectors(x, dem, tops, bases)
+                == select_or_verify_connectors(x, dem, tops, bases, catalog=ConnectorCatalog(tops, bases)))
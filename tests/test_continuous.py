@@ -0,0 +1,76 @@
+# Continuous beam analysis (src/continuous.py): textbook coefficients, parity with calc, and the
+# O(N) pattern-load envelope against brute force over every on/off live-load pattern.
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Inputs
+from src.calc import calc
+from src.continuous import analyze_continuous, solve_tridiagonal, support_moments
+
+BEAM = Inputs(span_ft=10.0, tributary_width_ft=5.0, beam_b_in=3.5, beam_d_in=9.25, post_unsupported_height_in=96.0,
+              post_base_bearing_area_in2=12.0, Fb_prime=1000.0, Fv_prime=150.0, Fc_perp_prime=500.0, E=1.6e6,
+              DL_psf=10.0, SL_psf=40.0, LL_psf=5.0)
+W_PLF = (BEAM.DL_psf + BEAM.SL_psf + BEAM.LL_psf) * BEAM.tributary_width_ft
+
+def test_single_span_matches_calc():
+    r = calc(BEAM, log=False)
+    cont = analyze_continuous(BEAM, [BEAM.span_ft])
+    assert cont.moment_max_lb_in.max() == pytest.approx(r.max_moment_lb_in)
+    assert cont.shear_max_lb.max() == pytest.approx(r.max_shear_lb)
+    assert cont.deflection_max_in.max() == pytest.approx(r.deflection_in)
+    np.testing.assert_allclose(cont.reaction_max_lb, [r.reaction_per_post_lb] * 2)
+    assert cont.bending_stress_psi[0] == pytest.approx(r.bending_stress_psi)
+
+@pytest.mark.parametrize("n, reactions, support_moment", [
+    (2, [0.375, 1.25, 0.375], -1 / 8),
+    (3, [0.4, 1.1, 1.1, 0.4], -1 / 10),
+])
+def test_equal_spans_textbook_coefficients(n, reactions, support_moment):
+    L = 10.0
+    cont = analyze_continuous(BEAM, [L] * n, pattern_live=False)
+    np.testing.assert_allclose(cont.reaction_max_lb, np.array(reactions) * W_PLF * L, rtol=1e-12)
+    assert cont.moment_min_lb_in[0, -1] == pytest.approx(support_moment * (W_PLF / 12.0) * (L * 12.0) ** 2)
+
+def _brute_force(x, spans_ft, n_points=65):
+    # Every on/off live pattern solved directly
+    L = np.asarray(spans_ft) * 12.0
+    wD = x.DL_psf * x.tributary_width_ft / 12.0
+    wL = (x.SL_psf + x.LL_psf) * x.tributary_width_ft / 12.0
+    t = np.linspace(0.0, 1.0, n_points)
+    xs = t[None, :] * L[:, None]
+    out = {k: [] for k in ("m", "v", "r")}
+    for pattern in itertools.product((0.0, 1.0), repeat=len(L)):
+        w = wD + wL * np.array(pattern)
+        M = support_moments(L, w)
+        Va = w * L / 2.0 + (M[1:] - M[:-1]) / L
+        out["m"].append(M[:-1, None] + Va[:, None] * xs - w[:, None] * xs * xs / 2.0)
+        out["v"].append(Va[:, None] - w[:, None] * xs)
+        R = np.zeros(len(L) + 1)
+        R[:-1] += Va
+        R[1:] += w * L - Va
+        out["r"].append(R)
+    return {k: np.array(v) for k, v in out.items()}
+
+@pytest.mark.parametrize("seed", range(4))
+def test_pattern_envelope_matches_brute_force(seed):
+    spans = np.random.default_rng(seed).uniform(4.0, 14.0, 6)
+    cont = analyze_continuous(BEAM, spans)
+    bf = _brute_force(BEAM, spans)
+    np.testing.assert_allclose(cont.moment_max_lb_in, bf["m"].max(0), rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(cont.moment_min_lb_in, bf["m"].min(0), rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(cont.shear_max_lb, bf["v"].max(0), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(cont.shear_min_lb, bf["v"].min(0), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(cont.reaction_max_lb, bf["r"].max(0), rtol=1e-9)
+    np.testing.assert_allclose(cont.reaction_min_lb, bf["r"].min(0), rtol=1e-9)
+
+def test_tridiagonal_solve_matches_dense():
+    rng = np.random.default_rng(1)
+    n = 9
+    sub, sup = rng.uniform(1, 2, n - 1), rng.uniform(1, 2, n - 1)
+    diag = 2.0 * (np.append(sub, 0) + np.append(0, sup)) + 1.0
+    rhs = rng.normal(size=(n, 3))
+    A = np.diag(diag) + np.diag(sub, -1) + np.diag(sup, 1)
+    np.testing.assert_allclose(solve_tridiagonal(sub, diag, sup, rhs), np.linalg.solve(A, rhs))
@@ -0,0 +1,55 @@
+# Footing sizing (src/footing.py size_footings_batch): the closed-form sizes pass the exact checks,
+# the next smaller plan size fails, and nothing in the allowed grid uses less concrete.
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.footing import DEFAULT_PLAN_SIZES_IN, DEFAULT_THICKNESSES_IN, footing_pass_batch, size_footings_batch
+
+SITE = dict(Dcov_in=18.0, gamma_soil=120.0, gamma_conc=150.0, include_overburden=True, q_allow=2000.0,
+            SF_bearing=1.0, mu=0.45, SF_sliding=1.5, SF_uplift=1.5, credit=0.0)
+CHECKS = ("bearing", "sliding", "uplift")
+
+# (V, H, U) per post and the check that should govern its plan size
+CASES = {
+    "bearing": (9000.0, 50.0, 0.0),
+    "uplift": (300.0, 0.0, 4000.0),
+    "sliding": (300.0, 1500.0, 0.0),
+}
+
+def _size(V, H, U, site=SITE):
+    side, thick = size_footings_batch(np.atleast_1d(V), np.atleast_1d(H), np.atleast_1d(U), **site)
+    return side, thick
+
+def _flags(V, H, U, side, thick, site=SITE):
+    return dict(zip(CHECKS, (bool(f) for f in footing_pass_batch(V, H, U, side, side, thick, **site))))
+
+@pytest.mark.parametrize("governing", sorted(CASES))
+def test_size_passes_and_next_smaller_fails_the_governing_check(governing):
+    V, H, U = CASES[governing]
+    side, thick = _size(V, H, U)
+    s, t = float(side[0]), float(thick[0])
+    assert all(_flags(V, H, U, s, t).values())
+    smaller = max(p for p in DEFAULT_PLAN_SIZES_IN if p < s)
+    failed = [c for c, ok in _flags(V, H, U, smaller, t).items() if not ok]
+    assert failed == [governing]
+
+@pytest.mark.parametrize("site", [SITE, {**SITE, "include_overburden": False, "Dcov_in": 0.0}])
+def test_least_concrete_over_random_posts(site):
+    rng = np.random.default_rng(0)
+    n = 300
+    V, H, U = rng.uniform(0, 12000, n), rng.uniform(0, 4000, n), rng.uniform(0, 20000, n)
+    side, thick = _size(V, H, U, site)
+    plan = np.array(DEFAULT_PLAN_SIZES_IN, dtype=float)[:, None]
+    T = np.array(DEFAULT_THICKNESSES_IN, dtype=float)[None, :]
+    for i in range(n):
+        ok = np.all(np.broadcast_arrays(*footing_pass_batch(V[i], H[i], U[i], plan, plan, T, **site)), axis=0)
+        if not ok.any():
+            assert np.isnan(side[i]) and np.isnan(thick[i])
+            continue
+        assert all(_flags(V[i], H[i], U[i], side[i], thick[i], site).values())
+        assert side[i] ** 2 * thick[i] == pytest.approx((plan * plan * T)[ok].min())
+        # for the chosen thickness, one plan size down no longer passes
+        below = plan[plan[:, 0] < side[i], 0]
+        if len(below):
+            assert not all(_flags(V[i], H[i], U[i], below.max(), thick[i], site).values())
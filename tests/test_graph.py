@@ -0,0 +1,74 @@
+# Incremental recalculation (src/graph.py) and the Results write it drives in main.run.
+import os
+from dataclasses import replace
+
+import pytest
+
+from src.main import run
+from src.cache import ResultCache
+from src.graph import RecalcGraph, stages
+from benchmarks.fixtures import build_workbook, synthetic_catalog, synthetic_inputs
+
+def _results_path(wb_path):
+    from src.io_openpyxl import results_path
+    return results_path(wb_path)   # needs openpyxl; only the workbook tests call it
+
+@pytest.fixture
+def workbook(tmp_path):
+    pytest.importorskip("openpyxl")
+    tops, bases = synthetic_catalog(20, seed=3)
+    return build_workbook(str(tmp_path / "deck.xlsx"), synthetic_inputs(1, seed=4)[0], tops, bases)
+
+def test_deleted_sidecar_is_rewritten_from_disk_cache(workbook, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    run(workbook, "openpyxl", cache=ResultCache(disk_dir=cache_dir))
+    os.remove(_results_path(workbook))
+    # a fresh ResultCache is the next shell click: the grid comes back from disk, the file does not exist
+    out = run(workbook, "openpyxl", cache=ResultCache(disk_dir=cache_dir))
+    assert out.recomputed == ()
+    assert os.path.exists(_results_path(workbook))
+
+def test_deleted_sidecar_is_rewritten_by_warm_graph(workbook):
+    graph = RecalcGraph(ResultCache())
+    run(workbook, "openpyxl", graph=graph)
+    stamp = os.stat(_results_path(workbook)).st_mtime_ns
+    run(workbook, "openpyxl", graph=graph)
+    assert os.stat(_results_path(workbook)).st_mtime_ns == stamp     # unchanged sheet: no write
+    os.remove(_results_path(workbook))
+    run(workbook, "openpyxl", graph=graph)
+    assert os.path.exists(_results_path(workbook))
+
+def _rerun(graph, x, tops, bases):
+    state, dirty = graph.evaluate("deck.xlsm", x, tops, bases)
+    graph.save("deck.xlsm", state)
+    return state, dirty
+
+def test_stage_fields_come_from_the_stage_functions():
+    by_name = {s.name: s.fields for s in stages()}
+    assert "Fb_prime" in by_name["beam"] and "Fb_prime" not in by_name["footing"]
+    assert "soil_bearing_capacity_psf" in by_name["footing"] and "soil_bearing_capacity_psf" not in by_name["beam"]
+    assert "post_to_beam_arm_in" in by_name["connectors"] and "post_to_beam_arm_in" not in by_name["footing"]
+
+@pytest.mark.parametrize("change, expected", [
+    ({}, []),
+    ({"soil_bearing_capacity_psf": 4000.0}, ["footing"]),
+    ({"post_to_beam_arm_in": 9.0}, ["connectors"]),
+    ({"DL_psf": 25.0}, ["beam", "connectors", "footing"]),
+])
+def test_changed_field_reruns_only_dependent_stages(change, expected):
+    x = synthetic_inputs(1, seed=5)[0]
+    tops, bases = synthetic_catalog(20, seed=5)
+    graph = RecalcGraph()
+    assert _rerun(graph, x, tops, bases)[1] == ["beam", "connectors", "footing"]
+    y = replace(x, **change)
+    state, dirty = _rerun(graph, y, tops, bases)
+    assert dirty == expected
+    # reused stages are exactly what a cold evaluation of the edited inputs gives
+    assert state.digests == RecalcGraph().evaluate("other.xlsm", y, tops, bases)[0].digests
+
+def test_catalog_change_reruns_connectors_only():
+    x = synthetic_inputs(1, seed=6)[0]
+    tops, bases = synthetic_catalog(20, seed=6)
+    graph = RecalcGraph()
+    _rerun(graph, x, tops, bases)
+    assert _rerun(graph, x, tops[:-1], bases)[1] == ["connectors"]
@@ -0,0 +1,35 @@
+# Import-time budget for the calc core: a cold `import src.calc` must stay fast and must not
+# drag in the I/O backends or NumPy. Override the budget with DECK_IMPORT_BUDGET_MS on slow machines.
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_MS = float(os.environ.get("DECK_IMPORT_BUDGET_MS", "150"))
+HEAVY = ("numpy", "xlwings", "openpyxl", "pandas", "matplotlib")
+
+_PROBE = """
+import sys, time, json
+t0 = time.perf_counter()
+import {module}
+ms = (time.perf_counter() - t0) * 1000.0
+print(json.dumps({{"ms": ms, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+def _cold_import(module: str) -> dict:
+    # -B: no .pyc writes; each probe is a fresh interpreter so nothing is already imported
+    out = subprocess.run([sys.executable, "-B", "-c", _PROBE.format(module=module, heavy=HEAVY)],
+                         cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def test_calc_import_within_budget():
+    # best of 3 so one scheduler hiccup does not fail the build
+    best = min(_cold_import("src.calc")["ms"] for _ in range(3))
+    assert best <= BUDGET_MS, f"cold `import src.calc` took {best:.1f} ms (budget {BUDGET_MS:.0f} ms)"
+
+@pytest.mark.parametrize("module", ["src.calc", "src.connectors", "src.footing", "src.report", "src.main"])
+def test_core_does_not_import_heavy_dependencies(module):
+    assert _cold_import(module)["heavy"] == []
@@ -0,0 +1,108 @@
+# Inverse capacity (src/inverse.py): each reported limit is where that check's utilization is 1,
+# the scalar calc / footing_checks agree on either side of it, and the inf / NaN / sign conventions.
+import math
+from dataclasses import replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.calc import calc
+from src.footing import footing_checks
+from src.inverse import CHECKS, TARGETS, limit_table, solve_all, solve_limits
+from benchmarks.fixtures import synthetic_inputs
+
+DESIGNS = synthetic_inputs(150, seed=22)
+
+def _scalar_ok(x, check):
+    r = calc(x, log=False)
+    if check == "column":
+        return None if r.column_axial_ok is None else bool(r.column_axial_ok)
+    if check.startswith("footing_"):
+        f = footing_checks(x, r, log=False)
+        return bool(f.bearing_ok if check == "footing_bearing" else f.uplift_ok)
+    return bool(getattr(r, f"{check}_ok"))
+
+def _passes_all(x):
+    # Every check that is evaluated: the column only with its inputs, the footing only at a given size
+    sized = bool(x.footing_length_in and x.footing_width_in and x.footing_thickness_in)
+    return all(_scalar_ok(x, k) is not False for k in CHECKS if sized or not k.startswith("footing_"))
+
+def test_each_limit_is_where_its_check_reaches_one():
+    results = solve_all(DESIGNS)
+    cases = 0
+    for target, res in results.items():
+        for check in CHECKS:
+            for i, x in enumerate(DESIGNS):
+                v = res.limits[check][i]
+                if not np.isfinite(v) or (target != "SL_psf" and v <= 0):
+                    continue
+                at = replace(x, **{target: float(v)})
+                assert solve_limits([at], target).utilization[check][0] == pytest.approx(1.0, abs=1e-9)
+                # Scalar checks: pass just inside the limit, fail just outside it
+                step = 1e-9 * max(1.0, abs(v))
+                inside, outside = (v + step, v - 1e3 * step) if target == "beam_d_in" else (v - step, v + 1e3 * step)
+                assert _scalar_ok(replace(x, **{target: inside}), check) is True, (target, check, i)
+                assert _scalar_ok(replace(x, **{target: outside}), check) is False, (target, check, i)
+                cases += 1
+    assert cases > 2000
+
+def test_governing_limit_is_the_tightest_check():
+    for target, res in solve_all(DESIGNS).items():
+        stack = np.stack([res.limits[k] for k in CHECKS])
+        with np.errstate(invalid="ignore"):
+            expect = np.nanmax(stack, 0) if target == "beam_d_in" else np.nanmin(stack, 0)
+        ok = ~np.isnan(stack).any(0)
+        assert np.array_equal(res.limit[ok], expect[ok])
+        # A design passes every check exactly when its current value is inside the governing limit
+        passing = np.array([_passes_all(x) for x in DESIGNS])
+        inside = res.current >= res.limit if target == "beam_d_in" else res.current <= res.limit
+        assert np.array_equal(inside[ok], passing[ok])
+        assert not passing[~ok].any()                       # NaN: fails whatever the target
+
+def _no_column_no_footing():
+    return replace(DESIGNS[0], Fc_axis_prime=None, post_section_b_in=None, post_section_d_in=None,
+                   footing_length_in=None, footing_width_in=None, footing_thickness_in=None)
+
+def test_unchecked_checks_do_not_constrain():
+    res = solve_all([_no_column_no_footing()])
+    for target in ("SL_psf", "span_ft", "tributary_width_ft"):
+        for check in ("column", "footing_bearing", "footing_uplift"):
+            assert res[target].limits[check][0] == math.inf
+    for check in ("column", "footing_bearing", "footing_uplift"):
+        assert res["beam_d_in"].limits[check][0] == 0.0           # a minimum depth of 0: no requirement
+    assert res["beam_d_in"].limits["bearing"][0] == 0.0           # bearing does not depend on the depth
+
+def test_failing_whatever_the_target_is_nan():
+    # Uplift far beyond what the footing weight resists: no target value fixes it
+    x = replace(DESIGNS[0], footing_length_in=12.0, footing_width_in=12.0, footing_thickness_in=6.0,
+                roof_uplift_psf=60.0, uplift_area_per_post_ft2=200.0, include_soil_overburden=False,
+                credit_connector_uplift_lb=0.0)
+    assert _scalar_ok(x, "footing_uplift") is False
+    res = solve_all([x])
+    for target in TARGETS:
+        assert math.isnan(res[target].limits["footing_uplift"][0])
+    # Post self weight alone over the footing's allowable bearing: no span or tributary width passes
+    y = replace(x, roof_uplift_psf=0.0, post_self_weight_lb=5000.0, soil_bearing_capacity_psf=1500.0)
+    assert math.isnan(solve_limits([y], "span_ft").limits["footing_bearing"][0])
+    assert _scalar_ok(replace(y, span_ft=1e-6), "footing_bearing") is False
+
+def test_negative_snow_limit_when_dead_and_live_already_fail():
+    x = replace(_no_column_no_footing(), span_ft=16.0, tributary_width_ft=10.0, beam_b_in=1.5, beam_d_in=5.5,
+                DL_psf=40.0, LL_psf=40.0, SL_psf=30.0)
+    res = solve_limits([x], "SL_psf")
+    assert res.limit[0] < 0
+    assert _scalar_ok(replace(x, SL_psf=0.0), CHECKS[res.governing[0]]) is False
+    at = replace(x, SL_psf=float(res.limit[0]) * (1 + 1e-9))
+    assert all(_scalar_ok(at, k) for k in ("bending", "shear", "bearing", "deflection"))
+
+def test_beam_depth_is_a_minimum():
+    x = _no_column_no_footing()
+    res = solve_limits([x], "beam_d_in")
+    d = float(res.limit[0])
+    assert CHECKS[res.governing[0]] in ("bending", "shear", "deflection")
+    r_deeper, r_shallower = calc(replace(x, beam_d_in=d * 1.001), log=False), calc(replace(x, beam_d_in=d * 0.999), log=False)
+    assert r_deeper.bending_ok and r_deeper.shear_ok and r_deeper.deflection_ok
+    assert not (r_shallower.bending_ok and r_shallower.shear_ok and r_shallower.deflection_ok)
+    rows = {t: (cur, lim, gov) for t, cur, lim, gov in limit_table(x)}
+    assert rows["beam_d_in"][1] == d and rows["span_ft"][0] == x.span_ft
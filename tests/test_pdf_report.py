@@ -0,0 +1,25 @@
+# PDF calc packages (src/pdf_report.py): a small render through the reused page.
+import re
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+
+from src.pdf_report import render_pdf
+from benchmarks.fixtures import synthetic_inputs
+
+def _page_count(path):
+    with open(path, "rb") as fh:
+        return len(re.findall(rb"/Type\s*/Page\b", fh.read()))
+
+def test_render_two_pages(tmp_path):
+    path = tmp_path / "calc_package.pdf"
+    assert render_pdf(synthetic_inputs(2, seed=3), str(path), labels=["D1", "D2"]) == 2
+    assert path.read_bytes().startswith(b"%PDF")
+    assert _page_count(path) == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["calc_package.pdf"]
+
+def test_label_count_mismatch(tmp_path):
+    with pytest.raises(ValueError):
+        render_pdf(synthetic_inputs(2), str(tmp_path / "x.pdf"), labels=["only one"])
@@ -0,0 +1,84 @@
+# Monte Carlo reliability (src/reliability.py): failure counts equal a per-sample replay through
+# the scalar calc / footing_checks, runs are reproducible, and the Wilson interval's edges.
+from dataclasses import replace
+from statistics import NormalDist
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.calc import calc
+from src.footing import footing_checks, size_footing
+from src.reliability import CHECKS, Gumbel, LogNormal, Normal, Uniform, simulate, wilson_interval
+from benchmarks.fixtures import synthetic_inputs
+
+NOMINAL = replace(synthetic_inputs(1, seed=2)[0], span_ft=12.0, Fc_axis_prime=900.0, post_section_b_in=3.5,
+                  post_section_d_in=3.5, post_unsupported_height_in=120.0, footing_length_in=18.0,
+                  footing_width_in=18.0, footing_thickness_in=10.0, roof_uplift_psf=10.0,
+                  uplift_area_per_post_ft2=40.0, lateral_line_load_plf=60.0)
+DISTS = {"SL_psf": Gumbel(40, 0.4), "Fb_prime": LogNormal(900, 0.25), "E": LogNormal(1.2e6, 0.2),
+         "soil_bearing_capacity_psf": Normal(1500, 400), "roof_uplift_psf": Uniform(0, 40),
+         "base_friction_coeff_mu": Uniform(0.2, 0.6), "post_self_weight_lb": Uniform(20, 80),
+         "Fv_prime": LogNormal(60, 0.5), "Fc_perp_prime": LogNormal(150, 0.5), "Fc_axis_prime": LogNormal(300, 0.5)}
+
+def _replay(inputs, dists, n, chunk, seed, size):
+    # Draw the same samples as simulate and check each one with the scalar functions
+    fails = dict.fromkeys(CHECKS, 0)
+    names = sorted(dists)
+    n_chunks = -(-n // chunk)
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(n_chunks)):
+        rng = np.random.default_rng(child)
+        m = min(chunk, n - i * chunk)
+        cols = {k: dists[k].sample(rng, m) for k in names}
+        for j in range(m):
+            x = replace(inputs, footing_length_in=size[0], footing_width_in=size[1], footing_thickness_in=size[2],
+                        **{k: float(v[j]) for k, v in cols.items()})
+            r = calc(x, log=False)
+            f = footing_checks(x, r, log=False)
+            ok = {"bending": r.bending_ok, "shear": r.shear_ok, "bearing": r.bearing_ok,
+                  "deflection": r.deflection_ok, "column": r.column_axial_ok is not False,
+                  "footing_bearing": f.bearing_ok, "footing_sliding": f.sliding_ok, "footing_uplift": f.uplift_ok}
+            for k, v in ok.items():
+                fails[k] += not v
+            fails["any"] += not all(ok.values())
+    return fails
+
+@pytest.mark.parametrize("sized", [False, True])
+def test_failure_counts_match_a_scalar_replay(sized):
+    inputs = NOMINAL
+    if sized:
+        inputs = replace(NOMINAL, footing_length_in=None, footing_width_in=None, footing_thickness_in=None)
+    rel = simulate(inputs, DISTS, n_samples=700, chunk_size=300, seed=7)
+    size = rel.footing_size_in
+    if sized:
+        fs = size_footing(inputs, calc(inputs, log=False))
+        assert size == (fs.length_in, fs.width_in, fs.thickness_in)
+    else:
+        assert size == (18.0, 18.0, 10.0)
+    expect = _replay(inputs, DISTS, 700, 300, 7, size)
+    assert {k: c.failures for k, c in rel.checks.items()} == expect
+    assert all(c.n == 700 for c in rel.checks.values())
+    assert 0 < expect["any"] < 700 and all(v > 0 for v in expect.values())   # not a trivial all-pass / all-fail
+
+def test_same_seed_same_counts():
+    run = lambda seed, chunk=250: {k: c.failures for k, c in simulate(NOMINAL, DISTS, 1000, chunk, seed).checks.items()}
+    assert run(3) == run(3)
+    assert run(3) != run(4)
+    # The draw order does not depend on the order the distributions are given in
+    reordered = dict(reversed(list(DISTS.items())))
+    assert {k: c.failures for k, c in simulate(NOMINAL, reordered, 1000, 250, 3).checks.items()} == run(3)
+
+def test_unknown_field_is_rejected():
+    with pytest.raises(ValueError, match="Cannot sample has_knee_braces"):
+        simulate(NOMINAL, {"has_knee_braces": Uniform(0, 1)}, 10)
+
+def test_wilson_interval_edges():
+    z2 = NormalDist().inv_cdf(0.975) ** 2
+    n = 400
+    lo, hi = wilson_interval(0, n)
+    assert lo == 0.0 and hi == pytest.approx(z2 / (n + z2))
+    lo, hi = wilson_interval(n, n)
+    assert hi == pytest.approx(1.0) and lo == pytest.approx(n / (n + z2))
+    lo, hi = wilson_interval(40, n)
+    assert lo < 0.1 < hi
+    assert wilson_interval(0, 0) == (0.0, 1.0)
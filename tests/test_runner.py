@@ -0,0 +1,63 @@
+# Folder re-screening (src/runner.py): per-file rows, the summary CSV and the exit status.
+import os
+import csv
+
+import pytest
+
+np = pytest.importorskip("numpy")
+openpyxl = pytest.importorskip("openpyxl")
+
+from src.calc import calc, pf
+from src.runner import SUMMARY_COLUMNS, cli, expand_targets, run_many
+from src.io_openpyxl import results_path
+from benchmarks.fixtures import build_workbook, synthetic_catalog, synthetic_inputs
+
+@pytest.fixture
+def projects(tmp_path):
+    tops, bases = synthetic_catalog(20, seed=3)
+    x = synthetic_inputs(1, seed=4)[0]
+    good = build_workbook(str(tmp_path / "a_good.xlsx"), x, tops, bases)
+    bad = build_workbook(str(tmp_path / "b_bad.xlsx"), x, tops, bases)
+    wb = openpyxl.load_workbook(bad)
+    del wb["Inputs"]
+    wb.save(bad)
+    return x, good, bad
+
+def test_pool_rows_and_exit_status(projects, tmp_path):
+    x, good, bad = projects
+    summary = str(tmp_path / "summary.csv")
+    assert expand_targets([str(tmp_path)]) == [good, bad]
+    assert cli([str(tmp_path), "-j", "2", "--summary", summary, "-q"]) == 1
+
+    with open(summary, newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        assert reader.fieldnames == SUMMARY_COLUMNS
+        rows = list(reader)
+    assert [r["file"] for r in rows] == [good, bad]
+
+    res = calc(x)
+    ok, err = rows
+    assert ok["status"] in ("PASS", "CHECK") and ok["error"] == ""
+    assert (ok["bending"], ok["shear"], ok["bearing"], ok["deflection"]) == (
+        pf(res.bending_ok), pf(res.shear_ok), pf(res.bearing_ok), pf(res.deflection_ok))
+    assert (ok["status"] == "CHECK") == ("CHECK" in ok.values())
+    assert os.path.exists(results_path(good))
+
+    assert err["status"] == "ERROR"
+    assert "Inputs" in err["error"] and err["bending"] == ""
+    assert not os.path.exists(results_path(bad))
+    # the results sidecar is not picked up as a workbook on the next pass
+    assert expand_targets([str(tmp_path)]) == [good, bad]
+
+def test_clean_folder_exits_zero(projects, tmp_path):
+    _, good, bad = projects
+    os.remove(bad)
+    assert cli([str(tmp_path), "-j", "2", "--summary", str(tmp_path / "s.csv"), "-q", "--no-write"]) == 0
+    assert not os.path.exists(results_path(good))
+
+def test_serial_matches_pool(projects):
+    _, good, bad = projects
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "seconds"} for r in rows]
+    serial = run_many([good, bad], workers=1, write=False, progress=False)
+    pooled = run_many([good, bad], workers=2, write=False, progress=False)
+    assert strip(serial) == strip(pooled)
@@ -0,0 +1,151 @@
+# Inputs parser compiled from the dataclass (src/schema.py): parity with the hand-written
+# parser it replaced, NaN as blank, and every bad cell reported in one error.
+import math
+import random
+from dataclasses import fields
+
+import pytest
+
+from src.models import Inputs
+from src.schema import SCHEMA, InputsParseError, _yn
+from benchmarks.fixtures import synthetic_inputs
+
+def _legacy_inputs_from_dict(d):
+    # io_common.inputs_from_dict as it was before src/schema.py, kept verbatim as the reference
+    return Inputs(
+        span_ft=float(d["span_ft"]),
+        tributary_width_ft=float(d["tributary_width_ft"]),
+        beam_b_in=float(d["beam_b_in"]),
+        beam_d_in=float(d["beam_d_in"]),
+        post_unsupported_height_in=float(d["post_unsupported_height_in"]),
+        post_base_bearing_area_in2=float(d["post_base_bearing_area_in2"]),
+        Fb_prime=float(d["Fb_prime"]),
+        Fv_prime=float(d["Fv_prime"]),
+        Fc_perp_prime=float(d["Fc_perp_prime"]),
+        E=float(d["E"]),
+        DL_psf=float(d["DL_psf"]),
+        SL_psf=float(d["SL_psf"]),
+        LL_psf=float(d.get("LL_psf", 0) or 0),
+        deflection_limit_ratio=float(d.get("deflection_limit_ratio", 240) or 240),
+        Fc_axis_prime=float(d["Fc_axis_prime"]) if d.get("Fc_axis_prime") not in (None, "", 0) else None,
+        post_section_b_in=float(d["post_section_b_in"]) if d.get("post_section_b_in") not in (None, "", 0) else None,
+        post_section_d_in=float(d["post_section_d_in"]) if d.get("post_section_d_in") not in (None, "", 0) else None,
+        has_knee_braces=_yn(d.get("has_knee_braces")),
+        has_moment_top_connector=_yn(d.get("has_moment_top_connector")),
+        has_hold_downs_or_shear_base=_yn(d.get("has_hold_downs_or_shear_base")),
+        top_connector_model=(d.get("top_connector_model") or None),
+        base_connector_model=(d.get("base_connector_model") or None),
+        roof_uplift_psf=float(d.get("roof_uplift_psf", 0) or 0),
+        uplift_area_per_post_ft2=float(d.get("uplift_area_per_post_ft2", 0) or 0),
+        lateral_line_load_plf=float(d["lateral_line_load_plf"]) if d.get("lateral_line_load_plf") not in (None, "") else None,
+        wind_wall_psf=float(d["wind_wall_psf"]) if d.get("wind_wall_psf") not in (None, "") else None,
+        exposed_height_ft=float(d["exposed_height_ft"]) if d.get("exposed_height_ft") not in (None, "") else None,
+        post_to_beam_arm_in=float(d.get("post_to_beam_arm_in", 0) or 0),
+        soil_bearing_capacity_psf=float(d["soil_bearing_capacity_psf"]) if d.get("soil_bearing_capacity_psf") not in (None, "") else None,
+        soil_unit_weight_pcf=float(d["soil_unit_weight_pcf"]) if d.get("soil_unit_weight_pcf") not in (None, "") else None,
+        concrete_unit_weight_pcf=float(d["concrete_unit_weight_pcf"]) if d.get("concrete_unit_weight_pcf") not in (None, "") else None,
+        base_friction_coeff_mu=float(d["base_friction_coeff_mu"]) if d.get("base_friction_coeff_mu") not in (None, "") else None,
+        SF_bearing=float(d["SF_bearing"]) if d.get("SF_bearing") not in (None, "") else None,
+        SF_sliding=float(d["SF_sliding"]) if d.get("SF_sliding") not in (None, "") else None,
+        SF_uplift=float(d["SF_uplift"]) if d.get("SF_uplift") not in (None, "") else None,
+        credit_connector_uplift_lb=float(d["credit_connector_uplift_lb"]) if d.get("credit_connector_uplift_lb") not in (None, "") else None,
+        include_soil_overburden=_yn(d.get("include_soil_overburden")),
+        footing_length_in=float(d["footing_length_in"]) if d.get("footing_length_in") not in (None, "") else None,
+        footing_width_in=float(d["footing_width_in"]) if d.get("footing_width_in") not in (None, "") else None,
+        footing_thickness_in=float(d["footing_thickness_in"]) if d.get("footing_thickness_in") not in (None, "") else None,
+        footing_depth_below_grade_in=float(d["footing_depth_below_grade_in"]) if d.get("footing_depth_below_grade_in") not in (None, "") else None,
+        post_self_weight_lb=float(d.get("post_self_weight_lb", 0) or 0),
+    )
+
+REQUIRED = [f.name for f in fields(Inputs)][:12]
+FLAGS = ["has_knee_braces", "has_moment_top_connector", "has_hold_downs_or_shear_base", "include_soil_overburden"]
+
+def _sheet_dicts(n, seed=0):
+    # Sheet-like cells: numbers, numeric text, blanks, 0 for the column inputs, missing optional
+    # keys, yes/no spelled several ways and connector model names
+    rnd = random.Random(seed)
+    out = []
+    for x in synthetic_inputs(n, seed):
+        d = {}
+        for f in fields(Inputs):
+            v = getattr(x, f.name)
+            if f.name in FLAGS:
+                d[f.name] = rnd.choice(["Yes", "no", " Y ", "TRUE", "0", 1, 0.0, None, "maybe", v])
+            elif f.name in ("top_connector_model", "base_connector_model"):
+                d[f.name] = rnd.choice([None, "", "LUS26", "ABU44"])
+            elif f.name in REQUIRED:
+                d[f.name] = str(v) if rnd.random() < 0.3 else v
+            else:
+                choice = rnd.random()
+                if choice < 0.2:
+                    d[f.name] = ""
+                elif choice < 0.3:
+                    d[f.name] = 0
+                elif choice < 0.4:
+                    continue                    # key missing altogether
+                elif choice < 0.5 and v is not None:
+                    d[f.name] = str(v)
+                else:
+                    d[f.name] = v
+        out.append(d)
+    return out
+
+def test_compiled_parser_matches_hand_written_parser():
+    for d in _sheet_dicts(300):
+        assert SCHEMA.parse(d) == _legacy_inputs_from_dict(d)
+
+def test_rows_and_frame_match_single_parse():
+    pd = pytest.importorskip("pandas")
+    rows = _sheet_dicts(100, seed=1)
+    expect = [SCHEMA.parse(d) for d in rows]
+    assert SCHEMA.parse_rows(rows) == expect
+    assert SCHEMA.parse_frame(pd.DataFrame(rows)) == expect
+    numeric = [{k: float(v) for k, v in d.items() if k not in FLAGS and not k.endswith("_model") and v not in ("", None)}
+               for d in rows]
+    frame = pd.DataFrame(numeric)                   # float columns (missing -> NaN): vectorized path
+    assert SCHEMA.parse_frame(frame) == [SCHEMA.parse(d) for d in numeric]
+
+def test_nan_counts_as_blank():
+    # The one documented change: the old parser kept float("nan") for an optional cell, or
+    # propagated it into a field with a default; NaN now reads exactly like an empty cell.
+    base = {f.name: getattr(synthetic_inputs(1)[0], f.name) for f in fields(Inputs)}
+    nan = float("nan")
+    for name in ("footing_length_in", "lateral_line_load_plf", "Fc_axis_prime", "SF_uplift"):
+        assert math.isnan(getattr(_legacy_inputs_from_dict({**base, name: nan}), name))
+        assert getattr(SCHEMA.parse({**base, name: nan}), name) is None
+        assert SCHEMA.parse({**base, name: nan}) == SCHEMA.parse({**base, name: ""})
+    for name, default in (("LL_psf", 0.0), ("deflection_limit_ratio", 240.0), ("post_self_weight_lb", 0.0)):
+        assert math.isnan(getattr(_legacy_inputs_from_dict({**base, name: nan}), name))
+        assert getattr(SCHEMA.parse({**base, name: nan}), name) == default
+    assert SCHEMA.parse({**base, "has_knee_braces": nan}).has_knee_braces is False
+    assert SCHEMA.parse({**base, "top_connector_model": nan}).top_connector_model is None
+    with pytest.raises(InputsParseError, match="span_ft: missing"):
+        SCHEMA.parse({**base, "span_ft": nan})
+
+def test_every_bad_cell_is_reported_at_once():
+    base = {f.name: getattr(synthetic_inputs(1)[0], f.name) for f in fields(Inputs)}
+    bad = {**base, "span_ft": None, "E": "stiff", "LL_psf": "lots", "footing_width_in": "wide"}
+    del bad["DL_psf"]
+    with pytest.raises(InputsParseError) as e:
+        SCHEMA.parse(bad)
+    got = [(c.row, c.field, c.value, c.message) for c in e.value.errors]
+    assert got == [(None, "span_ft", None, "missing"), (None, "E", "stiff", "not a number"),
+                   (None, "DL_psf", None, "missing"), (None, "LL_psf", "lots", "not a number"),
+                   (None, "footing_width_in", "wide", "not a number")]
+    assert str(e.value).startswith("5 bad input cells: span_ft: missing; E: not a number ('stiff')")
+    assert isinstance(e.value, ValueError)      # callers catching ValueError still see it
+
+def test_bad_cells_across_rows_are_reported_in_row_then_field_order():
+    base = {f.name: getattr(synthetic_inputs(1)[0], f.name) for f in fields(Inputs)}
+    rows = [base, {**base, "SL_psf": "x", "beam_b_in": ""}, base, {**base, "Fv_prime": "?"}]
+    with pytest.raises(InputsParseError) as e:
+        SCHEMA.parse_rows(rows)
+    assert [(c.row, c.field) for c in e.value.errors] == [(1, "beam_b_in"), (1, "SL_psf"), (3, "Fv_prime")]
+
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame([base] * 4, index=["a", "b", "c", "d"])
+    frame["span_ft"] = [1.0, None, 3.0, None]               # numeric column: vectorized path
+    frame["E"] = ["1.2e6", "soft", 1.4e6, 1.5e6]            # object column: per-cell path
+    with pytest.raises(InputsParseError) as e:
+        SCHEMA.parse_frame(frame)
+    assert [(c.row, c.field) for c in e.value.errors] == [("b", "span_ft"), ("b", "E"), ("d", "span_ft")]
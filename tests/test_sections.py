@@ -0,0 +1,76 @@
+# Lightest-section search (src/sections.py) against a brute-force calc over the whole catalog.
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.calc import calc
+from src.sections import (DEFAULT_GRADES, DEFAULT_PLIES, DEFAULT_SIZES, Grade, build_catalog,
+                          find_lightest_section, find_lightest_sections, with_section)
+from benchmarks.fixtures import synthetic_inputs
+
+N_CASES = 2000
+
+def _passes(res):
+    return bool(res.bending_ok and res.shear_ok and res.bearing_ok and res.deflection_ok)
+
+def _random_catalog(rnd):
+    sizes = rnd.sample(DEFAULT_SIZES, rnd.randint(1, len(DEFAULT_SIZES)))
+    grades = [Grade(f"G{i}", g.Fb_prime * rnd.uniform(0.7, 1.3), g.Fv_prime * rnd.uniform(0.7, 1.3),
+                    g.Fc_perp_prime * rnd.uniform(0.7, 1.3), g.E * rnd.uniform(0.7, 1.3))
+              for i, g in enumerate(rnd.sample(DEFAULT_GRADES, rnd.randint(1, len(DEFAULT_GRADES))))]
+    plies = sorted(rnd.sample(DEFAULT_PLIES, rnd.randint(1, len(DEFAULT_PLIES))))
+    return build_catalog(sizes, grades, plies)
+
+def _brute_force(x, catalog, keep):
+    # every passing candidate, and the shallowest passing depth of each (width, grade) group
+    # ranked the way the search ranks them
+    passing = [c for c in catalog if _passes(calc(with_section(x, c)))]
+    best = {}
+    for c in passing:
+        key = (c.b_in, c.grade)
+        if key not in best or c.d_in < best[key].d_in:
+            best[key] = c
+    return passing, sorted(best.values(), key=lambda c: (c.area_in2, c.d_in, c.label))[:keep]
+
+def test_matches_brute_force():
+    rnd = random.Random(2)
+    xs = synthetic_inputs(N_CASES, seed=7)
+    n_none = 0
+    for i, x in enumerate(xs):
+        catalog = build_catalog() if i % 2 else _random_catalog(rnd)
+        n_runners_up = rnd.randint(0, 4)
+        out = find_lightest_section(x, catalog, n_runners_up)
+        passing, expected = _brute_force(x, catalog, n_runners_up + 1)
+        if not expected:
+            n_none += 1
+            assert out.best is None and out.results is None and out.runners_up == []
+            continue
+        ranked = [out.best] + [c for c, _ in out.runners_up]
+        assert ranked == expected, i
+        assert out.best.area_in2 == min(c.area_in2 for c in passing)
+        assert out.results == calc(with_section(x, out.best))
+        assert all(res == calc(with_section(x, c)) for c, res in out.runners_up)
+        # one bearing check per visited group plus the depth probes
+        assert out.n_checked <= len(catalog) + len({(c.b_in, c.grade) for c in catalog})
+    assert 0 < n_none < N_CASES           # both outcomes are exercised
+
+def test_one_runner_up_per_width_and_grade():
+    catalog = build_catalog()
+    for x in synthetic_inputs(300, seed=11):
+        out = find_lightest_section(x, catalog, n_runners_up=10)
+        if out.best is None:
+            continue
+        ranked = [out.best] + [c for c, _ in out.runners_up]
+        groups = [(c.b_in, c.grade) for c in ranked]
+        assert len(set(groups)) == len(groups)
+        # a group's entry is its shallowest passing depth: the next shallower size fails
+        for c in ranked:
+            shallower = [s for s in catalog if (s.b_in, s.grade) == (c.b_in, c.grade) and s.d_in < c.d_in]
+            assert not any(_passes(calc(with_section(x, s))) for s in shallower)
+
+def test_batch_wrapper_matches_single():
+    xs = synthetic_inputs(20, seed=5)
+    batch = find_lightest_sections(xs)
+    assert [r.best for r in batch] == [find_lightest_section(x).best for x in xs]
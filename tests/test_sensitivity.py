@@ -0,0 +1,120 @@
+# Closed-form sensitivities (src/sensitivity.py) against central finite differences of the
+# scalar calc / footing_checks, and the TOP DRIVERS block on the Results sheet.
+import math
+from dataclasses import fields, replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Inputs
+from src.calc import calc
+from src.footing import footing_checks, size_footing
+from src.report import results_grid
+from src.sensitivity import CHECKS, sensitivity, top_drivers
+from benchmarks.fixtures import synthetic_inputs
+
+NUMERIC = [f.name for f in fields(Inputs) if "float" in str(f.type)]
+
+def _util(x, check):
+    r = calc(x, log=False)
+    if check == "bending": return r.bending_stress_psi / x.Fb_prime
+    if check == "shear": return r.shear_stress_psi / x.Fv_prime
+    if check == "bearing": return r.bearing_stress_psi / x.Fc_perp_prime
+    if check == "deflection": return r.deflection_in / r.deflection_limit_in
+    if check == "column": return r.reaction_per_post_lb / r.column_allowable_axial_lb
+    f = footing_checks(x, r, log=False)
+    if check == "footing_bearing": return f.q_actual_psf / f.q_allow_eff_psf
+    if check == "footing_sliding": return f.H_post_lb / f.R_slide_lb
+    return f.U_post_lb / f.R_uplift_lb
+
+def _central(x, check, name):
+    v = getattr(x, name)
+    h = 1e-6 * max(abs(v), 1.0)
+    return (_util(replace(x, **{name: v + h}), check) - _util(replace(x, **{name: v - h}), check)) / (2 * h)
+
+def _column_designs():
+    base = replace(synthetic_inputs(1, seed=3)[0], Fc_axis_prime=900.0, post_section_b_in=5.5, post_section_d_in=5.5)
+    crushing = replace(base, post_unsupported_height_in=36.0)              # stocky post: Fc'·A governs
+    buckling = replace(base, post_unsupported_height_in=144.0, post_section_b_in=3.5, post_section_d_in=3.5)
+    return crushing, buckling
+
+def _sized_design():
+    x = replace(synthetic_inputs(1, seed=8)[0], footing_length_in=None, footing_width_in=None, footing_thickness_in=None,
+                roof_uplift_psf=15.0, uplift_area_per_post_ft2=60.0, lateral_line_load_plf=None)
+    fs = size_footing(x, calc(x, log=False))
+    return x, fs, replace(x, footing_length_in=fs.length_in, footing_width_in=fs.width_in,
+                          footing_thickness_in=fs.thickness_in)
+
+def _designs():
+    crushing, buckling = _column_designs()
+    return [d for d in synthetic_inputs(40, seed=4) if d.footing_length_in] + [crushing, buckling, _sized_design()[2]]
+
+def test_derivatives_match_finite_differences():
+    designs = _designs()
+    s = sensitivity(designs)
+    checked = 0
+    for i, x in enumerate(designs):
+        for check in CHECKS:
+            u = s.utilization[check][i]
+            if not np.isfinite(u) or u == 0:
+                continue
+            assert _util(x, check) == pytest.approx(u, rel=1e-12)
+            for name, d in s.derivative[check].items():
+                if np.isnan(d[i]):
+                    # No entry: a blank (defaulted) field, or one unused here (wind when a line load is given)
+                    assert getattr(x, name) is None or _central(x, check, name) == 0.0, (check, name, i)
+                    continue
+                assert _central(x, check, name) == pytest.approx(d[i], rel=1e-5, abs=1e-9 * u), (check, name, i)
+                assert s.elasticity[check][name][i] == pytest.approx(d[i] * getattr(x, name) / u, rel=1e-12, abs=1e-15)
+                checked += 1
+    assert checked > 1000
+
+def test_no_field_that_moves_a_utilization_is_missing():
+    designs = _designs()
+    s = sensitivity(designs)
+    for i, x in enumerate(designs):
+        for check in CHECKS:
+            u = s.utilization[check][i]
+            if not np.isfinite(u) or u == 0:
+                continue
+            for name in NUMERIC:
+                if getattr(x, name) is None or name in s.derivative[check]:
+                    continue
+                assert _central(x, check, name) == 0.0, (check, name, i)
+
+def test_column_branches_are_both_covered():
+    crushing, buckling = _column_designs()
+    s = sensitivity([crushing, buckling])
+    assert calc(crushing, log=False).column_allowable_axial_lb == pytest.approx(900.0 * 5.5 * 5.5)
+    assert calc(buckling, log=False).column_allowable_axial_lb < 900.0 * 3.5 * 3.5
+    e = s.elasticity["column"]
+    assert (e["Fc_axis_prime"][0], e["E"][0], e["post_unsupported_height_in"][0]) == (-1.0, 0.0, 0.0)
+    assert e["Fc_axis_prime"][1] == 0.0 and e["E"][1] == pytest.approx(-1.0)
+    assert e["post_unsupported_height_in"][1] == pytest.approx(2.0, rel=1e-6)
+
+def test_sized_footing_drivers_use_the_sized_footing():
+    x, fs, sized = _sized_design()
+    assert top_drivers(x, fs) == top_drivers(sized)
+    assert not any(check.startswith("footing_") for check, *_ in top_drivers(x))   # not evaluated without a size
+    assert math.isnan(sensitivity([x]).utilization["footing_bearing"][0])
+
+def test_results_grid_drivers_block():
+    x = synthetic_inputs(1, seed=4)[0]
+    res = calc(x)
+    drivers = top_drivers(x, per_check=2)
+    rows = results_grid(res, drivers=drivers).rows
+    top = next(i for i, r in enumerate(rows) if r and str(r[0]).startswith("TOP DRIVERS"))
+    # Between the summary (and its two-row gap) and the calc log
+    summary_end = rows.index(["Item", "Value", "Status"]) + 1
+    while rows[summary_end]:
+        summary_end += 1
+    assert top == summary_end + 2 and rows[summary_end:top] == [[], []]
+    assert rows[top + 3 + len(drivers):top + 6 + len(drivers)] == [[], [], ["CALCULATION LOG"]]
+    assert rows[top + 1] == [] and rows[top + 2] == ["Check", "Utilization", "Input", "Elasticity", "∂u/∂input"]
+    body = rows[top + 3:top + 3 + len(drivers)]
+    for row, (check, util, name, e, dudx), prev in zip(body, drivers, [None] + drivers[:-1]):
+        first = prev is None or prev[0] != check
+        assert row == [check if first else "", f"{util:.3f}" if first else "", name, f"{e:+.2f}", f"{dudx:.4g}"]
+    assert (top + 1, 1, 1, 1) in results_grid(res, drivers=drivers).bold
+    assert not any(r and str(r[0]).startswith("TOP DRIVERS") for r in results_grid(res).rows)
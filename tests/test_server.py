@@ -0,0 +1,89 @@
+# Warm calc server (src/server.py) and its client (src/client.py): when a run may fall back to the
+# in-process path, and what happens to requests once the server is stopping.
+import time
+import socket
+import threading
+
+import pytest
+
+from src import client
+from src.server import CalcServer
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+@pytest.fixture
+def in_process_runs(monkeypatch):
+    calls = []
+    monkeypatch.setattr("src.main.main", lambda xlsx, backend="xlwings", **kw: calls.append(xlsx))
+    return calls
+
+def test_no_server_falls_back_to_in_process_run(in_process_runs):
+    port = _free_port()
+    with pytest.raises(ConnectionRefusedError):
+        client.run_workbook("deck.xlsm", port=port, spawn=False)
+    assert client.cli(["deck.xlsm", "--port", str(port), "--no-spawn"]) == 0
+    assert in_process_runs == ["deck.xlsm"]
+
+def test_dropped_connection_is_reported_not_rerun(in_process_runs, capsys):
+    # A server that takes the request and then drops the connection (as on a reset mid-run)
+    lsock = socket.socket()
+    lsock.bind(("127.0.0.1", 0))
+    lsock.listen()
+    def accept_and_drop():
+        conn, _ = lsock.accept()
+        conn.recv(65536)
+        conn.close()
+    t = threading.Thread(target=accept_and_drop, daemon=True)
+    t.start()
+    try:
+        assert client.cli(["deck.xlsm", "--port", str(lsock.getsockname()[1])]) == 1
+    finally:
+        t.join(5)
+        lsock.close()
+    assert in_process_runs == []
+    assert "Calc server error" in capsys.readouterr().err
+
+def test_submit_after_idle_shutdown_is_refused():
+    srv = CalcServer(port=0, idle_timeout_s=0.05)
+    th = threading.Thread(target=srv.serve_forever, daemon=True)
+    th.start()
+    while srv._worker.ident is None:        # serve_forever starts the worker
+        time.sleep(0.01)
+    srv._worker.join(10)                    # ... which stops itself once idle
+    assert not srv._worker.is_alive()
+    reply = srv.submit("deck.xlsm", "openpyxl").result(timeout=1)
+    assert reply["closing"] and not reply["ok"]
+    th.join(10)
+    assert not th.is_alive()
+
+def test_connector_catalog_is_indexed_once_per_spec_table(tmp_path, monkeypatch):
+    pytest.importorskip("openpyxl")
+    from dataclasses import replace
+    from src import graph
+    from benchmarks.fixtures import build_workbook, synthetic_catalog, synthetic_inputs
+    built = []
+    class Counted(graph.ConnectorCatalog):
+        def __init__(self, tops, bases):
+            built.append(len(tops))
+            super().__init__(tops, bases)
+    monkeypatch.setattr(graph, "ConnectorCatalog", Counted)
+
+    x = replace(synthetic_inputs(1, seed=5)[0], top_connector_model=None, base_connector_model=None)
+    wb = str(tmp_path / "deck.xlsx")
+    specs = synthetic_catalog(50, seed=1)
+    srv = CalcServer(port=0, idle_timeout_s=0)
+    th = threading.Thread(target=srv.serve_forever, daemon=True)
+    th.start()
+    try:
+        for i, (uplift, cat) in enumerate([(5.0, specs), (25.0, specs), (35.0, specs), (35.0, synthetic_catalog(60, seed=2))]):
+            build_workbook(wb, replace(x, roof_uplift_psf=uplift), *cat)
+            reply = srv.submit(wb, "openpyxl").result(timeout=30)
+            assert reply["ok"] and "connectors" in reply["recomputed"], (i, reply)
+    finally:
+        srv.shutdown()
+        th.join(10)
+    assert built == [50, 60]                # connectors re-ran four times, the specs were indexed twice
+    assert len(srv.catalogs) == 2
@@ -0,0 +1,49 @@
+# Memory of a large batch held as struct-of-arrays (src/soa.py) vs lists of Inputs / Results
+# dataclasses with the same content (ResultsBatch keeps no calc logs, so neither do the Results
+# here). Measured with tracemalloc, which sees both Python objects and NumPy buffers: about
+# 830 + 660 vs 325 bytes per design, 4.6x. Logged Results (~3.2 KB each) would flatter the ratio.
+import gc
+import tracemalloc
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.calc import calc
+from src.soa import InputsBatch, ResultsBatch
+from benchmarks.fixtures import synthetic_inputs
+
+N = 20_000
+
+def _retained(build):
+    # Bytes still allocated after build() returns (its result kept alive)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        obj = build()
+        gc.collect()
+        return obj, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+def test_batch_is_at_least_4x_smaller():
+    inputs, in_bytes = _retained(lambda: synthetic_inputs(N, seed=1))
+    results, res_bytes = _retained(lambda: [calc(x, log=False) for x in inputs])
+    (ib, rb), soa_bytes = _retained(lambda: (lambda b: (b, b.calc()))(InputsBatch.from_inputs(inputs)))
+    assert len(ib) == len(rb) == N
+    ratio = (in_bytes + res_bytes) / soa_bytes
+    assert ratio >= 4, f"struct-of-arrays batch only {ratio:.1f}x smaller ({soa_bytes / N:.0f} vs " \
+                        f"{(in_bytes + res_bytes) / N:.0f} bytes per design)"
+
+def test_round_trip_and_views():
+    inputs = synthetic_inputs(500, seed=2)
+    ib = InputsBatch.from_inputs(inputs)
+    assert ib.to_inputs() == inputs
+    assert calc(ib[7], log=False) == calc(inputs[7], log=False)
+    part = ib[100:200]
+    assert np.shares_memory(part.values["span_ft"], ib.values["span_ft"])
+    assert part.inputs(0) == inputs[100]
+    results = [calc(x, log=False) for x in inputs]
+    assert ResultsBatch.from_results(results).to_results() == results
+    assert ib.calc().to_results() == results
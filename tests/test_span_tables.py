@@ -0,0 +1,89 @@
+# Allowable-span tables (src/span_tables.py): lookups are never unconservative, and the disk
+# cache round-trips and is invalidated by the code that builds it.
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import span_tables
+from src.batch import calc_batch
+from src.sections import build_catalog
+from src.span_tables import SpanGrid, build_span_table, load_span_table, table_path
+
+SMALL = SpanGrid(sections=tuple(build_catalog()[:4]), tributary_ft=(2.0, 4.0, 8.0), load_psf=(10.0, 40.0))
+
+def _passes(table, secs, span, trib, load):
+    n = span.size
+    one = np.ones(n)
+    prop = lambda f: np.array([f(c) for c in secs])
+    r = calc_batch(span_ft=span, tributary_width_ft=trib, beam_b_in=prop(lambda c: c.b_in),
+                   beam_d_in=prop(lambda c: c.d_in), post_unsupported_height_in=one, post_base_bearing_area_in2=one,
+                   Fb_prime=prop(lambda c: c.grade.Fb_prime), Fv_prime=prop(lambda c: c.grade.Fv_prime),
+                   Fc_perp_prime=one, E=prop(lambda c: c.grade.E), DL_psf=np.full(n, table.dead_psf),
+                   SL_psf=load, LL_psf=np.zeros(n), deflection_limit_ratio=np.full(n, table.deflection_limit_ratio),
+                   Fc_axis_prime=None, post_section_b_in=None, post_section_d_in=None, has_knee_braces=False,
+                   has_moment_top_connector=False, has_hold_downs_or_shear_base=False)
+    return r.bending_ok & r.shear_ok & r.deflection_ok
+
+def test_random_lookups_pass_calc_batch():
+    grid = SpanGrid()
+    table = build_span_table(grid)
+    rng = np.random.default_rng(0)
+    n = 40_000
+    idx = rng.integers(0, len(grid.sections), n)
+    trib = rng.uniform(1.0, grid.tributary_ft[-1], n)       # includes queries below the grid
+    load = rng.uniform(0.0, grid.load_psf[-1], n)
+    span = np.array([table.max_span(grid.sections[i].label, t, q) for i, t, q in zip(idx[:2000], trib, load)])
+    span = np.concatenate([span, np.empty(n - 2000)])
+    for i in np.unique(idx[2000:]):                       # array queries, one section at a time
+        m = np.flatnonzero(idx == i)
+        m = m[m >= 2000]
+        span[m] = table.max_span(grid.sections[i], trib[m], load[m])
+    assert _passes(table, [grid.sections[i] for i in idx], span, trib, load).all()
+
+    # On the grid itself the stored span passes, and 0.5 % longer fails (the table is not slack)
+    secs = [c for c in grid.sections for _ in grid.tributary_ft for _ in grid.load_psf]
+    t, q = (a.ravel() for a in np.meshgrid(grid.tributary_ft, grid.load_psf, indexing="ij"))
+    t, q = np.tile(t, len(grid.sections)), np.tile(q, len(grid.sections))
+    s = table.spans_ft.astype(float).ravel()
+    assert _passes(table, secs, s, t, q).all()
+    assert not _passes(table, secs, s * 1.005, t, q).any()
+
+def test_outside_the_grid_raises():
+    table = build_span_table(SMALL)
+    with pytest.raises(ValueError, match="Outside the span table"):
+        table.max_span(SMALL.sections[0], 9.0, 20.0)
+    with pytest.raises(KeyError):
+        table.max_span("1-ply 2x99 Unobtainium", 4.0, 20.0)
+
+def test_disk_round_trip_and_invalidation(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    monkeypatch.setattr(span_tables, "_TABLES", {})
+    built = load_span_table(SMALL, cache_dir=cache_dir)
+    path = table_path(SMALL, cache_dir)
+    assert os.path.exists(path)
+
+    # A fresh process reads the file instead of rebuilding
+    monkeypatch.setattr(span_tables, "_TABLES", {})
+    monkeypatch.setattr(span_tables, "build_span_table", lambda grid: pytest.fail("rebuilt a cached table"))
+    read = load_span_table(SMALL, cache_dir=cache_dir)
+    assert read.labels == built.labels and read.key == built.key
+    assert np.array_equal(read.spans_ft, built.spans_ft) and np.array_equal(read.governs, built.governs)
+    monkeypatch.undo()
+
+    # Edited table-building code (batch / sections / span_tables) gives a new version: rebuilt, old file gone
+    monkeypatch.setattr(span_tables, "_TABLES", {})
+    monkeypatch.setattr(span_tables, "TABLE_VERSION", "0" * 16)
+    calls = []
+    monkeypatch.setattr(span_tables, "build_span_table", lambda grid: calls.append(grid) or build_span_table(grid))
+    load_span_table(SMALL, cache_dir=cache_dir)
+    assert calls == [SMALL]
+    assert table_path(SMALL, cache_dir) != path
+    assert os.listdir(cache_dir) == [os.path.basename(table_path(SMALL, cache_dir))]
+
+def test_table_version_covers_the_table_building_modules():
+    from src.cache import CODE_VERSION, source_version
+    assert span_tables.TABLE_VERSION == source_version(("batch.py", "sections.py", "span_tables.py"), salt=CODE_VERSION)
+    assert span_tables.TABLE_VERSION != source_version(("batch.py", "sections.py"), salt=CODE_VERSION)
+    assert span_tables.TABLE_VERSION in table_path(SMALL, "x")
@@ -0,0 +1,58 @@
+# Columnar results store (src/store.py): crash safety and what it may delete.
+import os
+import sys
+import subprocess
+import importlib.util
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.store import ResultsStore, open_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORMATS = ["raw", pytest.param("parquet", marks=pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is None, reason="pyarrow not installed"))]
+
+def _chunk(i, n=50):
+    return {"x": np.arange(i * n, (i + 1) * n, dtype=float), "ok": np.arange(n) % 2 == 0,
+            "model": np.array([f"M{i}-{j}" for j in range(n)])}
+
+_CRASH = """
+import os, sys
+sys.path.insert(0, {root!r})
+from tests.test_store import _chunk
+from src.store import ResultsStore
+st = ResultsStore({path!r}, format={fmt!r})
+for i in range(3):
+    st.append(_chunk(i))
+os._exit(0)             # dies without close()
+"""
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_store_killed_before_close_reads_back_completed_chunks(tmp_path, fmt):
+    path = str(tmp_path / "st")
+    subprocess.run([sys.executable, "-c", _CRASH.format(root=ROOT, path=path, fmt=fmt)], check=True,
+                   env=dict(os.environ, DECK_TIMING="0"))
+    cols = open_results(path)
+    assert len(cols["x"]) == 150
+    np.testing.assert_array_equal(np.asarray(cols["x"]), np.arange(150, dtype=float))
+    assert list(cols["model"])[-1] == "M2-49"
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_store_never_deletes_files_it_did_not_write(tmp_path, fmt):
+    path = tmp_path / "st"
+    path.mkdir()
+    (path / "notes.bin").write_bytes(b"keep me")
+    (path / "x.bin").write_bytes(b"\0" * 64)          # raw: same name as a column, replaced not extended
+    with pytest.raises(FileExistsError):
+        ResultsStore(str(path), format=fmt)
+    with ResultsStore(str(path), format=fmt, overwrite=True) as st:
+        st.append(_chunk(0))
+    assert len(open_results(str(path))["x"]) == 50
+    with ResultsStore(str(path), format=fmt, overwrite=True) as st:      # replacing a store: only its files go
+        st.append(_chunk(1, n=10))
+    assert (path / "notes.bin").read_bytes() == b"keep me"
+    np.testing.assert_array_equal(np.asarray(open_results(str(path))["x"]), np.arange(10, 20, dtype=float))
+    with pytest.raises(FileExistsError):
+        ResultsStore(str(path), format=fmt)
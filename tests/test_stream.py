@@ -0,0 +1,85 @@
+# Streaming batch mode (src/stream.py): order, ERROR rows and the --store output.
+import os
+import csv
+import json
+from dataclasses import fields
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.models import Inputs
+from src.calc import calc
+from src.io_common import LABELS
+from src.stream import cli
+from benchmarks.fixtures import synthetic_inputs
+
+N = 11
+
+def _row(i, x):
+    values = {f.name: getattr(x, f.name) for f in fields(Inputs)}
+    d = {"id": f"d{i}"}
+    for label in LABELS:
+        v = values[label]
+        d[label] = ("Yes" if v else "No") if isinstance(v, bool) else v
+    return d
+
+@pytest.fixture()
+def jobs(tmp_path):
+    # N good rows with a bad value at 3 and a malformed line at 8 (13 input rows)
+    xs = synthetic_inputs(N, seed=5)
+    lines = [json.dumps(_row(i, x)) for i, x in enumerate(xs)]
+    lines.insert(3, json.dumps({**_row(99, xs[0]), "id": "bad-value", "span_ft": "abc"}))
+    lines.insert(8, '{"id": "bad-json", "span_ft": ')
+    path = tmp_path / "jobs.jsonl"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path), xs
+
+def test_jsonl_to_csv_keeps_order_and_marks_errors(jobs, tmp_path):
+    path, xs = jobs
+    out = str(tmp_path / "out.csv")
+    assert cli([path, "--out", out, "--chunk", "3"]) == 1        # any ERROR row → exit 1
+    with open(out, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+
+    ids = [f"d{i}" for i in range(N)]
+    ids.insert(3, "bad-value")
+    ids.insert(8, "bad-json")
+    assert [r["id"] for r in rows] == ids[:8] + [""] + ids[9:]   # the malformed line has no readable id
+    assert [int(r["row"]) for r in rows] == list(range(N + 2))
+    assert rows[3]["status"] == rows[8]["status"] == "ERROR"
+    assert "span_ft" in rows[3]["error"] and "line 9" in rows[8]["error"]
+
+    good = [r for r in rows if r["status"] != "ERROR"]
+    assert len(good) == N
+    for r, x in zip(good, xs):
+        ref = calc(x, log=False)
+        assert float(r["bending_stress_psi"]) == pytest.approx(ref.bending_stress_psi)
+        assert float(r["reaction_per_post_lb"]) == pytest.approx(ref.reaction_per_post_lb)
+        assert r["deflection"] == ("PASS" if ref.deflection_ok else "CHECK")
+
+def test_store_has_one_row_per_input_row(jobs, tmp_path):
+    from src.store import open_results
+    path, _ = jobs
+    store = str(tmp_path / "store")
+    assert cli([path, "--store", store, "--chunk", "4"]) == 1
+    cols = open_results(store)
+    assert len(cols["row"]) == N + 2
+    assert list(np.asarray(cols["row"]).astype(int)) == list(range(N + 2))
+    assert list(cols["status"])[3] == "ERROR"
+
+@pytest.mark.filterwarnings("ignore:divide by zero")
+def test_jsonl_output_is_strict_json(tmp_path):
+    # E = 0 gives an infinite deflection, which plain json.dumps writes as a bare Infinity
+    xs = synthetic_inputs(3, seed=6)
+    rows = [_row(0, xs[0]), {**_row(1, xs[1]), "E": 0}, _row(2, xs[2])]
+    src, out = tmp_path / "jobs.jsonl", tmp_path / "out.jsonl"
+    src.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
+    cli([str(src), "--out", str(out)])
+
+    def reject(name):
+        raise ValueError(f"non-standard JSON constant {name}")
+    got = [json.loads(line, parse_constant=reject) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert [r["id"] for r in got] == ["d0", "d1", "d2"]
+    assert got[1]["deflection_in"] is None and got[1]["deflection"] == "CHECK"
+    assert got[0]["deflection_in"] == pytest.approx(calc(xs[0], log=False).deflection_in)
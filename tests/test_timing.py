@@ -0,0 +1,65 @@
+# Stage timing (src/timing.py): nothing is written when off, counters roll up when on, and the
+# benchmark suite never appends to run_log.txt.
+import json
+
+import pytest
+
+from src import timing
+
+@pytest.fixture()
+def log(tmp_path, monkeypatch):
+    path = tmp_path / "run_log.txt"
+    monkeypatch.setattr(timing, "LOG_PATH", str(path))
+    was = timing.enabled()
+    yield path
+    timing.set_enabled(was)
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+def test_disabled_writes_nothing(log):
+    timing.set_enabled(False)
+    calls = []
+    f = timing.timed("f")(lambda x: calls.append(x) or x * 2)
+    with timing.span("run", file="a.xlsm") as sp:
+        sp.add("rows", 3)
+        timing.add("com_calls")
+        assert f(4) == 8
+    assert calls == [4] and not log.exists()
+
+def test_spans_record_counters_and_roll_them_up(log):
+    timing.set_enabled(True)
+
+    @timing.timed("read")
+    def read():
+        timing.add("com_calls", 2)
+        timing.add("rows", 40)
+
+    with timing.span("run", file="a.xlsm"):
+        read()
+        with timing.span("write"):
+            timing.add("com_calls")
+            timing.add("rows", 5)
+        assert not log.exists()             # one write per run, when the outermost span closes
+    with pytest.raises(ZeroDivisionError):
+        with timing.span("run"):
+            1 / 0
+
+    first, second = _records(log)[:3], _records(log)[3:]
+    read_rec, write_rec, run_rec = first
+    assert (read_rec["span"], read_rec["parent"], read_rec["com_calls"], read_rec["rows"]) == ("read", "run", 2, 40)
+    assert (write_rec["com_calls"], write_rec["rows"]) == (1, 5)
+    assert (run_rec["span"], run_rec["parent"], run_rec["file"]) == ("run", None, "a.xlsm")
+    assert (run_rec["com_calls"], run_rec["rows"]) == (3, 45)
+    assert len({r["run"] for r in first}) == 1
+    assert second[0]["error"] == "ZeroDivisionError" and second[0]["run"] != run_rec["run"]
+
+def test_benchmark_suite_does_not_log(log):
+    pytest.importorskip("numpy")
+    pytest.importorskip("openpyxl")
+    from benchmarks.suite import run_suite
+    timing.set_enabled(True)
+    report = run_suite("io_openpyxl.read[warm]", repeat=1, min_time=0.001, progress=False)
+    assert "median_s" in report["results"]["io_openpyxl.read[warm]"]
+    assert not log.exists()
+    assert timing.enabled()                 # switched back on afterwards